@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import sys
+import timeit
+
+import networkx as nx
+from manim_dataflow_analysis import ProgramPoint
+
+from small.ast import (
+    Assignment,
+    BoolConstant,
+    BoolExpression,
+    Function,
+    IfElse,
+    IntBinaryExpression,
+    IntBinaryOperator,
+    IntComparisonExpression,
+    IntComparisonOperator,
+    IntConstant,
+    Statement,
+    Variable,
+    While,
+)
+
+
+def compose_sequence_cfg(
+    statements: tuple[Statement, ...],
+    previous_statements: list[tuple[Statement, BoolExpression, int | None]],
+) -> tuple[
+    list[tuple[Statement, BoolExpression, int | None]], nx.DiGraph[ProgramPoint]
+]:
+    graph: nx.DiGraph[ProgramPoint] = nx.DiGraph()
+
+    for statement in statements:
+        for previous_statement, condition, edge_case in previous_statements:
+            graph.add_edge(
+                ProgramPoint(previous_statement.line_number, previous_statement),
+                ProgramPoint(statement.line_number, statement),
+                case=edge_case,
+                condition=condition,
+            )
+
+        match statement:
+            case IfElse(_, condition, if_body, else_body):
+                if_next_statements, if_graph = compose_sequence_cfg(
+                    if_body, [(statement, condition, True)]
+                )
+                else_next_statements, else_graph = compose_sequence_cfg(
+                    else_body, [(statement, condition.neg(), False)]
+                )
+                previous_statements = if_next_statements + else_next_statements
+                statement_graph = nx.compose(if_graph, else_graph)
+            case While(_, condition, body):
+                body_next_statements, statement_graph = compose_sequence_cfg(
+                    body, [(statement, condition, True)]
+                )
+                for previous_statement, condition, edge_case in body_next_statements:
+                    statement_graph.add_edge(
+                        ProgramPoint(
+                            previous_statement.line_number, previous_statement
+                        ),
+                        ProgramPoint(statement.line_number, statement),
+                        case=edge_case,
+                        condition=condition,
+                    )
+                previous_statements = [(statement, statement.condition.neg(), False)]
+            case _:
+                previous_statements = [(statement, BoolConstant(True), None)]
+                statement_graph = nx.DiGraph()
+
+        graph = nx.compose(graph, statement_graph)
+
+    return previous_statements, graph
+
+
+def compose_function_cfg(function: Function) -> nx.DiGraph[ProgramPoint]:
+    _, graph = compose_sequence_cfg(function.body, [])
+    return graph
+
+
+class _LineCounter:
+    def __init__(self) -> None:
+        self._line = 1
+
+    def __call__(self) -> int:
+        self._line += 1
+        return self._line
+
+
+def _assignment(line: int, index: int) -> Assignment:
+    return Assignment(
+        line,
+        Variable(f"x{index % 8}"),
+        IntBinaryExpression(
+            Variable(f"x{(index + 1) % 8}"), IntBinaryOperator.ADD, IntConstant(1)
+        ),
+    )
+
+
+def _condition(index: int) -> BoolExpression:
+    return IntComparisonExpression(
+        Variable(f"x{index % 8}"), IntComparisonOperator.GT, IntConstant(0)
+    )
+
+
+def long_function(statements: int) -> Function:
+    next_line = _LineCounter()
+    body: list[Statement] = []
+
+    for index in range(statements):
+        match index % 4:
+            case 0 | 1:
+                body.append(_assignment(next_line(), index))
+            case 2:
+                body.append(
+                    IfElse(
+                        next_line(),
+                        _condition(index),
+                        (_assignment(next_line(), index),),
+                        (_assignment(next_line(), index + 1),),
+                    )
+                )
+            case 3:
+                body.append(
+                    While(
+                        next_line(),
+                        _condition(index),
+                        (_assignment(next_line(), index),),
+                    )
+                )
+
+    return Function(body=tuple(body))
+
+
+def deep_function(depth: int) -> Function:
+    next_line = _LineCounter()
+    lines = [next_line() for _ in range(depth)]
+
+    body: tuple[Statement, ...] = (_assignment(next_line(), depth),)
+    for index, line in reversed(list(enumerate(lines))):
+        prefix = _assignment(next_line(), index)
+        if index % 2 == 0:
+            body = (prefix, While(line, _condition(index), body))
+        else:
+            body = (prefix, IfElse(line, _condition(index), body, (prefix,)))
+
+    return Function(body=body)
+
+
+def bench(label: str, function: Function, repeat: int) -> None:
+    _, graph = function.to_cfg()
+    reference = compose_function_cfg(function)
+
+    if dict(graph.edges) != dict(reference.edges):
+        raise AssertionError(f"{label}: CFGs differ")
+
+    shared = min(timeit.repeat(function.to_cfg, number=1, repeat=repeat))
+    compose = min(
+        timeit.repeat(lambda: compose_function_cfg(function), number=1, repeat=repeat)
+    )
+
+    print(
+        f"{label:<24} nodes={graph.number_of_nodes():<6} "
+        f"compose={compose * 1000:9.2f}ms shared={shared * 1000:9.2f}ms "
+        f"speedup={compose / shared:6.1f}x"
+    )
+
+
+def main(argv: list[str]) -> None:
+    repeat = int(argv[0]) if argv else 3
+
+    for statements in (100, 250, 500):
+        bench(f"long({statements})", long_function(statements), repeat)
+
+    for depth in (10, 25, 50):
+        bench(f"deep({depth})", deep_function(depth), repeat)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
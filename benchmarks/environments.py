@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import sys
+import timeit
+import tracemalloc
+from typing import TYPE_CHECKING
+
+from benchmarks.worklist_order import ANALYSES
+from small.fixpoint import solve
+from tests.programs import ProgramLayout, ProgramShape, generate_function
+
+if TYPE_CHECKING:
+    from small.ast import Function
+
+
+def bench(label: str, function: Function, analysis: str, repeat: int) -> None:
+    scene = ANALYSES[analysis]
+    cfg = function.to_compact_cfg()
+
+    def run(persistent_environments: bool):
+        return solve(
+            function,
+            scene.lattice,
+            scene.control_flow_function,
+            scene.condition_update_function,
+            getattr(scene, "widening_operator", None),
+            cfg=cfg,
+            persistent_environments=persistent_environments,
+        )
+
+    columns = []
+    for persistent_environments in (False, True):
+        seconds = min(
+            timeit.repeat(lambda: run(persistent_environments), number=1, repeat=repeat)  # noqa: B023
+        )
+
+        tracemalloc.start()
+        result = run(persistent_environments)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del result
+
+        name = "persistent" if persistent_environments else "dict"
+        columns.append(f"{name}={seconds * 1000:8.2f}ms {memory / 1e6:6.2f}MB")
+
+    print(f"{label:<24} {analysis:<9} " + " ".join(columns))
+
+
+def main(argv: list[str]) -> None:
+    repeat = int(argv[0]) if argv else 3
+
+    shapes = {
+        "StraightLine100x1000": ProgramShape(
+            1000, 0, 100, 1, layout=ProgramLayout.STRAIGHT_LINE
+        ),
+        "StraightLine1000x5000": ProgramShape(
+            5000, 0, 1000, 1, layout=ProgramLayout.STRAIGHT_LINE
+        ),
+        "NestedLoops16": ProgramShape(0, 16, 0, 1, layout=ProgramLayout.NESTED_LOOPS),
+    }
+
+    for label, shape in shapes.items():
+        function = generate_function(shape)
+        for analysis in ANALYSES:
+            bench(label, function, analysis, repeat)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import random
+import sys
+import timeit
+from typing import Any
+
+from small.ast import (
+    Assignment,
+    BoolConstant,
+    Expression,
+    IntBinaryExpression,
+    IntBinaryOperator,
+    IntConstant,
+    Variable,
+)
+from small.interval_analysis import (
+    BoolIntervalValue,
+    DispatchIntervalAnalysisFlowFunction,
+    IntervalAnalysisFlowFunction,
+    IntervalExtremum,
+    IntervalInfinity,
+    IntIntervalValue,
+)
+from small.zero_analysis import (
+    DispatchZeroAnalysisFlowFunction,
+    ZeroAnalysisFlowFunction,
+    ZeroAnalysisValue,
+)
+
+VARIABLES = tuple(f"v{index}" for index in range(16))
+
+BINARY_OPERATORS = tuple(IntBinaryOperator.__members__.values())
+
+
+def random_operand(rng: random.Random) -> Variable | IntConstant:
+    if rng.getrandbits(1):
+        return Variable(rng.choice(VARIABLES))
+    return IntConstant(rng.randint(-3, 3))
+
+
+def random_assignment(rng: random.Random, line_number: int) -> Assignment:
+    value: Expression
+    match rng.randrange(4):
+        case 0:
+            value = random_operand(rng)
+        case 1:
+            value = BoolConstant(bool(rng.getrandbits(1)))
+        case _:
+            value = IntBinaryExpression(
+                random_operand(rng),
+                rng.choice(BINARY_OPERATORS),
+                random_operand(rng),
+            )
+
+    return Assignment(line_number, Variable(rng.choice(VARIABLES)), value)
+
+
+def random_bound(rng: random.Random) -> Any:
+    match rng.randrange(6):
+        case 0:
+            return IntervalInfinity.NEGATIVE
+        case 1:
+            return IntervalInfinity.POSITIVE
+        case _:
+            return rng.randint(-5, 5)
+
+
+def random_interval(rng: random.Random) -> Any:
+    match rng.randrange(6):
+        case 0:
+            return IntervalExtremum.BOTTOM
+        case 1:
+            return IntervalExtremum.TOP
+        case 2:
+            return BoolIntervalValue(False, bool(rng.getrandbits(1)))
+        case _:
+            low, high = sorted((random_bound(rng), random_bound(rng)))
+            return IntIntervalValue(low, high)
+
+
+def bench(
+    label: str,
+    reference: Any,
+    dispatch: Any,
+    statements: list[Assignment],
+    environments: list[dict[str, Any]],
+    repeat: int,
+) -> None:
+    pairs = list(zip(statements, environments, strict=True))
+
+    def run(flow_function: Any) -> None:
+        for statement, environment in pairs:
+            flow_function.get_variables(statement, environment)
+
+    match_time = min(timeit.repeat(lambda: run(reference), number=1, repeat=repeat))
+    dispatch_time = min(timeit.repeat(lambda: run(dispatch), number=1, repeat=repeat))
+
+    print(
+        f"{label:<10} statements={len(pairs):<7} match={match_time * 1000:8.2f}ms "
+        f"dispatch={dispatch_time * 1000:8.2f}ms "
+        f"speedup={match_time / dispatch_time:5.1f}x"
+    )
+
+
+def main(argv: list[str]) -> None:
+    size = int(argv[0]) if argv else 20000
+    repeat = int(argv[1]) if len(argv) > 1 else 3
+
+    rng = random.Random(227)
+    statements = [random_assignment(rng, line) for line in range(size)]
+
+    zero_environments = [
+        {variable: rng.choice(list(ZeroAnalysisValue)) for variable in VARIABLES}
+        for _ in statements
+    ]
+    bench(
+        "zero",
+        ZeroAnalysisFlowFunction(),
+        DispatchZeroAnalysisFlowFunction(),
+        statements,
+        zero_environments,
+        repeat,
+    )
+
+    interval_environments = [
+        {variable: random_interval(rng) for variable in VARIABLES} for _ in statements
+    ]
+    bench(
+        "interval",
+        IntervalAnalysisFlowFunction(),
+        DispatchIntervalAnalysisFlowFunction(),
+        statements,
+        interval_environments,
+        repeat,
+    )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import sys
+import timeit
+from typing import TYPE_CHECKING
+
+from small.fixpoint import solve
+from small.packed_zero_analysis import solve_packed
+from small.zero_analysis import AbstractZeroAnalysisScene
+from tests.programs import ProgramLayout, ProgramShape, generate_function
+
+if TYPE_CHECKING:
+    from small.ast import Function
+
+
+def bench(label: str, function: Function, repeat: int) -> None:
+    scene = AbstractZeroAnalysisScene
+    cfg = function.to_compact_cfg()
+
+    dict_seconds = min(
+        timeit.repeat(
+            lambda: solve(
+                function,
+                scene.lattice,
+                scene.control_flow_function,
+                scene.condition_update_function,
+                cfg=cfg,
+            ),
+            number=1,
+            repeat=repeat,
+        )
+    )
+    packed_seconds = min(
+        timeit.repeat(lambda: solve_packed(function, cfg=cfg), number=1, repeat=repeat)
+    )
+
+    print(
+        f"{label:<20} dict={dict_seconds * 1000:8.2f}ms"
+        f" packed={packed_seconds * 1000:8.2f}ms"
+    )
+
+
+def main(argv: list[str]) -> None:
+    repeat = int(argv[0]) if argv else 3
+
+    bench(
+        "NestedLoops16",
+        generate_function(ProgramShape(0, 16, 0, 1, layout=ProgramLayout.NESTED_LOOPS)),
+        repeat,
+    )
+    for variables in (100, 500, 2000):
+        bench(
+            f"WideLoops{variables}",
+            generate_function(
+                ProgramShape(100, 0, variables, 1, layout=ProgramLayout.WIDE_LOOPS)
+            ),
+            repeat,
+        )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
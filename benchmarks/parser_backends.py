@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import inspect
+import re
+import sys
+import timeit
+
+import scenes
+from small import ParserBackend, read_string
+
+
+def scene_programs() -> list[str]:
+    return [
+        value.program_string
+        for _, value in inspect.getmembers(scenes, inspect.isclass)
+        if isinstance(getattr(value, "program_string", None), str)
+    ]
+
+
+def large_program(programs: list[str], functions: int) -> str:
+    return "\n".join(
+        re.sub(
+            r"function (\w+)",
+            rf"function \g<1>{index}",
+            programs[index % len(programs)],
+        )
+        for index in range(functions)
+    )
+
+
+def bench(functions: int, source: str, repeat: int) -> None:
+    expected = read_string(source, cache=False, backend=ParserBackend.ANTLR)
+    actual = read_string(source, cache=False, backend=ParserBackend.DESCENT)
+    if expected != actual:
+        raise AssertionError(f"The parsers disagree on {functions} functions")
+
+    def run(backend: ParserBackend) -> None:
+        read_string(source, cache=False, backend=backend)
+
+    antlr_time = min(
+        timeit.repeat(lambda: run(ParserBackend.ANTLR), number=1, repeat=repeat)
+    )
+    descent_time = min(
+        timeit.repeat(lambda: run(ParserBackend.DESCENT), number=1, repeat=repeat)
+    )
+
+    size = len(source.encode()) / 1024
+    print(
+        f"functions={functions:<6} size={size:8.1f}KiB "
+        f"antlr={antlr_time * 1000:9.2f}ms ({size / antlr_time:7.1f}KiB/s) "
+        f"descent={descent_time * 1000:8.2f}ms ({size / descent_time:7.1f}KiB/s) "
+        f"speedup={antlr_time / descent_time:5.1f}x"
+    )
+
+
+def main(argv: list[str]) -> None:
+    repeat = int(argv[0]) if argv else 3
+
+    programs = scene_programs()
+    for functions in (10, 100, 1000):
+        bench(functions, large_program(programs, functions), repeat)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
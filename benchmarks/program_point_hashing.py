@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import sys
+import timeit
+from dataclasses import fields
+from typing import Any
+
+from manim_dataflow_analysis import ProgramPoint
+
+from scenes import ComplexZeroAnalysisScene
+from small import read_string
+from small.ast import (
+    CachedHashStatement,
+    Function,
+    IntComparisonExpression,
+    IntComparisonOperator,
+    IntConstant,
+    Variable,
+    While,
+)
+
+
+def structural_hash(value: Any) -> int:
+    match value:
+        case tuple():
+            return hash(tuple(structural_hash(item) for item in value))
+        case ProgramPoint(line_number, statement):
+            return hash((line_number, structural_hash(statement)))
+        case CachedHashStatement():
+            return hash(
+                tuple(
+                    structural_hash(getattr(value, field.name))
+                    for field in fields(value)  # type: ignore
+                )
+            )
+        case _:
+            return hash(value)
+
+
+def nested_function(function: Function, depth: int) -> Function:
+    body = function.body
+    for level in range(depth):
+        condition = IntComparisonExpression(
+            Variable("y"), IntComparisonOperator.GT, IntConstant(level)
+        )
+        body = (While(level + 1, condition, body),)
+
+    return Function(body=body)
+
+
+def bench(label: str, function: Function, repeat: int, number: int) -> None:
+    _, graph = function.to_cfg()
+    program_points: list[ProgramPoint] = list(graph.nodes)
+    environments = dict.fromkeys(program_points)
+
+    def structural() -> None:
+        for program_point in program_points:
+            structural_hash(program_point)
+
+    def cached() -> None:
+        for program_point in program_points:
+            hash(program_point)
+
+    def lookup() -> None:
+        for program_point in program_points:
+            environments[program_point]
+
+    structural_time = min(timeit.repeat(structural, number=number, repeat=repeat))
+    cached_time = min(timeit.repeat(cached, number=number, repeat=repeat))
+    lookup_time = min(timeit.repeat(lookup, number=number, repeat=repeat))
+
+    print(
+        f"{label:<16} nodes={len(program_points):<5} "
+        f"structural={structural_time * 1000:9.2f}ms "
+        f"cached={cached_time * 1000:7.2f}ms lookup={lookup_time * 1000:7.2f}ms "
+        f"speedup={structural_time / cached_time:7.1f}x"
+    )
+
+
+def main(argv: list[str]) -> None:
+    repeat = int(argv[0]) if argv else 3
+    number = int(argv[1]) if len(argv) > 1 else 100
+
+    function = read_string(ComplexZeroAnalysisScene.program_string.lstrip("\n"))[0]
+
+    for depth in (0, 5, 20):
+        bench(f"complex+{depth}", nested_function(function, depth), repeat, number)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import platform
+import subprocess
+import sys
+import timeit
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from antlr4 import InputStream
+
+from small.ast.builder import build
+from small.cst import parse
+from small.fixpoint import solve
+from small.interval_analysis import AbstractIntervalAnalysisScene
+from small.zero_analysis import AbstractZeroAnalysisScene
+from tests.programs import ProgramShape, generate_program
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from small.ast import Function
+
+PHASES = ("parse", "build", "to_cfg", "zero", "interval")
+
+
+def analyze(functions: tuple[Function, ...], scene: Any) -> None:
+    for function in functions:
+        solve(
+            function,
+            scene.lattice,
+            scene.control_flow_function,
+            scene.condition_update_function,
+            getattr(scene, "widening_operator", None),
+        )
+
+
+def measure(function: Callable[[], Any], repeat: int) -> float:
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def bench(shape: ProgramShape, repeat: int) -> dict[str, Any]:
+    source = generate_program(shape)
+
+    program_cst = parse(InputStream(source))
+    functions = build(program_cst, program=source)
+
+    seconds = {
+        "parse": measure(lambda: parse(InputStream(source)), repeat),
+        "build": measure(lambda: build(program_cst, program=source), repeat),
+        "to_cfg": measure(
+            lambda: [function.to_cfg() for function in functions], repeat
+        ),
+        "zero": measure(lambda: analyze(functions, AbstractZeroAnalysisScene), repeat),
+        "interval": measure(
+            lambda: analyze(functions, AbstractIntervalAnalysisScene), repeat
+        ),
+    }
+
+    return {
+        "shape": asdict(shape),
+        "source_bytes": len(source.encode()),
+        "seconds": seconds,
+    }
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def shape_label(shape: dict[str, int]) -> str:
+    return (
+        f"s={shape['statements']} d={shape['depth']} "
+        f"v={shape['variables']} f={shape['functions']}"
+    )
+
+
+def compare(
+    results: list[dict[str, Any]], baseline: dict[str, Any], threshold: float
+) -> bool:
+    baseline_results = {
+        json.dumps(result["shape"], sort_keys=True): result["seconds"]
+        for result in baseline["results"]
+    }
+
+    regressed = False
+    for result in results:
+        baseline_seconds = baseline_results.get(
+            json.dumps(result["shape"], sort_keys=True)
+        )
+        if baseline_seconds is None:
+            continue
+
+        columns = []
+        for phase in PHASES:
+            ratio = result["seconds"][phase] / baseline_seconds[phase]
+            marker = "!" if ratio > threshold else " "
+            regressed |= ratio > threshold
+            columns.append(f"{phase}={ratio:5.2f}x{marker}")
+
+        print(f"{shape_label(result['shape']):<28} " + " ".join(columns))
+
+    return regressed
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Time each phase of the analysis on generated Small programs."
+    )
+    parser.add_argument("--statements", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--depth", type=int, nargs="+", default=[2])
+    parser.add_argument("--variables", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--functions", type=int, nargs="+", default=[10])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("-o", "--output", type=Path)
+    parser.add_argument("--compare", type=Path)
+    parser.add_argument("--threshold", type=float, default=1.2)
+    args = parser.parse_args(argv)
+
+    results = []
+    for statements, depth, variables, functions in itertools.product(
+        args.statements, args.depth, args.variables, args.functions
+    ):
+        shape = ProgramShape(statements, depth, variables, functions, args.seed)
+        result = bench(shape, args.repeat)
+        results.append(result)
+
+        print(
+            f"{shape_label(result['shape']):<28} "
+            + " ".join(
+                f"{phase}={result['seconds'][phase] * 1000:9.2f}ms" for phase in PHASES
+            )
+        )
+
+    if args.output is not None:
+        args.output.write_text(
+            json.dumps(
+                {
+                    "commit": git_commit(),
+                    "python": platform.python_version(),
+                    "repeat": args.repeat,
+                    "results": results,
+                },
+                indent=2,
+            )
+        )
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())
+        print(f"Compared with {baseline.get('commit')}:")
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
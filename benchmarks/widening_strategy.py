@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import sys
+import timeit
+from typing import TYPE_CHECKING
+
+from benchmarks.worklist_order import programs
+from small import ParserBackend, read_string
+from small.fixpoint import WideningPoints, solve
+from small.interval_analysis import (
+    AbstractIntervalAnalysisScene,
+    IntervalAnalysisThresholdWideningOperator,
+    IntervalInfinity,
+)
+from tests.programs import RESET_COUNTER
+
+if TYPE_CHECKING:
+    from small.ast import Function
+
+STRATEGIES = {
+    "everywhere": (WideningPoints.EVERYWHERE, 0, False, False),
+    "loop-heads": (WideningPoints.LOOP_HEADS, 0, False, False),
+    "narrowing": (WideningPoints.LOOP_HEADS, 0, True, False),
+    "delay=1": (WideningPoints.LOOP_HEADS, 1, False, False),
+    "delay=1+narrowing": (WideningPoints.LOOP_HEADS, 1, True, False),
+    "thresholds": (WideningPoints.LOOP_HEADS, 0, False, True),
+}
+
+
+def unbounded(environments: dict) -> int:
+    return sum(
+        getattr(value, "low", None) == IntervalInfinity.NEGATIVE
+        or getattr(value, "high", None) == IntervalInfinity.POSITIVE
+        for environment in environments.values()
+        if environment is not None
+        for value in environment.values()
+    )
+
+
+def bench(label: str, function: Function, repeat: int) -> None:
+    scene = AbstractIntervalAnalysisScene
+
+    thresholds = IntervalAnalysisThresholdWideningOperator.from_function(
+        scene.lattice, function
+    )
+
+    def run(
+        widening_points: WideningPoints, delay: int, narrowing: bool, threshold: bool
+    ):
+        return solve(
+            function,
+            scene.lattice,
+            scene.control_flow_function,
+            scene.condition_update_function,
+            thresholds if threshold else scene.widening_operator,
+            widening_points=widening_points,
+            widening_delay=delay,
+            narrowing_operator=scene.narrowing_operator if narrowing else None,
+        )
+
+    columns = []
+    for name, strategy in STRATEGIES.items():
+        result = run(*strategy)
+        seconds = min(timeit.repeat(lambda: run(*strategy), number=1, repeat=repeat))  # noqa: B023
+        columns.append(
+            f"{name}={result.iterations}/{unbounded(result.environments)}"
+            f" ({seconds * 1000:.2f}ms)"
+        )
+
+    print(f"{label:<34} " + " ".join(columns))
+
+
+def main(argv: list[str]) -> None:
+    repeat = int(argv[0]) if argv else 3
+
+    functions = programs()
+    functions["ResetCounter"] = read_string(
+        RESET_COUNTER.lstrip("\n"), backend=ParserBackend.DESCENT
+    )[0]
+
+    print("iterations/unbounded interval values per strategy")
+    for label, function in functions.items():
+        bench(label, function, repeat)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import inspect
+import sys
+import timeit
+from typing import TYPE_CHECKING
+
+import scenes
+from small import read_string
+from small.fixpoint import WorklistOrder, solve
+from small.interval_analysis import AbstractIntervalAnalysisScene
+from small.zero_analysis import AbstractZeroAnalysisScene
+from tests.programs import ProgramLayout, ProgramShape, generate_function
+
+if TYPE_CHECKING:
+    from small.ast import Function
+    from small.render_cache import AnalysisSceneClass
+
+ANALYSES: dict[str, AnalysisSceneClass] = {
+    "zero": AbstractZeroAnalysisScene,
+    "interval": AbstractIntervalAnalysisScene,
+}
+
+
+def programs() -> dict[str, Function]:
+    functions = {
+        name: read_string(value.program_string.lstrip("\n"))[0]
+        for name, value in inspect.getmembers(scenes, inspect.isclass)
+        if isinstance(getattr(value, "program_string", None), str)
+    }
+    for depth in (4, 8, 16):
+        functions[f"NestedLoops{depth}"] = generate_function(
+            ProgramShape(0, depth, 0, 1, layout=ProgramLayout.NESTED_LOOPS)
+        )
+    return functions
+
+
+def bench(label: str, function: Function, analysis: str, repeat: int) -> None:
+    scene = ANALYSES[analysis]
+
+    def run(order: WorklistOrder) -> int:
+        return solve(
+            function,
+            scene.lattice,
+            scene.control_flow_function,
+            scene.condition_update_function,
+            getattr(scene, "widening_operator", None),
+            order=order,
+        ).iterations
+
+    columns = []
+    for order in WorklistOrder:
+        iterations = run(order)
+        seconds = min(timeit.repeat(lambda: run(order), number=1, repeat=repeat))  # noqa: B023
+        columns.append(f"{order}={iterations:<5} ({seconds * 1000:7.2f}ms)")
+
+    print(f"{label:<34} {analysis:<9} " + " ".join(columns))
+
+
+def main(argv: list[str]) -> None:
+    repeat = int(argv[0]) if argv else 3
+
+    for label, function in programs().items():
+        for analysis in ANALYSES:
+            bench(label, function, analysis, repeat)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
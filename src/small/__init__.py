@@ -1,16 +1,79 @@
+import os
+from enum import StrEnum
+from functools import partial
+from pathlib import Path
+
 from antlr4 import FileStream, InputStream
 
-from small.ast.builder import build
-from small.cst import parse
+from small.ast.builder import build, iter_build
+from small.ast.parser import parse_program
+from small.cst import parse, parse_functions
+from small.parse_cache import ParseCache
+from small.profiling import phase
+
+
+class ParserBackend(StrEnum):
+    ANTLR = "antlr"
+    DESCENT = "descent"
+
+
+parse_cache = ParseCache(
+    directory=(
+        Path(directory)
+        if (directory := os.environ.get("SMALL_PARSE_CACHE_DIR"))
+        else None
+    ),
+    enabled=os.environ.get("SMALL_PARSE_CACHE", "1") != "0",
+)
+
+
+def read_stream(stream: InputStream, backend: ParserBackend = ParserBackend.ANTLR):
+    match backend:
+        case ParserBackend.ANTLR:
+            with phase("parse"):
+                program_cst = parse(stream)
+            with phase("build"):
+                return build(program_cst, program=str(stream))
+        case ParserBackend.DESCENT:
+            with phase("parse"):
+                return parse_program(str(stream), program=str(stream))
+        case _:
+            raise ValueError(f"Unsupported parser backend: {backend}")
+
+
+def read_string(
+    string: str, cache: bool = True, backend: ParserBackend = ParserBackend.ANTLR
+):
+    stream = InputStream(string)
+
+    if not cache:
+        return read_stream(stream, backend)
+
+    return parse_cache.get_or_parse(
+        string, partial(read_stream, stream, backend), backend
+    )
+
+
+def read_file(
+    filepath: str, cache: bool = True, backend: ParserBackend = ParserBackend.ANTLR
+):
+    stream = FileStream(filepath)
+
+    if not cache:
+        return read_stream(stream, backend)
+
+    return parse_cache.get_or_parse(
+        str(stream), partial(read_stream, stream, backend), backend
+    )
 
 
-def read_stream(stream: InputStream):
-    return build(parse(stream), program=str(stream))
+def iter_stream(stream: InputStream):
+    return iter_build(parse_functions(stream), program=str(stream))
 
 
-def read_string(string: str):
-    return read_stream(InputStream(string))
+def iter_string(string: str):
+    return iter_stream(InputStream(string))
 
 
-def read_file(filepath: str):
-    return read_stream(FileStream(filepath))
+def iter_file(filepath: str):
+    return iter_stream(FileStream(filepath))
@@ -0,0 +1,340 @@
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import pickle
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from enum import StrEnum
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Mapping, TextIO
+
+from manim_dataflow_analysis import ProgramPoint
+
+from small import ParserBackend, read_file
+from small.array_interval_analysis import ArrayIntervalEnvironment
+from small.ast.builder import CannotBuildAstException
+from small.fixpoint import (
+    WideningPoints,
+    WorklistOrder,
+    initial_environment,
+    solve,
+)
+from small.interval_analysis import (
+    AbstractIntervalAnalysisScene,
+    IntervalAnalysisThresholdWideningOperator,
+)
+from small.packed_zero_analysis import PackedZeroEnvironment
+from small.zero_analysis import AbstractZeroAnalysisScene
+
+if TYPE_CHECKING:
+    from small.ast import Function
+
+
+class AnalysisKind(StrEnum):
+    ZERO = "zero"
+    INTERVAL = "interval"
+
+
+ANALYSES: dict[AnalysisKind, Any] = {
+    AnalysisKind.ZERO: AbstractZeroAnalysisScene,
+    AnalysisKind.INTERVAL: AbstractIntervalAnalysisScene,
+}
+
+
+@dataclass(frozen=True)
+class SolverOptions:
+    order: WorklistOrder = WorklistOrder.FIFO
+    widening_points: WideningPoints = WideningPoints.EVERYWHERE
+    widening_delay: int = 0
+    narrowing: bool = False
+    threshold_widening: bool = False
+    persistent_environments: bool = False
+    packed: bool = False
+
+    def __post_init__(self) -> None:
+        if self.persistent_environments and self.packed:
+            raise ValueError("Packed environments cannot be persistent")
+
+
+DEFAULT_SOLVER_OPTIONS = SolverOptions()
+
+
+def expand_paths(patterns: Iterable[str]) -> Iterator[Path]:
+    for pattern in patterns:
+        path = Path(pattern)
+
+        if path.is_dir():
+            yield from sorted(path.rglob("*.small"))
+        elif glob.has_magic(pattern):
+            yield from sorted(
+                Path(match) for match in glob.glob(pattern, recursive=True)
+            )
+        else:
+            yield path
+
+
+def analyze_function(
+    function: Function,
+    analysis: AnalysisKind,
+    options: SolverOptions = DEFAULT_SOLVER_OPTIONS,
+) -> dict[str, Any]:
+    scene = ANALYSES[analysis]
+
+    widening_operator = getattr(scene, "widening_operator", None)
+    if options.threshold_widening and widening_operator is not None:
+        widening_operator = IntervalAnalysisThresholdWideningOperator.from_function(
+            scene.lattice, function
+        )
+
+    entry_environment: Mapping[str, Any] | None = None
+    if options.packed:
+        initial: dict[str, Any] = initial_environment(function, scene.lattice)
+        match analysis:
+            case AnalysisKind.ZERO:
+                entry_environment = PackedZeroEnvironment.of(initial)
+            case AnalysisKind.INTERVAL:
+                entry_environment = ArrayIntervalEnvironment.of(initial)
+
+    start = time.perf_counter()
+    result = solve(
+        function,
+        scene.lattice,
+        scene.control_flow_function,
+        scene.condition_update_function,
+        widening_operator,
+        entry_environment,
+        order=options.order,
+        widening_points=options.widening_points,
+        widening_delay=options.widening_delay,
+        narrowing_operator=(
+            getattr(scene, "narrowing_operator", None) if options.narrowing else None
+        ),
+        persistent_environments=options.persistent_environments,
+    )
+    solve_time = time.perf_counter() - start
+
+    environments = []
+    for program_point, environment in result.environments.items():
+        match program_point:
+            case ProgramPoint(line_number, statement):
+                environments.append(
+                    {
+                        "line": line_number,
+                        "statement": statement.header,
+                        "environment": (
+                            None
+                            if environment is None
+                            else {
+                                variable: str(value)
+                                for variable, value in environment.items()
+                            }
+                        ),
+                    }
+                )
+
+    return {
+        "function": function.name,
+        "line": function.line_number,
+        "iterations": result.iterations,
+        "solve_time": solve_time,
+        "environments": environments,
+    }
+
+
+def error_message(error: Exception) -> str:
+    if isinstance(error, CannotBuildAstException | ValueError | OSError):
+        return str(error)
+    return f"{type(error).__name__}: {error}"
+
+
+def iter_tasks(
+    paths: Iterable[Path],
+    analysis: AnalysisKind,
+    backend: ParserBackend = ParserBackend.DESCENT,
+) -> Iterator[tuple[dict[str, Any], Function | None]]:
+    for path in paths:
+        start = time.perf_counter()
+        try:
+            functions = read_file(str(path), cache=False, backend=backend)
+        except Exception as e:
+            yield (
+                {"file": str(path), "analysis": analysis, "error": error_message(e)},
+                None,
+            )
+            continue
+        parse_time = time.perf_counter() - start
+
+        for function in functions:
+            yield (
+                {"file": str(path), "analysis": analysis, "parse_time": parse_time},
+                function,
+            )
+
+
+def analyze_task(
+    record: dict[str, Any],
+    function: Function | None,
+    analysis: AnalysisKind,
+    options: SolverOptions = DEFAULT_SOLVER_OPTIONS,
+) -> dict[str, Any]:
+    if function is None:
+        return record
+
+    try:
+        return {**record, **analyze_function(function, analysis, options)}
+    except Exception as e:
+        return {**record, "function": function.name, "error": error_message(e)}
+
+
+def serialize_tasks(tasks: list[tuple[dict[str, Any], Function | None]]) -> bytes:
+    return pickle.dumps(
+        [
+            (
+                record,
+                None if function is None else replace(function, function_code=None),
+            )
+            for record, function in tasks
+        ],
+        pickle.HIGHEST_PROTOCOL,
+    )
+
+
+def analyze_serialized_tasks(
+    serialized_tasks: bytes,
+    analysis: AnalysisKind,
+    options: SolverOptions = DEFAULT_SOLVER_OPTIONS,
+) -> list[dict[str, Any]]:
+    return [
+        analyze_task(record, function, analysis, options)
+        for record, function in pickle.loads(serialized_tasks)
+    ]
+
+
+def chunk_records(
+    chunk: list[tuple[dict[str, Any], Function | None]],
+    future: Future[list[dict[str, Any]]],
+) -> list[dict[str, Any]]:
+    try:
+        return future.result()
+    except Exception as e:
+        return [
+            record
+            if function is None
+            else {**record, "function": function.name, "error": error_message(e)}
+            for record, function in chunk
+        ]
+
+
+def analyze_parallel(
+    tasks: Iterable[tuple[dict[str, Any], Function | None]],
+    analysis: AnalysisKind,
+    jobs: int,
+    chunk_size: int = 64,
+    options: SolverOptions = DEFAULT_SOLVER_OPTIONS,
+) -> Iterator[dict[str, Any]]:
+    tasks = iter(tasks)
+
+    with ProcessPoolExecutor(jobs) as executor:
+        futures: deque[
+            tuple[
+                list[tuple[dict[str, Any], Function | None]],
+                Future[list[dict[str, Any]]],
+            ]
+        ] = deque()
+
+        while chunk := list(islice(tasks, chunk_size)):
+            try:
+                future = executor.submit(
+                    analyze_serialized_tasks, serialize_tasks(chunk), analysis, options
+                )
+            except Exception as e:
+                future = Future()
+                future.set_exception(e)
+            futures.append((chunk, future))
+
+            if len(futures) >= 2 * jobs:
+                yield from chunk_records(*futures.popleft())
+
+        while futures:
+            yield from chunk_records(*futures.popleft())
+
+
+def write_records(records: Iterable[dict[str, Any]], output: TextIO) -> None:
+    for record in records:
+        output.write(json.dumps(record))
+        output.write("\n")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Analyze Small programs and print one JSON record per function."
+    )
+    parser.add_argument("paths", nargs="+", help="files, directories or globs")
+    parser.add_argument(
+        "-a",
+        "--analysis",
+        type=AnalysisKind,
+        choices=list(AnalysisKind),
+        default=AnalysisKind.ZERO,
+    )
+    parser.add_argument(
+        "--backend",
+        type=ParserBackend,
+        choices=list(ParserBackend),
+        default=ParserBackend.DESCENT,
+    )
+    parser.add_argument(
+        "--order",
+        type=WorklistOrder,
+        choices=list(WorklistOrder),
+        default=WorklistOrder.FIFO,
+    )
+    parser.add_argument(
+        "--widening-points",
+        type=WideningPoints,
+        choices=list(WideningPoints),
+        default=WideningPoints.EVERYWHERE,
+    )
+    parser.add_argument("--widening-delay", type=int, default=0)
+    parser.add_argument("--narrowing", action="store_true")
+    parser.add_argument("--threshold-widening", action="store_true")
+    environments = parser.add_mutually_exclusive_group()
+    environments.add_argument("--persistent-environments", action="store_true")
+    environments.add_argument("--packed", action="store_true")
+    parser.add_argument("-j", "--jobs", type=int, default=1)
+    parser.add_argument("--chunk-size", type=int, default=64)
+    parser.add_argument("-o", "--output", type=argparse.FileType("w"), default="-")
+    args = parser.parse_args(argv)
+
+    tasks = iter_tasks(expand_paths(args.paths), args.analysis, args.backend)
+    options = SolverOptions(
+        args.order,
+        args.widening_points,
+        args.widening_delay,
+        args.narrowing,
+        args.threshold_widening,
+        args.persistent_environments,
+        args.packed,
+    )
+
+    if args.jobs > 1:
+        records = analyze_parallel(
+            tasks, args.analysis, args.jobs, args.chunk_size, options
+        )
+    else:
+        records = (
+            analyze_task(record, function, args.analysis, options)
+            for record, function in tasks
+        )
+
+    write_records(records, args.output)
+    args.output.flush()
+
+
+if __name__ == "__main__":
+    main()
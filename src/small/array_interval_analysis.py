@@ -0,0 +1,477 @@
+from __future__ import annotations
+
+from enum import IntEnum
+from typing import TYPE_CHECKING, Iterator, Mapping
+
+import numpy as np
+
+from small.environment import DerivableEnvironment
+from small.fixpoint import (
+    WideningPoints,
+    WorklistOrder,
+    initial_environment,
+    solve,
+)
+from small.interval_analysis import (
+    AbstractIntervalAnalysisScene,
+    BoolIntervalValue,
+    IntervalAnalysisNarrowingOperator,
+    IntervalAnalysisValue,
+    IntervalAnalysisWideningOperator,
+    IntervalExtremum,
+    IntervalInfinity,
+    IntIntervalValue,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from manim_dataflow_analysis import Lattice, WideningOperator
+
+    from small.ast import Function
+    from small.cfg import CompactControlFlowGraph
+    from small.fixpoint import FixpointResult, NarrowingOperator
+
+NEGATIVE_INFINITY = np.iinfo(np.int64).min
+POSITIVE_INFINITY = np.iinfo(np.int64).max
+
+INTERVAL_DTYPE = np.dtype([("kind", np.uint8), ("low", np.int64), ("high", np.int64)])
+
+
+class IntervalKind(IntEnum):
+    BOTTOM = 0
+    INT = 1
+    BOOL = 2
+    TOP = 3
+    OVERFLOW = 4
+
+
+def encode_bound(bound: int | IntervalInfinity) -> int:
+    match bound:
+        case IntervalInfinity.NEGATIVE:
+            return NEGATIVE_INFINITY
+        case IntervalInfinity.POSITIVE:
+            return POSITIVE_INFINITY
+        case _:
+            return int(bound)
+
+
+def fits_bound(bound: int | IntervalInfinity) -> bool:
+    return (
+        isinstance(bound, IntervalInfinity)
+        or NEGATIVE_INFINITY < bound < POSITIVE_INFINITY
+    )
+
+
+def decode_bound(bound: int) -> int | IntervalInfinity:
+    if bound == NEGATIVE_INFINITY:
+        return IntervalInfinity.NEGATIVE
+    elif bound == POSITIVE_INFINITY:
+        return IntervalInfinity.POSITIVE
+    else:
+        return bound
+
+
+def encode_value(value: IntervalAnalysisValue) -> tuple[int, int, int]:
+    match value:
+        case IntervalExtremum.BOTTOM:
+            return IntervalKind.BOTTOM, 0, 0
+        case IntervalExtremum.TOP:
+            return IntervalKind.TOP, 0, 0
+        case BoolIntervalValue(low, high):
+            return IntervalKind.BOOL, int(low), int(high)
+        case IntIntervalValue(low, high):
+            if not (fits_bound(low) and fits_bound(high)):
+                return IntervalKind.OVERFLOW, 0, 0
+            return IntervalKind.INT, encode_bound(low), encode_bound(high)
+        case _:
+            raise ValueError(f"Unsupported value: {value}")
+
+
+def decode_value(kind: int, low: int, high: int) -> IntervalAnalysisValue:
+    match kind:
+        case IntervalKind.BOTTOM:
+            return IntervalExtremum.BOTTOM
+        case IntervalKind.TOP:
+            return IntervalExtremum.TOP
+        case IntervalKind.BOOL:
+            return BoolIntervalValue(bool(low), bool(high))
+        case IntervalKind.INT:
+            return IntIntervalValue(decode_bound(low), decode_bound(high))
+        case _:
+            raise ValueError(f"Unsupported kind: {kind}")
+
+
+def join_intervals(values1: np.ndarray, values2: np.ndarray) -> np.ndarray:
+    kinds1 = values1["kind"]
+    kinds2 = values2["kind"]
+
+    result = np.zeros(len(values1), dtype=INTERVAL_DTYPE)
+    result["kind"] = np.where(
+        kinds1 == kinds2,
+        kinds1,
+        np.where(
+            kinds1 == IntervalKind.BOTTOM,
+            kinds2,
+            np.where(kinds2 == IntervalKind.BOTTOM, kinds1, IntervalKind.TOP),
+        ),
+    )
+
+    bounded = (result["kind"] == IntervalKind.INT) | (
+        result["kind"] == IntervalKind.BOOL
+    )
+    result["low"] = np.where(
+        bounded,
+        np.where(
+            kinds1 == IntervalKind.BOTTOM,
+            values2["low"],
+            np.where(
+                kinds2 == IntervalKind.BOTTOM,
+                values1["low"],
+                np.minimum(values1["low"], values2["low"]),
+            ),
+        ),
+        0,
+    )
+    result["high"] = np.where(
+        bounded,
+        np.where(
+            kinds1 == IntervalKind.BOTTOM,
+            values2["high"],
+            np.where(
+                kinds2 == IntervalKind.BOTTOM,
+                values1["high"],
+                np.maximum(values1["high"], values2["high"]),
+            ),
+        ),
+        0,
+    )
+    return result
+
+
+def meet_intervals(values1: np.ndarray, values2: np.ndarray) -> np.ndarray:
+    kinds1 = values1["kind"]
+    kinds2 = values2["kind"]
+
+    result = np.zeros(len(values1), dtype=INTERVAL_DTYPE)
+    result["kind"] = np.where(
+        kinds1 == kinds2,
+        kinds1,
+        np.where(
+            kinds1 == IntervalKind.TOP,
+            kinds2,
+            np.where(kinds2 == IntervalKind.TOP, kinds1, IntervalKind.BOTTOM),
+        ),
+    )
+
+    bounded = (result["kind"] == IntervalKind.INT) | (
+        result["kind"] == IntervalKind.BOOL
+    )
+    result["low"] = np.where(
+        bounded,
+        np.where(
+            kinds1 == IntervalKind.TOP,
+            values2["low"],
+            np.where(
+                kinds2 == IntervalKind.TOP,
+                values1["low"],
+                np.maximum(values1["low"], values2["low"]),
+            ),
+        ),
+        0,
+    )
+    result["high"] = np.where(
+        bounded,
+        np.where(
+            kinds1 == IntervalKind.TOP,
+            values2["high"],
+            np.where(
+                kinds2 == IntervalKind.TOP,
+                values1["high"],
+                np.minimum(values1["high"], values2["high"]),
+            ),
+        ),
+        0,
+    )
+    return result
+
+
+def widen_intervals(last_values: np.ndarray, new_values: np.ndarray) -> np.ndarray:
+    result = join_intervals(last_values, new_values)
+
+    widened = (last_values["kind"] == IntervalKind.INT) & (
+        new_values["kind"] == IntervalKind.INT
+    )
+    result["low"] = np.where(
+        widened & (last_values["low"] > new_values["low"]),
+        NEGATIVE_INFINITY,
+        np.where(widened, last_values["low"], result["low"]),
+    )
+    result["high"] = np.where(
+        widened & (last_values["high"] < new_values["high"]),
+        POSITIVE_INFINITY,
+        np.where(widened, last_values["high"], result["high"]),
+    )
+    return result
+
+
+def narrow_intervals(last_values: np.ndarray, new_values: np.ndarray) -> np.ndarray:
+    result = meet_intervals(last_values, new_values)
+
+    bottom = last_values["kind"] == IntervalKind.BOTTOM
+    result[bottom] = last_values[bottom]
+
+    narrowed = (last_values["kind"] == IntervalKind.INT) & (
+        new_values["kind"] == IntervalKind.INT
+    )
+    result["kind"][narrowed] = IntervalKind.INT
+    result["low"] = np.where(
+        narrowed,
+        np.where(
+            last_values["low"] == NEGATIVE_INFINITY,
+            new_values["low"],
+            last_values["low"],
+        ),
+        result["low"],
+    )
+    result["high"] = np.where(
+        narrowed,
+        np.where(
+            last_values["high"] == POSITIVE_INFINITY,
+            new_values["high"],
+            last_values["high"],
+        ),
+        result["high"],
+    )
+    return result
+
+
+def is_descendant_intervals(values: np.ndarray, descendants: np.ndarray) -> np.ndarray:
+    kinds = values["kind"]
+    descendant_kinds = descendants["kind"]
+
+    bounded = (kinds == descendant_kinds) & (
+        (kinds == IntervalKind.INT) | (kinds == IntervalKind.BOOL)
+    )
+    included = (descendants["low"] <= values["low"]) & (
+        values["high"] <= descendants["high"]
+    )
+
+    return ~(values == descendants) & (
+        (kinds == IntervalKind.BOTTOM)
+        | (descendant_kinds == IntervalKind.TOP)
+        | (bounded & included)
+    )
+
+
+def store_value(
+    intervals: np.ndarray,
+    overflows: dict[int, IntervalAnalysisValue],
+    index: int,
+    value: IntervalAnalysisValue,
+) -> None:
+    intervals[index] = encoded = encode_value(value)
+    if encoded[0] == IntervalKind.OVERFLOW:
+        overflows[index] = value
+    else:
+        overflows.pop(index, None)
+
+
+class ArrayIntervalEnvironment(DerivableEnvironment[IntervalAnalysisValue]):
+    __slots__ = ("indices", "_intervals", "_overflows")
+
+    def __init__(
+        self,
+        indices: Mapping[str, int],
+        intervals: np.ndarray,
+        overflows: dict[int, IntervalAnalysisValue] | None = None,
+    ):
+        self.indices = indices
+        self._intervals = intervals
+        self._overflows = {} if overflows is None else overflows
+
+    @classmethod
+    def of(
+        cls,
+        environment: Mapping[str, IntervalAnalysisValue],
+        indices: Mapping[str, int] | None = None,
+    ) -> ArrayIntervalEnvironment:
+        if indices is None:
+            indices = {variable: index for index, variable in enumerate(environment)}
+
+        intervals = np.zeros(len(indices), dtype=INTERVAL_DTYPE)
+        overflows: dict[int, IntervalAnalysisValue] = {}
+        for variable, value in environment.items():
+            store_value(intervals, overflows, indices[variable], value)
+
+        return cls(indices, intervals, overflows)
+
+    def _compatible(
+        self, other: Mapping[str, IntervalAnalysisValue]
+    ) -> ArrayIntervalEnvironment | None:
+        if (
+            isinstance(other, ArrayIntervalEnvironment)
+            and other.indices is self.indices
+        ):
+            return other
+        return None
+
+    def _value(self, index: int) -> IntervalAnalysisValue:
+        kind, low, high = self._intervals[index].item()
+        if kind == IntervalKind.OVERFLOW:
+            return self._overflows[index]
+        return decode_value(kind, low, high)
+
+    def _combined(
+        self,
+        other: ArrayIntervalEnvironment,
+        intervals: np.ndarray,
+        combine: Callable[
+            [IntervalAnalysisValue, IntervalAnalysisValue], IntervalAnalysisValue
+        ],
+    ) -> ArrayIntervalEnvironment:
+        if not (self._overflows or other._overflows):
+            return ArrayIntervalEnvironment(self.indices, intervals)
+
+        overflows: dict[int, IntervalAnalysisValue] = {}
+        for index in self._overflows.keys() | other._overflows.keys():
+            value = combine(self._value(index), other._value(index))
+            store_value(intervals, overflows, index, value)
+
+        return ArrayIntervalEnvironment(self.indices, intervals, overflows)
+
+    def updated(
+        self, changes: Mapping[str, IntervalAnalysisValue]
+    ) -> ArrayIntervalEnvironment:
+        if not changes:
+            return self
+
+        intervals = self._intervals.copy()
+        overflows = dict(self._overflows)
+        for variable, value in changes.items():
+            store_value(intervals, overflows, self.indices[variable], value)
+
+        return ArrayIntervalEnvironment(self.indices, intervals, overflows)
+
+    def joined(
+        self,
+        lattice: Lattice[IntervalAnalysisValue],
+        other: Mapping[str, IntervalAnalysisValue],
+    ) -> Mapping[str, IntervalAnalysisValue]:
+        if (compatible := self._compatible(other)) is not None:
+            return self._combined(
+                compatible,
+                join_intervals(self._intervals, compatible._intervals),
+                lattice.join,
+            )
+        return super().joined(lattice, other)
+
+    def met(self, other: ArrayIntervalEnvironment) -> ArrayIntervalEnvironment:
+        return self._combined(
+            other,
+            meet_intervals(self._intervals, other._intervals),
+            AbstractIntervalAnalysisScene.lattice.meet,
+        )
+
+    def widened(
+        self,
+        widening_operator: WideningOperator[IntervalAnalysisValue],
+        new: Mapping[str, IntervalAnalysisValue],
+    ) -> Mapping[str, IntervalAnalysisValue]:
+        if (
+            type(widening_operator) is IntervalAnalysisWideningOperator
+            and (compatible := self._compatible(new)) is not None
+        ):
+
+            def widen(
+                last_value: IntervalAnalysisValue, new_value: IntervalAnalysisValue
+            ) -> IntervalAnalysisValue:
+                return widening_operator.apply(last_value, new_value)[0]
+
+            return self._combined(
+                compatible,
+                widen_intervals(self._intervals, compatible._intervals),
+                widen,
+            )
+        return super().widened(widening_operator, new)
+
+    def narrowed(
+        self,
+        narrowing_operator: NarrowingOperator[IntervalAnalysisValue],
+        new: Mapping[str, IntervalAnalysisValue],
+    ) -> Mapping[str, IntervalAnalysisValue]:
+        if (
+            type(narrowing_operator) is IntervalAnalysisNarrowingOperator
+            and (compatible := self._compatible(new)) is not None
+        ):
+
+            def narrow(
+                last_value: IntervalAnalysisValue, new_value: IntervalAnalysisValue
+            ) -> IntervalAnalysisValue:
+                return narrowing_operator.apply(last_value, new_value)[0]
+
+            return self._combined(
+                compatible,
+                narrow_intervals(self._intervals, compatible._intervals),
+                narrow,
+            )
+        return super().narrowed(narrowing_operator, new)
+
+    def is_descendant(self, descendant: ArrayIntervalEnvironment) -> np.ndarray:
+        descendants = is_descendant_intervals(self._intervals, descendant._intervals)
+        lattice = AbstractIntervalAnalysisScene.lattice
+        for index in self._overflows.keys() | descendant._overflows.keys():
+            descendants[index] = lattice.is_descendant(
+                self._value(index), descendant._value(index)
+            )
+        return descendants
+
+    def __getitem__(self, variable: str) -> IntervalAnalysisValue:
+        return self._value(self.indices[variable])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.indices)
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __eq__(self, other: object) -> bool:
+        if (
+            isinstance(other, ArrayIntervalEnvironment)
+            and other.indices is self.indices
+        ):
+            return (
+                np.array_equal(self._intervals, other._intervals)
+                and self._overflows == other._overflows
+            )
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+def solve_array(
+    function: Function,
+    cfg: CompactControlFlowGraph | None = None,
+    order: WorklistOrder = WorklistOrder.FIFO,
+    widening_points: WideningPoints = WideningPoints.EVERYWHERE,
+    widening_delay: int = 0,
+    narrowing: bool = False,
+) -> FixpointResult[IntervalAnalysisValue]:
+    scene = AbstractIntervalAnalysisScene
+
+    return solve(
+        function,
+        scene.lattice,
+        scene.control_flow_function,
+        scene.condition_update_function,
+        scene.widening_operator,
+        ArrayIntervalEnvironment.of(initial_environment(function, scene.lattice)),
+        cfg=cfg,
+        order=order,
+        widening_points=widening_points,
+        widening_delay=widening_delay,
+        narrowing_operator=scene.narrowing_operator if narrowing else None,
+    )
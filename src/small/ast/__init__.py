@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from enum import StrEnum
-from typing import TYPE_CHECKING
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, cast
 
 import networkx as nx
 from manim_dataflow_analysis import *
 
+from small.cfg import CompactControlFlowGraph
+from small.profiling import phase
+
 if TYPE_CHECKING:
+    from small.ast.source import SourceSlice
     from small.ast.symbol_table import FunctionSymbolTable
 
 # Types
@@ -245,13 +250,42 @@ class FunctionCall:
 # Statements
 
 
+class CachedHashStatement:
+    @cached_property
+    def _hash(self) -> int:
+        return hash(self._fields())
+
+    def _fields(self) -> tuple[Any, ...]:
+        return tuple(getattr(self, field.name) for field in fields(self))  # type: ignore
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        elif other.__class__ is not self.__class__:
+            return NotImplemented
+
+        other = cast(CachedHashStatement, other)
+        return self._hash == other._hash and self._fields() == other._fields()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # String hashes are salted per process, so the cache must not be pickled.
+        state = self.__dict__.copy()
+        state.pop("_hash", None)
+        return state
+
+
 def sequence_cfg(
     statements: tuple[Statement, ...],
     previous_statements: list[tuple[Statement, BoolExpression, int | None]],
+    graph: nx.DiGraph[ProgramPoint] | None = None,
 ) -> tuple[
     list[tuple[Statement, BoolExpression, int | None]], nx.DiGraph[ProgramPoint]
 ]:
-    graph: nx.DiGraph[ProgramPoint] = nx.DiGraph()
+    if graph is None:
+        graph = nx.DiGraph()
 
     for statement in statements:
         for previous_statement, condition, edge_case in previous_statements:
@@ -262,15 +296,13 @@ def sequence_cfg(
                 condition=condition,
             )
 
-        previous_statements, statement_graph = statement.to_cfg()
-
-        graph = nx.compose(graph, statement_graph)
+        previous_statements, _ = statement.to_cfg(graph)
 
     return previous_statements, graph
 
 
-@dataclass(frozen=True)
-class Assignment(AstStatement):
+@dataclass(frozen=True, eq=False)
+class Assignment(CachedHashStatement, AstStatement):
     line_number: int
     variable: Variable
     value: Expression | FunctionCall
@@ -281,15 +313,18 @@ class Assignment(AstStatement):
 
     def to_cfg(
         self,
+        graph: nx.DiGraph[ProgramPoint] | None = None,
     ) -> tuple[list[tuple[Statement, BoolExpression, int | None]], nx.DiGraph]:
-        return [(self, BoolConstant(True), None)], nx.DiGraph()
+        return [(self, BoolConstant(True), None)], (
+            graph if graph is not None else nx.DiGraph()
+        )
 
     def __str__(self) -> str:
         return f"{self.header};"
 
 
-@dataclass(frozen=True)
-class IfElse(AstStatement):
+@dataclass(frozen=True, eq=False)
+class IfElse(CachedHashStatement, AstStatement):
     line_number: int
     condition: BoolExpression
     if_body: tuple[Statement, ...]
@@ -301,18 +336,20 @@ class IfElse(AstStatement):
 
     def to_cfg(
         self,
+        graph: nx.DiGraph[ProgramPoint] | None = None,
     ) -> tuple[list[tuple[Statement, BoolExpression, int | None]], nx.DiGraph]:
-        if_next_statements, if_graph = sequence_cfg(
+        if_next_statements, graph = sequence_cfg(
             self.if_body,
             [(self, self.condition, True)],
+            graph,
         )
-        else_next_statements, else_graph = sequence_cfg(
+        else_next_statements, graph = sequence_cfg(
             self.else_body,
             [(self, self.condition.neg(), False)],
+            graph,
         )
 
         next_statements = if_next_statements + else_next_statements
-        graph = nx.compose(if_graph, else_graph)
 
         return next_statements, graph
 
@@ -328,8 +365,8 @@ class IfElse(AstStatement):
         )
 
 
-@dataclass(frozen=True)
-class While(AstStatement):
+@dataclass(frozen=True, eq=False)
+class While(CachedHashStatement, AstStatement):
     line_number: int
     condition: BoolExpression
     body: tuple[Statement, ...]
@@ -340,9 +377,10 @@ class While(AstStatement):
 
     def to_cfg(
         self,
+        graph: nx.DiGraph[ProgramPoint] | None = None,
     ) -> tuple[list[tuple[Statement, BoolExpression, int | None]], nx.DiGraph]:
         previous_statements, graph = sequence_cfg(
-            self.body, [(self, self.condition, True)]
+            self.body, [(self, self.condition, True)], graph
         )
 
         for previous_statement, condition, edge_case in previous_statements:
@@ -364,8 +402,8 @@ class While(AstStatement):
         )
 
 
-@dataclass(frozen=True)
-class Return(AstStatement):
+@dataclass(frozen=True, eq=False)
+class Return(CachedHashStatement, AstStatement):
     line_number: int
     value: Expression
 
@@ -375,8 +413,11 @@ class Return(AstStatement):
 
     def to_cfg(
         self,
+        graph: nx.DiGraph[ProgramPoint] | None = None,
     ) -> tuple[list[tuple[Statement, BoolExpression, int | None]], nx.DiGraph]:
-        return [(self, BoolConstant(True), None)], nx.DiGraph()
+        return [(self, BoolConstant(True), None)], (
+            graph if graph is not None else nx.DiGraph()
+        )
 
     def __str__(self) -> str:
         return f"{self.header};"
@@ -395,15 +436,22 @@ class Function(AstFunction):
     parameters: tuple[str, ...] = ()
     variables: frozenset[str] = frozenset()
     body: tuple[Statement, ...] = ()
-    function_code: str | None = None
+    function_code: str | SourceSlice | None = None
 
     def to_cfg(self) -> tuple[ProgramPoint, nx.DiGraph[ProgramPoint]]:
-        _, graph = sequence_cfg(self.body, [])
+        if not self.body:
+            raise ValueError(f"Function {self.name} has no statements")
+
+        with phase("cfg"):
+            _, graph = sequence_cfg(self.body, [])
         return ProgramPoint(self.body[0].line_number, self.body[0]), graph
 
+    def to_compact_cfg(self) -> CompactControlFlowGraph:
+        return CompactControlFlowGraph.from_graph(*self.to_cfg())
+
     def __str__(self) -> str:
         if self.function_code is not None:
-            return self.function_code
+            return str(self.function_code)
         else:
             return "function %s(%s) {\n\t%s\n}" % (
                 self.name,
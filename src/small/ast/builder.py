@@ -1,10 +1,12 @@
+from collections import deque
 from contextlib import contextmanager
-from typing import Any, Generator, Self, cast
+from typing import Any, Generator, Iterable, Iterator, Self, cast
 
 from antlr4 import ParserRuleContext
 from antlr4.tree.Tree import TerminalNodeImpl
 
 from small import ast
+from small.ast.source import LineIndex, SourceSlice
 from small.ast.symbol_table import FunctionSymbolTable, RootSymbolTable
 from small.cst.small.SmallGrammarParser import SmallGrammarParser
 from small.cst.small.SmallGrammarVisitor import SmallGrammarVisitor
@@ -54,7 +56,7 @@ class SmallAstBuilder(SmallGrammarVisitor):
 
         self._root_symbol_table = root_symbol_table or RootSymbolTable()
         self._function_symbol_table = function_symbol_table
-        self._program = program
+        self._line_index = LineIndex(program) if program is not None else None
 
     @contextmanager
     def _scope(self) -> Generator[FunctionSymbolTable, None, None]:
@@ -106,10 +108,9 @@ class SmallAstBuilder(SmallGrammarVisitor):
                 cast(SmallGrammarParser.SequenceContext, ctx.stmtList())
             )
 
-        if self._program is not None:
-            function_code = "\n".join(
-                self._program.splitlines()[ctx.start.line - 1 : ctx.stop.line]
-            )
+        function_code: SourceSlice | None
+        if self._line_index is not None:
+            function_code = self._line_index.slice(ctx.start.line, ctx.stop.line)
         else:
             function_code = None
 
@@ -463,3 +464,52 @@ def build(
 ) -> tuple[ast.Function, ...]:
     builder = SmallAstBuilder(root_symbol_table=root_symbol_table, program=program)
     return builder.visitProgram(program_cst)
+
+
+def called_functions(ctx: ParserRuleContext) -> set[str]:
+    names = set()
+
+    nodes = [ctx]
+    while nodes:
+        node = nodes.pop()
+        if isinstance(node, SmallGrammarParser.FuncCallContext):
+            names.add(cast(str, term(node.IDENTIFIER()).getText()))
+        if isinstance(node, ParserRuleContext) and node.children is not None:
+            nodes.extend(node.children)
+
+    return names
+
+
+def iter_build(
+    functions_cst: Iterable[SmallGrammarParser.FunctionContext],
+    root_symbol_table: RootSymbolTable | None = None,
+    program: str | None = None,
+) -> Iterator[ast.Function]:
+    builder = SmallAstBuilder(root_symbol_table=root_symbol_table, program=program)
+
+    declared: set[str] = set()
+    blocked: dict[int, tuple[SmallGrammarParser.FunctionContext, set[str]]] = {}
+
+    for index, function_cst in enumerate(functions_cst):
+        name = cast(str, term(function_cst.IDENTIFIER()).getText())
+        missing = called_functions(function_cst) - declared - {name}
+
+        if missing:
+            blocked[index] = (function_cst, missing)
+            continue
+
+        ready = deque([function_cst])
+        while ready:
+            function = builder.visitFunction(ready.popleft())
+            declared.add(function.name)
+
+            yield function
+
+            for blocked_index, (blocked_cst, blocked_missing) in list(blocked.items()):
+                blocked_missing.discard(function.name)
+                if not blocked_missing:
+                    del blocked[blocked_index]
+                    ready.append(blocked_cst)
+
+    for function_cst, _ in blocked.values():
+        yield builder.visitFunction(function_cst)
@@ -0,0 +1,478 @@
+import re
+from contextlib import contextmanager
+from typing import Generator, NamedTuple
+
+from small import ast
+from small.ast.builder import (
+    CannotBuildAstException,
+    MissingScopeException,
+    UnsupportedRuleException,
+)
+from small.ast.source import LineIndex, SourceSlice
+from small.ast.symbol_table import FunctionSymbolTable, RootSymbolTable
+
+
+class InvalidSyntaxException(CannotBuildAstException, ValueError):
+    def __init__(self, message: str, line: int | None = None):
+        super().__init__(message, line)
+
+
+class Token(NamedTuple):
+    kind: str
+    text: str
+    line: int
+    column: int
+
+
+NUM = "NUM"
+
+IDENTIFIER = "IDENTIFIER"
+
+EOF = "<EOF>"
+
+KEYWORDS = frozenset(
+    ("if", "else", "while", "function", "return", "not", "and", "or", "True", "False")
+)
+
+MATH_OPERATORS = {
+    "+": ast.IntBinaryOperator.ADD,
+    "-": ast.IntBinaryOperator.SUB,
+    "*": ast.IntBinaryOperator.MUL,
+    "/": ast.IntBinaryOperator.DIV,
+}
+
+LOGIC_OPERATORS = {
+    "<": ast.IntComparisonOperator.LT,
+    ">": ast.IntComparisonOperator.GT,
+    "==": ast.EqualityOperator.EQ,
+    "!=": ast.EqualityOperator.NEQ,
+    ">=": ast.IntComparisonOperator.GTE,
+    "<=": ast.IntComparisonOperator.LTE,
+}
+
+NOP_OPERATORS = {
+    "==": ast.EqualityOperator.EQ,
+    "!=": ast.EqualityOperator.NEQ,
+    "and": ast.BoolComparisonOperator.AND,
+    "or": ast.BoolComparisonOperator.OR,
+}
+
+STATEMENT_STARTS = frozenset((IDENTIFIER, "if", "while", "return"))
+
+BOPRND_STARTS = frozenset((IDENTIFIER, "True", "False", "not"))
+
+TOKEN_PATTERN = re.compile(
+    r"(?P<newline>\r?\n)"
+    r"|(?P<skip>[ \t]+|//[^\n]*|/\*.*?\*/)"
+    r"|(?P<NUM>[0-9]+)"
+    r"|(?P<IDENTIFIER>[a-zA-Z][a-zA-Z0-9]*)"
+    r"|(?P<operator>[<>=!]=|[{}(),;=+\-*/<>])"
+    r"|(?P<error>.)",
+    re.DOTALL,
+)
+
+
+def tokenize(source: str) -> list[Token]:
+    tokens: list[Token] = []
+    line = 1
+    line_start = 0
+
+    for match in TOKEN_PATTERN.finditer(source):
+        kind = match.lastgroup
+        text = match.group()
+        column = match.start() - line_start
+
+        match kind:
+            case "newline":
+                line += 1
+                line_start = match.end()
+            case "skip":
+                if (newlines := text.count("\n")) > 0:
+                    line += newlines
+                    line_start = match.start() + text.rindex("\n") + 1
+            case "NUM":
+                tokens.append(Token(NUM, text, line, column))
+            case "IDENTIFIER":
+                tokens.append(
+                    Token(text if text in KEYWORDS else IDENTIFIER, text, line, column)
+                )
+            case "operator":
+                tokens.append(Token(text, text, line, column))
+            case _:
+                raise InvalidSyntaxException(
+                    f"{column}: token recognition error at: {text!r}", line
+                )
+
+    tokens.append(Token(EOF, EOF, line, len(source) - line_start))
+    return tokens
+
+
+class SmallParser:
+    def __init__(
+        self,
+        source: str,
+        root_symbol_table: RootSymbolTable | None = None,
+        function_symbol_table: FunctionSymbolTable | None = None,
+        program: str | None = None,
+    ):
+        self._tokens = tokenize(source)
+        self._position = 0
+
+        self._root_symbol_table = root_symbol_table or RootSymbolTable()
+        self._function_symbol_table = function_symbol_table
+        self._line_index = LineIndex(program) if program is not None else None
+        self._build_error: Exception | None = None
+
+    @contextmanager
+    def _scope(self) -> Generator[FunctionSymbolTable, None, None]:
+        if self._function_symbol_table is None:
+            raise MissingScopeException("No function scope defined")
+
+        yield self._function_symbol_table
+
+    @contextmanager
+    def _new_scope(
+        self, function_symbol_table: FunctionSymbolTable
+    ) -> Generator[FunctionSymbolTable, None, None]:
+        old_function_symbol_table = self._function_symbol_table
+
+        self._function_symbol_table = function_symbol_table
+
+        try:
+            yield function_symbol_table
+        finally:
+            self._function_symbol_table = old_function_symbol_table
+
+    # Tokens
+
+    def _peek(self, offset: int = 0) -> Token:
+        return self._tokens[min(self._position + offset, len(self._tokens) - 1)]
+
+    def _advance(self) -> Token:
+        token = self._tokens[self._position]
+        if token.kind != EOF:
+            self._position += 1
+        return token
+
+    def _expect(self, kind: str) -> Token:
+        token = self._peek()
+        if token.kind != kind:
+            raise self._error(token, kind)
+        return self._advance()
+
+    def _error(self, token: Token, expected: str) -> InvalidSyntaxException:
+        return InvalidSyntaxException(
+            f"{token.column}: mismatched input {token.text!r} expecting {expected}",
+            token.line,
+        )
+
+    # Errors
+
+    def _defer(self, error: Exception, cause: Exception | None = None) -> None:
+        # Like ANTLR, syntax errors are reported before the errors of the builder.
+        if self._build_error is None:
+            error.__cause__ = cause
+            self._build_error = error
+
+    def _raise_deferred(self) -> None:
+        if self._build_error is not None:
+            raise self._build_error
+
+    # Programs
+
+    def parse_program(self) -> tuple[ast.Function, ...]:
+        # Like ANTLR, `program: function*` stops at the first token that cannot
+        # start a function instead of requiring the end of the input.
+        functions = []
+        while self._peek().kind == "function":
+            functions.append(self._function())
+
+        self._raise_deferred()
+        return tuple(functions)
+
+    def parse_function(self) -> ast.Function:
+        function = self._function()
+
+        self._raise_deferred()
+        return function
+
+    def _function(self) -> ast.Function:
+        start = self._expect("function")
+        name = self._expect(IDENTIFIER).text
+
+        self._expect("(")
+        params: tuple[str, ...]
+        if self._peek().kind == IDENTIFIER:
+            params = self._param_list()
+        else:
+            params = ()
+        self._expect(")")
+
+        try:
+            function_symbol_table = self._root_symbol_table.declare_function(
+                name, params
+            )
+        except ValueError as e:
+            self._defer(e)
+            function_symbol_table = RootSymbolTable().declare_function(name, params)
+
+        self._expect("{")
+        with self._new_scope(function_symbol_table) as symbol_table:
+            statements = self._stmt_list()
+        stop = self._expect("}")
+
+        function_code: SourceSlice | None
+        if self._line_index is not None:
+            function_code = self._line_index.slice(start.line, stop.line)
+        else:
+            function_code = None
+
+        return ast.Function(
+            start.line,
+            name,
+            params,
+            symbol_table.variables().difference(params),
+            statements,
+            function_code,
+        )
+
+    def _param_list(self) -> tuple[str, ...]:
+        params = [self._expect(IDENTIFIER).text]
+        while self._peek().kind == ",":
+            self._advance()
+            params.append(self._expect(IDENTIFIER).text)
+        return tuple(params)
+
+    # Statements
+
+    def _sequence(self) -> tuple[ast.Statement, ...]:
+        if self._peek().kind != "{":
+            return (self._stmt(),)
+
+        self._advance()
+        statements = self._stmt_list()
+        self._expect("}")
+        return statements
+
+    def _stmt_list(self) -> tuple[ast.Statement, ...]:
+        statements = []
+        while self._peek().kind in STATEMENT_STARTS:
+            statements.append(self._stmt())
+        return tuple(statements)
+
+    def _stmt(self) -> ast.Statement:
+        match self._peek().kind:
+            case "IDENTIFIER":
+                return self._assign_stmt()
+            case "if":
+                return self._if_stmt()
+            case "while":
+                return self._while_stmt()
+            case "return":
+                return self._return_stmt()
+            case _:
+                raise self._error(self._peek(), "a statement")
+
+    def _assign_stmt(self) -> ast.Assignment:
+        start = self._expect(IDENTIFIER)
+        self._expect("=")
+
+        assignment_expr: ast.Expression | ast.FunctionCall
+        if self._peek().kind == IDENTIFIER and self._peek(1).kind == "(":
+            assignment_expr = self._func_call()
+        else:
+            assignment_expr = self._expr()
+        self._expect(";")
+
+        with self._scope() as symbol_table:
+            try:
+                symbol_table.use(start.text, assignment_expr.type(symbol_table))
+            except ValueError as e:
+                self._defer(UnsupportedRuleException(str(e), start.line), e)
+
+        return ast.Assignment(start.line, ast.Variable(start.text), assignment_expr)
+
+    def _if_stmt(self) -> ast.IfElse:
+        start = self._expect("if")
+        self._expect("(")
+        condition = self._bool_expr()
+        self._expect(")")
+        then_statements = self._sequence()
+        self._expect("else")
+        else_statements = self._sequence()
+
+        return ast.IfElse(start.line, condition, then_statements, else_statements)
+
+    def _while_stmt(self) -> ast.While:
+        start = self._expect("while")
+        self._expect("(")
+        condition = self._bool_expr()
+        self._expect(")")
+        statements = self._sequence()
+
+        return ast.While(start.line, condition, statements)
+
+    def _return_stmt(self) -> ast.Return:
+        start = self._expect("return")
+        expr = self._expr()
+        self._expect(";")
+
+        with self._scope() as symbol_table:
+            try:
+                symbol_table.return_(expr.type(symbol_table))
+            except ValueError as e:
+                self._defer(UnsupportedRuleException(str(e), start.line), e)
+
+        return ast.Return(start.line, expr)
+
+    # Expressions
+
+    def _func_call(self) -> ast.FunctionCall:
+        start = self._expect(IDENTIFIER)
+        self._expect("(")
+
+        arguments: list[ast.Expression] = []
+        if self._peek().kind != ")":
+            arguments.append(self._expr())
+            while self._peek().kind == ",":
+                self._advance()
+                arguments.append(self._expr())
+        self._expect(")")
+
+        with self._scope() as symbol_table:
+            try:
+                self._root_symbol_table.call(
+                    start.text,
+                    tuple(expression.type(symbol_table) for expression in arguments),
+                )
+            except ValueError as e:
+                self._defer(UnsupportedRuleException(str(e), start.line), e)
+
+        return ast.FunctionCall(start.text, tuple(arguments))
+
+    def _expr(self) -> ast.Expression:
+        kind = self._peek().kind
+        next_kind = self._peek(1).kind
+
+        if kind in (NUM, IDENTIFIER):
+            if next_kind in MATH_OPERATORS:
+                return self._bin_math_op()
+            elif next_kind in LOGIC_OPERATORS or (
+                kind == IDENTIFIER and next_kind in NOP_OPERATORS
+            ):
+                return self._bool_expr()
+            else:
+                return self._noprnd()
+
+        return self._bool_expr()
+
+    def _bool_expr(self) -> ast.BoolExpression:
+        kind = self._peek().kind
+        next_kind = self._peek(1).kind
+
+        # Like ANTLR, `x == y` is a relOp because it is the first matching rule.
+        if kind == NUM or (
+            kind == IDENTIFIER
+            and next_kind in LOGIC_OPERATORS
+            and not (next_kind in NOP_OPERATORS and self._starts_boprnd(2))
+        ):
+            return self._bin_logic_op()
+
+        left = self._boprnd()
+
+        if (operator := NOP_OPERATORS.get(self._peek().kind)) is None:
+            return left
+
+        self._advance()
+        right = self._boprnd()
+
+        match operator:
+            case ast.EqualityOperator():
+                return ast.BoolEqualComparisonExpression(left, operator, right)
+            case ast.BoolComparisonOperator():
+                return ast.BoolComparisonExpression(left, operator, right)
+            case _:
+                raise ValueError(f"Unsupported operator: {operator}")
+
+    def _starts_boprnd(self, offset: int) -> bool:
+        kind = self._peek(offset).kind
+        return kind in BOPRND_STARTS and (
+            kind != "not" or self._peek(offset + 1).kind == IDENTIFIER
+        )
+
+    def _bin_math_op(self) -> ast.IntExpression:
+        left = self._noprnd()
+        operator = MATH_OPERATORS[self._advance().kind]
+        right = self._noprnd()
+
+        return ast.IntBinaryExpression(left, operator, right)
+
+    def _bin_logic_op(self) -> ast.BoolExpression:
+        left = self._noprnd()
+
+        token = self._peek()
+        if (operator := LOGIC_OPERATORS.get(token.kind)) is None:
+            raise self._error(token, "a comparison operator")
+        self._advance()
+
+        right = self._noprnd()
+
+        match operator:
+            case ast.IntComparisonOperator():
+                return ast.IntComparisonExpression(left, operator, right)
+            case ast.EqualityOperator():
+                return ast.IntEqualComparisonExpression(left, operator, right)
+            case _:
+                raise ValueError(f"Unsupported operator: {operator}")
+
+    def _noprnd(self) -> ast.IntExpression:
+        token = self._advance()
+
+        match token.kind:
+            case "IDENTIFIER":
+                with self._scope() as symbol_table:
+                    try:
+                        symbol_table.use(token.text, ast.SmallType.INT)
+                    except ValueError as e:
+                        self._defer(UnsupportedRuleException(str(e), token.line), e)
+
+                return ast.Variable(token.text)
+            case "NUM":
+                return ast.IntConstant(int(token.text))
+            case _:
+                raise self._error(token, "an integer operand")
+
+    def _boprnd(self) -> ast.BoolExpression:
+        token = self._advance()
+
+        match token.kind:
+            case "not" | "IDENTIFIER":
+                identifier = self._expect(IDENTIFIER) if token.kind == "not" else token
+
+                with self._scope() as symbol_table:
+                    try:
+                        symbol_table.use(identifier.text, ast.SmallType.BOOL)
+                    except ValueError as e:
+                        self._defer(UnsupportedRuleException(str(e), token.line), e)
+
+                expression = ast.Variable(identifier.text)
+
+                if token.kind == "not":
+                    return ast.BoolNotExpression(expression)
+                else:
+                    return expression
+            case "True":
+                return ast.BoolConstant(True)
+            case "False":
+                return ast.BoolConstant(False)
+            case _:
+                raise self._error(token, "a boolean operand")
+
+
+def parse_program(
+    source: str,
+    root_symbol_table: RootSymbolTable | None = None,
+    program: str | None = None,
+) -> tuple[ast.Function, ...]:
+    parser = SmallParser(source, root_symbol_table=root_symbol_table, program=program)
+    return parser.parse_program()
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import re
+from array import array
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
+
+NEWLINE_PATTERN = re.compile("\n")
+
+
+@dataclass(frozen=True, eq=False)
+class SourceSlice:
+    source: str
+    start: int
+    stop: int
+
+    @cached_property
+    def text(self) -> str:
+        return "\n".join(self.source[self.start : self.stop].splitlines())
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SourceSlice):
+            return self.text == other.text
+        elif isinstance(other, str):
+            return self.text == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.text)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The text is rebuilt from the source, so it is not pickled twice.
+        state = self.__dict__.copy()
+        state.pop("text", None)
+        return state
+
+
+class LineIndex:
+    def __init__(self, source: str):
+        self.source = source
+        self._line_starts = array("q", [0])
+        self._line_starts.extend(
+            match.end() for match in NEWLINE_PATTERN.finditer(source)
+        )
+
+    def __len__(self) -> int:
+        return len(self._line_starts)
+
+    def slice(self, first_line: int, last_line: int) -> SourceSlice:
+        start = self._line_starts[first_line - 1]
+        if last_line < len(self._line_starts):
+            stop = self._line_starts[last_line] - 1
+        else:
+            stop = len(self.source)
+
+        return SourceSlice(self.source, start, stop)
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+import networkx as nx
+
+if TYPE_CHECKING:
+    from manim_dataflow_analysis import ProgramPoint
+
+    from small.ast import BoolExpression
+
+WeakTopologicalOrder = list["int | tuple[int, WeakTopologicalOrder]"]
+
+
+def _csr(keys: array, size: int) -> tuple[array, array]:
+    offsets = array("i", bytes(4 * (size + 1)))
+    for key in keys:
+        offsets[key + 1] += 1
+    for node in range(size):
+        offsets[node + 1] += offsets[node]
+
+    cursors = offsets[:-1]
+    edges = array("i", bytes(4 * len(keys)))
+    for edge, key in enumerate(keys):
+        edges[cursors[key]] = edge
+        cursors[key] += 1
+
+    return offsets, edges
+
+
+@dataclass(frozen=True)
+class CompactControlFlowGraph:
+    program_points: tuple[ProgramPoint, ...]
+    edge_sources: array
+    edge_targets: array
+    edge_cases: tuple[bool | None, ...]
+    edge_conditions: tuple[BoolExpression, ...]
+    successor_offsets: array
+    successor_edges: array
+    predecessor_offsets: array
+    predecessor_edges: array
+    entry: int = 0
+
+    @classmethod
+    def from_graph(
+        cls, entry_point: ProgramPoint, graph: nx.DiGraph[ProgramPoint]
+    ) -> CompactControlFlowGraph:
+        program_points = (entry_point,) + tuple(
+            program_point
+            for program_point in graph.nodes
+            if program_point != entry_point
+        )
+        indices = {
+            program_point: node for node, program_point in enumerate(program_points)
+        }
+
+        edge_sources = array("i")
+        edge_targets = array("i")
+        edge_cases: list[bool | None] = []
+        edge_conditions: list[BoolExpression] = []
+        for source, target, data in graph.edges(data=True):
+            edge_sources.append(indices[source])
+            edge_targets.append(indices[target])
+            edge_cases.append(data["case"])
+            edge_conditions.append(data["condition"])
+
+        successor_offsets, successor_edges = _csr(edge_sources, len(program_points))
+        predecessor_offsets, predecessor_edges = _csr(edge_targets, len(program_points))
+
+        return cls(
+            program_points,
+            edge_sources,
+            edge_targets,
+            tuple(edge_cases),
+            tuple(edge_conditions),
+            successor_offsets,
+            successor_edges,
+            predecessor_offsets,
+            predecessor_edges,
+        )
+
+    @cached_property
+    def indices(self) -> dict[ProgramPoint, int]:
+        return {
+            program_point: node
+            for node, program_point in enumerate(self.program_points)
+        }
+
+    @cached_property
+    def loop_heads(self) -> frozenset[int]:
+        ranks = self.reverse_postorder_ranks()
+        return frozenset(
+            target
+            for source, target in zip(self.edge_sources, self.edge_targets, strict=True)
+            if ranks[target] <= ranks[source]
+        )
+
+    def __len__(self) -> int:
+        return len(self.program_points)
+
+    def outgoing_edges(self, node: int) -> array:
+        return self.successor_edges[
+            self.successor_offsets[node] : self.successor_offsets[node + 1]
+        ]
+
+    def incoming_edges(self, node: int) -> array:
+        return self.predecessor_edges[
+            self.predecessor_offsets[node] : self.predecessor_offsets[node + 1]
+        ]
+
+    def successors(self, node: int) -> list[int]:
+        return [self.edge_targets[edge] for edge in self.outgoing_edges(node)]
+
+    def predecessors(self, node: int) -> list[int]:
+        return [self.edge_sources[edge] for edge in self.incoming_edges(node)]
+
+    def reverse_postorder(self) -> list[int]:
+        visited = {self.entry}
+        postorder = []
+
+        stack = [(self.entry, iter(self.successors(self.entry)))]
+        while stack:
+            node, successors = stack[-1]
+            for successor in successors:
+                if successor not in visited:
+                    visited.add(successor)
+                    stack.append((successor, iter(self.successors(successor))))
+                    break
+            else:
+                stack.pop()
+                postorder.append(node)
+
+        postorder.reverse()
+        return postorder
+
+    def reverse_postorder_ranks(self) -> list[int]:
+        ranks = list(range(len(self), 2 * len(self)))
+        for rank, node in enumerate(self.reverse_postorder()):
+            ranks[node] = rank
+        return ranks
+
+    def weak_topological_order(self) -> WeakTopologicalOrder:
+        order = self.reverse_postorder()
+        ranks = {node: rank for rank, node in enumerate(order)}
+
+        loops: dict[int, set[int]] = {}
+        for node in order:
+            for head in self.successors(node):
+                if ranks[head] > ranks[node]:
+                    continue
+
+                body = loops.setdefault(head, {head})
+                members = [node]
+                while members:
+                    member = members.pop()
+                    if member not in body:
+                        body.add(member)
+                        members.extend(
+                            predecessor
+                            for predecessor in self.predecessors(member)
+                            if predecessor in ranks
+                        )
+
+        visited: set[int] = set()
+
+        def components(nodes: list[int]) -> WeakTopologicalOrder:
+            elements: WeakTopologicalOrder = []
+
+            for node in nodes:
+                if node in visited:
+                    continue
+                visited.add(node)
+
+                if node in loops:
+                    body = sorted(loops[node] - visited, key=ranks.__getitem__)
+                    elements.append((node, components(body)))
+                else:
+                    elements.append(node)
+
+            return elements
+
+        return components(order)
+
+    def to_graph(self) -> tuple[ProgramPoint, nx.DiGraph[ProgramPoint]]:
+        graph: nx.DiGraph[ProgramPoint] = nx.DiGraph()
+        graph.add_nodes_from(self.program_points)
+
+        for edge, (source, target) in enumerate(
+            zip(self.edge_sources, self.edge_targets, strict=True)
+        ):
+            graph.add_edge(
+                self.program_points[source],
+                self.program_points[target],
+                case=self.edge_cases[edge],
+                condition=self.edge_conditions[edge],
+            )
+
+        return self.program_points[self.entry], graph
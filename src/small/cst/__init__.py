@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from antlr4 import CommonTokenStream, InputStream
 from antlr4.Recognizer import ConsoleErrorListener
 
@@ -5,7 +7,7 @@ from small.cst.small.SmallGrammarLexer import SmallGrammarLexer
 from small.cst.small.SmallGrammarParser import SmallGrammarParser
 
 
-def parse(stream: InputStream):
+def create_parser(stream: InputStream) -> tuple[SmallGrammarParser, list[str]]:
     lexer = SmallGrammarLexer(stream)
     tokens = CommonTokenStream(lexer)
     parser = SmallGrammarParser(tokens)
@@ -27,9 +29,30 @@ def parse(stream: InputStream):
 
     parser.addErrorListener(ErrorListener())
 
+    return parser, errors
+
+
+def parse(stream: InputStream):
+    parser, errors = create_parser(stream)
+
     cst = parser.program()
 
     if errors:
         raise ValueError("\n".join(errors))
 
     return cst
+
+
+def parse_functions(
+    stream: InputStream,
+) -> Iterator[SmallGrammarParser.FunctionContext]:
+    parser, errors = create_parser(stream)
+    tokens = parser.getTokenStream()
+
+    while tokens.LA(1) == SmallGrammarParser.FUNCTION:
+        cst = parser.function()
+
+        if errors:
+            raise ValueError("\n".join(errors))
+
+        yield cst
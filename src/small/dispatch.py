@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Generic, TypeVar, cast
+
+from small.ast import Assignment, IntBinaryExpression
+
+if TYPE_CHECKING:
+    from manim_dataflow_analysis import AbstractEnvironment, AstStatement
+
+L = TypeVar("L")
+
+StatementShape = tuple[Any, ...]
+
+Rule = Callable[[Any, Assignment, Any], tuple[dict[str, Any], int]]
+
+
+def statement_shape(statement: AstStatement) -> StatementShape:
+    if type(statement) is not Assignment:
+        return (type(statement),)
+
+    value = cast(Assignment, statement).value
+    if type(value) is IntBinaryExpression:
+        return (Assignment, type(value.left), value.operator, type(value.right))
+
+    return (Assignment, type(value))
+
+
+def binary_operands(statement: Assignment) -> tuple[Any, Any]:
+    value = cast(IntBinaryExpression, statement.value)
+    return value.left, value.right
+
+
+class DispatchFlowFunction(Generic[L]):
+    rules: ClassVar[dict[StatementShape, Rule]] = {}
+
+    default_rule: ClassVar[Rule | None] = None
+
+    def get_variables(
+        self,
+        statement: AstStatement,
+        abstract_environment: AbstractEnvironment[L],
+    ) -> tuple[dict[str, L], int]:
+        shape = statement_shape(statement)
+        rule = self.rules.get(shape)
+
+        if rule is None and shape[0] is Assignment:
+            rule = type(self).default_rule
+
+        if rule is None:
+            return super().get_variables(statement, abstract_environment)  # type: ignore
+
+        return rule(self, statement, abstract_environment)  # type: ignore
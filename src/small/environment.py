@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Generic, Iterator, Mapping, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from manim_dataflow_analysis import Lattice, WideningOperator
+
+    from small.fixpoint import NarrowingOperator
+
+L = TypeVar("L")
+
+MAX_DEPTH = 32
+
+
+class DerivableEnvironment(Mapping[str, L], ABC, Generic[L]):
+    __slots__ = ()
+
+    @abstractmethod
+    def updated(self, changes: Mapping[str, L]) -> DerivableEnvironment[L]: ...
+
+    def joined(self, lattice: Lattice[L], other: Mapping[str, L]) -> Mapping[str, L]:
+        return combine_environments(lattice.join, self, other)
+
+    def widened(
+        self, widening_operator: WideningOperator[L], new: Mapping[str, L]
+    ) -> Mapping[str, L]:
+        def widen(last_value: L, new_value: L) -> L:
+            return widening_operator.apply(last_value, new_value)[0]
+
+        return combine_environments(widen, self, new)
+
+    def narrowed(
+        self, narrowing_operator: NarrowingOperator[L], new: Mapping[str, L]
+    ) -> Mapping[str, L]:
+        def narrow(last_value: L, new_value: L) -> L:
+            return narrowing_operator.apply(last_value, new_value)[0]
+
+        return combine_environments(narrow, self, new)
+
+
+class PersistentEnvironment(DerivableEnvironment[L]):
+    __slots__ = ("_changes", "_depth", "_parent", "_root")
+
+    _changes: dict[str, L]
+    _depth: int
+    _parent: PersistentEnvironment[L] | None
+    _root: PersistentEnvironment[L]
+
+    def __init__(self, values: Mapping[str, L] | None = None):
+        self._changes = {} if values is None else dict(values)
+        self._depth = 0
+        self._parent = None
+        self._root = self
+
+    @classmethod
+    def of(cls, environment: Mapping[str, L]) -> PersistentEnvironment[L]:
+        if isinstance(environment, PersistentEnvironment):
+            return environment
+        return cls(environment)
+
+    def updated(self, changes: Mapping[str, L]) -> PersistentEnvironment[L]:
+        changes = {
+            variable: value
+            for variable, value in changes.items()
+            if variable not in self or self[variable] != value
+        }
+        if not changes:
+            return self
+
+        if not changes.keys() <= self._root._changes.keys():
+            return PersistentEnvironment({**self, **changes})
+
+        environment = object.__new__(PersistentEnvironment)
+        environment._root = self._root
+
+        if self._depth >= MAX_DEPTH:
+            root = self._root._changes
+            values = {**self._flatten(), **changes}
+            environment._changes = {
+                variable: value
+                for variable, value in values.items()
+                if root[variable] != value
+            }
+            environment._depth = 1
+            environment._parent = self._root
+        else:
+            environment._changes = changes
+            environment._depth = self._depth + 1
+            environment._parent = self
+
+        return environment
+
+    def _flatten(self) -> dict[str, L]:
+        values: dict[str, L] = {}
+
+        environment: PersistentEnvironment[L] | None = self
+        while environment is not None:
+            for variable, value in environment._changes.items():
+                values.setdefault(variable, value)
+            environment = environment._parent
+
+        return values
+
+    def __getitem__(self, variable: str) -> L:
+        environment: PersistentEnvironment[L] | None = self
+        while environment is not None:
+            changes = environment._changes
+            if variable in changes:
+                return changes[variable]
+            environment = environment._parent
+
+        raise KeyError(variable)
+
+    def __contains__(self, variable: object) -> bool:
+        return variable in self._root._changes
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._root._changes)
+
+    def __len__(self) -> int:
+        return len(self._root._changes)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PersistentEnvironment) and other._root is self._root:
+            return all(
+                self[variable] == other[variable]
+                for variable in changed_variables(self, other)
+            )
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._flatten()!r})"
+
+
+def changed_variables(
+    environment1: PersistentEnvironment[L], environment2: PersistentEnvironment[L]
+) -> set[str]:
+    if environment1._root is not environment2._root:
+        return set(environment1) | set(environment2)
+
+    variables: set[str] = set()
+
+    while environment1 is not environment2:
+        if environment1._depth < environment2._depth:
+            environment1, environment2 = environment2, environment1
+
+        variables.update(environment1._changes)
+        parent = environment1._parent
+        if parent is None:
+            break
+        environment1 = parent
+
+    return variables
+
+
+def updated_environment(
+    environment: Mapping[str, L], changes: Mapping[str, L]
+) -> Mapping[str, L]:
+    if isinstance(environment, DerivableEnvironment):
+        return environment.updated(changes)
+    return {**environment, **changes}
+
+
+def combine_environments(
+    combine: Callable[[L, L], L],
+    environment1: Mapping[str, L],
+    environment2: Mapping[str, L],
+) -> Mapping[str, L]:
+    if isinstance(environment1, PersistentEnvironment) and isinstance(
+        environment2, PersistentEnvironment
+    ):
+        return environment1.updated(
+            {
+                variable: combine(environment1[variable], environment2[variable])
+                for variable in changed_variables(environment1, environment2)
+            }
+        )
+
+    return {
+        variable: combine(value, environment2[variable])
+        for variable, value in environment1.items()
+    }
@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import heapq
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import (
+    TYPE_CHECKING,
+    Container,
+    Generic,
+    Iterable,
+    Mapping,
+    Sequence,
+    TypeVar,
+)
+
+from small.environment import (
+    DerivableEnvironment,
+    PersistentEnvironment,
+    combine_environments,
+    updated_environment,
+)
+from small.profiling import active_profile, count
+
+if TYPE_CHECKING:
+    from manim_dataflow_analysis import (
+        ConditionUpdateFunction,
+        ControlFlowFunction,
+        Lattice,
+        ProgramPoint,
+        WideningOperator,
+    )
+
+    from small.ast import BoolExpression, Function
+    from small.cfg import CompactControlFlowGraph, WeakTopologicalOrder
+
+L = TypeVar("L")
+
+Environment = Mapping[str, L]
+
+
+class WorklistOrder(StrEnum):
+    FIFO = "fifo"
+    REVERSE_POSTORDER = "rpo"
+    WEAK_TOPOLOGICAL = "wto"
+
+
+class WideningPoints(StrEnum):
+    EVERYWHERE = "everywhere"
+    LOOP_HEADS = "loop-heads"
+
+
+class NarrowingOperator(ABC, Generic[L]):
+    instances: list[tuple[str, str]]
+
+    @abstractmethod
+    def apply(self, last_value: L, new_value: L) -> tuple[L, int]: ...
+
+
+class Worklist:
+    def __init__(self, nodes: Iterable[int], ranks: Sequence[int] | None = None):
+        self._ranks = ranks
+        self._pending: set[int] = set()
+        self._fifo: deque[int] = deque()
+        self._heap: list[tuple[int, int]] = []
+        self.extend(nodes)
+
+    def __bool__(self) -> bool:
+        return bool(self._pending)
+
+    def extend(self, nodes: Iterable[int]) -> None:
+        for node in nodes:
+            if node in self._pending:
+                continue
+
+            self._pending.add(node)
+            if self._ranks is None:
+                self._fifo.append(node)
+            else:
+                heapq.heappush(self._heap, (self._ranks[node], node))
+
+    def pop(self) -> int:
+        if self._ranks is None:
+            node = self._fifo.popleft()
+        else:
+            _, node = heapq.heappop(self._heap)
+
+        self._pending.discard(node)
+        return node
+
+
+@dataclass(frozen=True)
+class FixpointResult(Generic[L]):
+    entry_point: ProgramPoint
+    environments: dict[ProgramPoint, Environment[L] | None]
+    iterations: int
+
+
+def initial_environment(function: Function, lattice: Lattice[L]) -> dict[str, L]:
+    environment = dict.fromkeys(sorted(function.variables), lattice.bottom())
+    environment.update(dict.fromkeys(function.parameters, lattice.top()))
+    return environment
+
+
+def join_environments(
+    lattice: Lattice[L], environment1: Environment[L], environment2: Environment[L]
+) -> Environment[L]:
+    count("joins")
+    if isinstance(environment1, DerivableEnvironment):
+        return environment1.joined(lattice, environment2)
+    return combine_environments(lattice.join, environment1, environment2)
+
+
+def widen_environments(
+    widening_operator: WideningOperator[L],
+    last_environment: Environment[L],
+    new_environment: Environment[L],
+) -> Environment[L]:
+    count("widenings")
+    if isinstance(last_environment, DerivableEnvironment):
+        return last_environment.widened(widening_operator, new_environment)
+
+    def widen(last_value: L, new_value: L) -> L:
+        return widening_operator.apply(last_value, new_value)[0]
+
+    return combine_environments(widen, last_environment, new_environment)
+
+
+def narrow_environments(
+    narrowing_operator: NarrowingOperator[L],
+    last_environment: Environment[L],
+    new_environment: Environment[L],
+) -> Environment[L]:
+    count("narrowings")
+    if isinstance(last_environment, DerivableEnvironment):
+        return last_environment.narrowed(narrowing_operator, new_environment)
+
+    def narrow(last_value: L, new_value: L) -> L:
+        return narrowing_operator.apply(last_value, new_value)[0]
+
+    return combine_environments(narrow, last_environment, new_environment)
+
+
+def solve(
+    function: Function,
+    lattice: Lattice[L],
+    control_flow_function: ControlFlowFunction[L],
+    condition_update_function: ConditionUpdateFunction[L, BoolExpression],
+    widening_operator: WideningOperator[L] | None = None,
+    entry_environment: Environment[L] | None = None,
+    cfg: CompactControlFlowGraph | None = None,
+    initial_environments: Mapping[ProgramPoint, Environment[L] | None] | None = None,
+    changed_program_points: Iterable[ProgramPoint] | None = None,
+    order: WorklistOrder = WorklistOrder.FIFO,
+    widening_points: WideningPoints = WideningPoints.EVERYWHERE,
+    widening_delay: int = 0,
+    narrowing_operator: NarrowingOperator[L] | None = None,
+    persistent_environments: bool = False,
+) -> FixpointResult[L]:
+    if cfg is None:
+        cfg = function.to_compact_cfg()
+
+    profile = active_profile()
+    start = time.perf_counter()
+
+    if profile is not None:
+        control_flow_function = profile.hit_counted(control_flow_function, "statements")
+        condition_update_function = profile.hit_counted(
+            condition_update_function, "conditions"
+        )
+
+    if entry_environment is None:
+        entry_environment = initial_environment(function, lattice)
+    if persistent_environments:
+        entry_environment = PersistentEnvironment.of(entry_environment)
+
+    environments: list[Environment[L] | None]
+    if initial_environments is None:
+        environments = [None] * len(cfg)
+    else:
+        environments = [
+            initial_environments.get(program_point)
+            for program_point in cfg.program_points
+        ]
+        if persistent_environments:
+            environments = [
+                None if environment is None else PersistentEnvironment.of(environment)
+                for environment in environments
+            ]
+
+    if widening_points == WideningPoints.LOOP_HEADS:
+        widening_nodes: Container[int] = cfg.loop_heads
+    else:
+        widening_nodes = range(len(cfg))
+
+    delays = [0] * len(cfg)
+
+    def update(node: int, descending: bool = False) -> bool:
+        input_environment = entry_environment if node == cfg.entry else None
+
+        for edge in cfg.incoming_edges(node):
+            predecessor_environment = environments[cfg.edge_sources[edge]]
+            if predecessor_environment is None:
+                continue
+
+            variables, _ = condition_update_function.get_variables(
+                cfg.edge_conditions[edge], predecessor_environment
+            )
+            if variables is None:
+                continue
+
+            edge_environment = updated_environment(predecessor_environment, variables)
+
+            if input_environment is None:
+                input_environment = edge_environment
+            else:
+                input_environment = join_environments(
+                    lattice, input_environment, edge_environment
+                )
+
+        if input_environment is None:
+            return False
+
+        variables, _ = control_flow_function.get_variables(
+            cfg.program_points[node], input_environment
+        )
+        output_environment = updated_environment(input_environment, variables)
+
+        last_environment = environments[node]
+        if last_environment is not None and node in widening_nodes:
+            if descending:
+                if narrowing_operator is not None:
+                    output_environment = narrow_environments(
+                        narrowing_operator, last_environment, output_environment
+                    )
+            elif widening_operator is not None:
+                if delays[node] >= widening_delay:
+                    output_environment = widen_environments(
+                        widening_operator, last_environment, output_environment
+                    )
+                elif output_environment != last_environment:
+                    delays[node] += 1
+
+        if output_environment == last_environment:
+            return False
+
+        environments[node] = output_environment
+        return True
+
+    iterations = 0
+
+    if changed_program_points is None:
+        nodes = [cfg.entry]
+    else:
+        nodes = [cfg.indices[program_point] for program_point in changed_program_points]
+
+    if order == WorklistOrder.WEAK_TOPOLOGICAL:
+        dirty = [False] * len(cfg)
+        for node in nodes:
+            dirty[node] = True
+
+        def visit(node: int) -> None:
+            nonlocal iterations
+
+            dirty[node] = False
+            iterations += 1
+
+            if update(node):
+                for successor in cfg.successors(node):
+                    dirty[successor] = True
+
+        def stabilize(elements: WeakTopologicalOrder) -> None:
+            for element in elements:
+                if isinstance(element, tuple):
+                    head, body = element
+                    while True:
+                        if dirty[head]:
+                            visit(head)
+                        stabilize(body)
+                        if not dirty[head]:
+                            break
+                elif dirty[element]:
+                    visit(element)
+
+        stabilize(cfg.weak_topological_order())
+
+    else:
+        if order == WorklistOrder.REVERSE_POSTORDER:
+            ranks = cfg.reverse_postorder_ranks()
+        else:
+            ranks = None
+
+        worklist = Worklist(nodes, ranks)
+
+        while worklist:
+            node = worklist.pop()
+            iterations += 1
+
+            if update(node):
+                worklist.extend(cfg.successors(node))
+
+    if narrowing_operator is not None:
+        worklist = Worklist(
+            (node for node in cfg.reverse_postorder() if node in widening_nodes),
+            cfg.reverse_postorder_ranks(),
+        )
+
+        while worklist:
+            node = worklist.pop()
+            iterations += 1
+
+            if update(node, descending=True):
+                worklist.extend(cfg.successors(node))
+
+    if profile is not None:
+        profile.phases["solve"] += time.perf_counter() - start
+
+    return FixpointResult(
+        cfg.program_points[cfg.entry],
+        dict(zip(cfg.program_points, environments, strict=True)),
+        iterations,
+    )
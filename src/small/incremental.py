@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Generic, Mapping, TypeVar
+
+from small import ParserBackend, read_string
+from small.ast import Assignment, Function, IfElse, Return, Statement, While
+from small.fixpoint import Environment, FixpointResult, solve
+
+if TYPE_CHECKING:
+    from manim_dataflow_analysis import (
+        ConditionUpdateFunction,
+        ControlFlowFunction,
+        Lattice,
+        ProgramPoint,
+        WideningOperator,
+    )
+
+    from small.ast import BoolExpression
+    from small.cfg import CompactControlFlowGraph
+
+L = TypeVar("L")
+
+
+@dataclass(frozen=True)
+class FunctionAnalysis(Generic[L]):
+    function: Function
+    cfg: CompactControlFlowGraph
+    result: FixpointResult[L]
+
+
+@dataclass(frozen=True)
+class IncrementalState(Generic[L]):
+    source: str
+    analyses: dict[str, FunctionAnalysis[L]]
+
+    @property
+    def functions(self) -> tuple[Function, ...]:
+        return tuple(analysis.function for analysis in self.analyses.values())
+
+
+def statement_index(statements: tuple[Statement, ...]) -> dict[Statement, Statement]:
+    index: dict[Statement, Statement] = {}
+
+    pending = list(statements)
+    while pending:
+        statement = pending.pop()
+        index.setdefault(statement, statement)
+
+        match statement:
+            case IfElse(_, _, if_body, else_body):
+                pending.extend(if_body)
+                pending.extend(else_body)
+            case While(_, _, body):
+                pending.extend(body)
+
+    return index
+
+
+def reuse_statements(
+    statements: tuple[Statement, ...], index: dict[Statement, Statement]
+) -> tuple[Statement, ...]:
+    return tuple(reuse_statement(statement, index) for statement in statements)
+
+
+def reuse_statement(
+    statement: Statement, index: dict[Statement, Statement]
+) -> Statement:
+    if (reused := index.get(statement)) is not None:
+        return reused
+
+    match statement:
+        case IfElse(_, _, if_body, else_body):
+            return replace(
+                statement,
+                if_body=reuse_statements(if_body, index),
+                else_body=reuse_statements(else_body, index),
+            )
+        case While(_, _, body):
+            return replace(statement, body=reuse_statements(body, index))
+        case Assignment() | Return():
+            return statement
+        case _:
+            raise ValueError(f"Unsupported statement: {statement}")
+
+
+def incoming_edges(
+    cfg: CompactControlFlowGraph, node: int
+) -> frozenset[tuple[ProgramPoint, BoolExpression]]:
+    return frozenset(
+        (cfg.program_points[cfg.edge_sources[edge]], cfg.edge_conditions[edge])
+        for edge in cfg.incoming_edges(node)
+    )
+
+
+def invalidated_program_points(
+    previous_cfg: CompactControlFlowGraph, cfg: CompactControlFlowGraph
+) -> set[ProgramPoint]:
+    previous_indices = previous_cfg.indices
+
+    changed = [
+        node
+        for node, program_point in enumerate(cfg.program_points)
+        if (previous_node := previous_indices.get(program_point)) is None
+        or incoming_edges(previous_cfg, previous_node) != incoming_edges(cfg, node)
+    ]
+
+    invalidated = set(changed)
+    while changed:
+        for successor in cfg.successors(changed.pop()):
+            if successor not in invalidated:
+                invalidated.add(successor)
+                changed.append(successor)
+
+    return {cfg.program_points[node] for node in invalidated}
+
+
+class IncrementalAnalysis(Generic[L]):
+    def __init__(
+        self,
+        lattice: Lattice[L],
+        control_flow_function: ControlFlowFunction[L],
+        condition_update_function: ConditionUpdateFunction[L, BoolExpression],
+        widening_operator: WideningOperator[L] | None = None,
+        backend: ParserBackend = ParserBackend.DESCENT,
+    ):
+        self.lattice = lattice
+        self.control_flow_function = control_flow_function
+        self.condition_update_function = condition_update_function
+        self.widening_operator = widening_operator
+        self.backend = backend
+
+    def analyze(
+        self, source: str, previous: IncrementalState[L] | None = None
+    ) -> IncrementalState[L]:
+        if previous is not None and previous.source == source:
+            return previous
+
+        analyses = {
+            function.name: self.analyze_function(
+                function,
+                None if previous is None else previous.analyses.get(function.name),
+            )
+            for function in read_string(source, backend=self.backend)
+        }
+
+        return IncrementalState(source, analyses)
+
+    def analyze_function(
+        self, function: Function, previous: FunctionAnalysis[L] | None = None
+    ) -> FunctionAnalysis[L]:
+        if previous is None:
+            cfg = function.to_compact_cfg()
+            return FunctionAnalysis(function, cfg, self._solve(function, cfg))
+
+        if function == previous.function:
+            return previous
+
+        function = replace(
+            function,
+            body=reuse_statements(
+                function.body, statement_index(previous.function.body)
+            ),
+        )
+        cfg = function.to_compact_cfg()
+
+        if (
+            function.parameters != previous.function.parameters
+            or function.variables != previous.function.variables
+        ):
+            return FunctionAnalysis(function, cfg, self._solve(function, cfg))
+
+        invalidated = invalidated_program_points(previous.cfg, cfg)
+        initial_environments = {
+            program_point: environment
+            for program_point, environment in previous.result.environments.items()
+            if program_point not in invalidated
+        }
+
+        return FunctionAnalysis(
+            function,
+            cfg,
+            self._solve(function, cfg, initial_environments, invalidated),
+        )
+
+    def _solve(
+        self,
+        function: Function,
+        cfg: CompactControlFlowGraph,
+        initial_environments: Mapping[ProgramPoint, Environment[L] | None]
+        | None = None,
+        changed_program_points: set[ProgramPoint] | None = None,
+    ) -> FixpointResult[L]:
+        return solve(
+            function,
+            self.lattice,
+            self.control_flow_function,
+            self.condition_update_function,
+            self.widening_operator,
+            cfg=cfg,
+            initial_environments=initial_environments,
+            changed_program_points=changed_program_points,
+        )
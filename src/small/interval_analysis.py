@@ -1,13 +1,17 @@
 from __future__ import annotations
 
-from enum import StrEnum
+import bisect
+import math
+from enum import Enum, StrEnum
 from functools import cached_property, total_ordering
-from typing import Any, Iterable
+from typing import Any, Iterable, cast
 
 from manim_dataflow_analysis import *
 
 from small import read_string
 from small.ast import *
+from small.dispatch import DispatchFlowFunction, binary_operands
+from small.fixpoint import NarrowingOperator
 
 
 @total_ordering
@@ -18,17 +22,105 @@ class IntervalExtremum(StrEnum):
     def __lt__(self, other: Any) -> bool:
         if isinstance(other, IntervalExtremum):
             return self == IntervalExtremum.BOTTOM and other == IntervalExtremum.TOP
-        elif isinstance(other, (FloatIntervalValue, BoolIntervalValue)):
+        elif isinstance(
+            other, (FloatIntervalValue, IntIntervalValue, BoolIntervalValue)
+        ):
             return False
         else:
             return NotImplemented
 
 
+@total_ordering
+class IntervalInfinity(Enum):
+    NEGATIVE = -1
+    POSITIVE = 1
+
+    def __str__(self) -> str:
+        return "-inf" if self is IntervalInfinity.NEGATIVE else "inf"
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, IntervalInfinity):
+            return self is other
+        elif isinstance(other, float):
+            return other == self.value * math.inf
+        elif isinstance(other, int):
+            return False
+        else:
+            return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.value * math.inf)
+
+    def __lt__(self, other: Any) -> bool:
+        if isinstance(other, (IntervalInfinity, int, float)):
+            return self is IntervalInfinity.NEGATIVE and other != self
+        else:
+            return NotImplemented
+
+    def __neg__(self) -> IntervalInfinity:
+        return IntervalInfinity(-self.value)
+
+    def __add__(self, other: Any) -> IntervalInfinity:
+        if isinstance(other, IntervalInfinity) and other is not self:
+            raise ArithmeticError(f"{self} + {other} is undefined")
+        elif isinstance(other, (IntervalInfinity, int, float)):
+            return self
+        else:
+            return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Any) -> IntervalInfinity:
+        if isinstance(other, (IntervalInfinity, int, float)):
+            return self + -other
+        else:
+            return NotImplemented
+
+    def __rsub__(self, other: Any) -> IntervalInfinity:
+        if isinstance(other, (IntervalInfinity, int, float)):
+            return -self + other
+        else:
+            return NotImplemented
+
+    def __mul__(self, other: Any) -> IntervalInfinity:
+        if isinstance(other, IntervalInfinity):
+            return IntervalInfinity(self.value * other.value)
+        elif isinstance(other, (int, float)):
+            if other == 0:
+                raise ArithmeticError(f"{self} * 0 is undefined")
+            return self if other > 0 else -self
+        else:
+            return NotImplemented
+
+    __rmul__ = __mul__
+
+
+IntervalBound = int | IntervalInfinity
+
+NumericBound = float | IntervalBound
+
+
+def add_bounds(bound1: Any, bound2: Any) -> Any | None:
+    try:
+        result = bound1 + bound2
+    except ArithmeticError:
+        return None
+    return None if isinstance(result, float) and math.isnan(result) else result
+
+
+def multiply_bounds(bound1: Any, bound2: Any) -> Any | None:
+    try:
+        result = bound1 * bound2
+    except ArithmeticError:
+        return None
+    return None if isinstance(result, float) and math.isnan(result) else result
+
+
 @total_ordering
 @dataclass(frozen=True, order=False)
 class FloatIntervalValue:
-    low: float
-    high: float
+    low: NumericBound
+    high: NumericBound
 
     def __str__(self):
         return f"[{self.low}, {self.high}]"
@@ -36,7 +128,29 @@ class FloatIntervalValue:
     def __lt__(self, other: Any) -> bool:
         if isinstance(other, IntervalExtremum):
             return True
-        elif isinstance(other, FloatIntervalValue):
+        elif isinstance(other, (FloatIntervalValue, IntIntervalValue)):
+            return self.low < other.low or (
+                self.low == other.low and self.high < other.high
+            )
+        elif isinstance(other, BoolIntervalValue):
+            return False
+        else:
+            return NotImplemented
+
+
+@total_ordering
+@dataclass(frozen=True, order=False, slots=True)
+class IntIntervalValue:
+    low: IntervalBound
+    high: IntervalBound
+
+    def __str__(self):
+        return f"[{self.low}, {self.high}]"
+
+    def __lt__(self, other: Any) -> bool:
+        if isinstance(other, IntervalExtremum):
+            return True
+        elif isinstance(other, (FloatIntervalValue, IntIntervalValue)):
             return self.low < other.low or (
                 self.low == other.low and self.high < other.high
             )
@@ -62,18 +176,42 @@ class BoolIntervalValue:
             return self.low < other.low or (
                 self.low == other.low and self.high < other.high
             )
-        elif isinstance(other, FloatIntervalValue):
+        elif isinstance(other, (FloatIntervalValue, IntIntervalValue)):
             return True
         else:
             return NotImplemented
 
 
-IntervalAnalysisValue = IntervalExtremum | FloatIntervalValue | BoolIntervalValue
+NumericIntervalValue = FloatIntervalValue | IntIntervalValue
+
+
+def numeric_interval(
+    interval_type: type[NumericIntervalValue], low: NumericBound, high: NumericBound
+) -> NumericIntervalValue:
+    if issubclass(interval_type, IntIntervalValue):
+        return IntIntervalValue(cast(IntervalBound, low), cast(IntervalBound, high))
+    return interval_type(low, high)
+
+
+IntervalAnalysisValue = (
+    IntervalExtremum | FloatIntervalValue | IntIntervalValue | BoolIntervalValue
+)
 
 
 class IntervalAnalysisLattice(Lattice[IntervalAnalysisValue]):
-    def __init__(self, interval_size: int = 500):
+    def __init__(
+        self,
+        interval_size: int = 500,
+        neighbour_limit: int | None = None,
+        interval_type: type[NumericIntervalValue] = IntIntervalValue,
+    ):
         self._interval_size = interval_size
+        self._neighbour_limit = neighbour_limit
+        self._interval_type = interval_type
+
+    @property
+    def interval_size(self) -> int:
+        return self._interval_size
 
     def top(self) -> IntervalAnalysisValue:
         return IntervalExtremum.TOP
@@ -81,6 +219,37 @@ class IntervalAnalysisLattice(Lattice[IntervalAnalysisValue]):
     def bottom(self) -> IntervalAnalysisValue:
         return IntervalExtremum.BOTTOM
 
+    def _singletons(self) -> int:
+        if self._neighbour_limit is None:
+            return self._interval_size
+        return min(self._interval_size, self._neighbour_limit // 2)
+
+    def _clamp(self, bound: NumericBound) -> float:
+        if isinstance(bound, IntervalInfinity):
+            return bound.value * self._interval_size
+        return min(max(bound, -self._interval_size), self._interval_size)
+
+    def height(self) -> int:
+        return 2 * self._interval_size + 4
+
+    def depth(self, value: IntervalAnalysisValue) -> int:
+        match value:
+            case IntervalExtremum.BOTTOM:
+                return 0
+            case IntervalExtremum.TOP:
+                return self.height()
+            case BoolIntervalValue(low, high):
+                return 1 if low == high else 2
+            case FloatIntervalValue(low, high) | IntIntervalValue(low, high):
+                return (
+                    1
+                    + int(max(self._clamp(high) - self._clamp(low), 0))
+                    + (low == IntervalInfinity.NEGATIVE)
+                    + (high == IntervalInfinity.POSITIVE)
+                )
+            case _:
+                raise ValueError(f"Unsupported value: {value}")
+
     def successors(
         self, value: IntervalAnalysisValue
     ) -> Iterable[IntervalAnalysisValue]:
@@ -90,32 +259,35 @@ class IntervalAnalysisLattice(Lattice[IntervalAnalysisValue]):
             case IntervalExtremum.BOTTOM:
                 yield BoolIntervalValue(True, True)
                 yield BoolIntervalValue(False, False)
-                yield FloatIntervalValue(0, 0)
-                for i in range(1, self._interval_size + 1):
-                    yield FloatIntervalValue(i, i)
-                    yield FloatIntervalValue(-i, -i)
+                yield numeric_interval(self._interval_type, 0, 0)
+                for i in range(1, self._singletons() + 1):
+                    yield numeric_interval(self._interval_type, i, i)
+                    yield numeric_interval(self._interval_type, -i, -i)
             case BoolIntervalValue(False, True):
                 yield self.top()
             case BoolIntervalValue(False, False) | BoolIntervalValue(True, True):
                 yield BoolIntervalValue(False, True)
-            case FloatIntervalValue(low, high):
-                if low == float("-inf") and high == float("inf"):
+            case FloatIntervalValue(low, high) | IntIntervalValue(low, high):
+                if (
+                    low == IntervalInfinity.NEGATIVE
+                    and high == IntervalInfinity.POSITIVE
+                ):
                     yield self.top()
                     return
 
                 if low == -self._interval_size:
-                    yield FloatIntervalValue(float("-inf"), high)
-                elif low == float("inf"):
-                    yield FloatIntervalValue(self._interval_size, high)
-                elif low != float("-inf"):
-                    yield FloatIntervalValue(low - 1, high)
+                    yield numeric_interval(type(value), IntervalInfinity.NEGATIVE, high)
+                elif low == IntervalInfinity.POSITIVE:
+                    yield numeric_interval(type(value), self._interval_size, high)
+                elif low != IntervalInfinity.NEGATIVE:
+                    yield numeric_interval(type(value), low - 1, high)
 
                 if high == self._interval_size:
-                    yield FloatIntervalValue(low, float("inf"))
-                elif high == float("-inf"):
-                    yield FloatIntervalValue(low, -self._interval_size)
-                elif high != float("inf"):
-                    yield FloatIntervalValue(low, high + 1)
+                    yield numeric_interval(type(value), low, IntervalInfinity.POSITIVE)
+                elif high == IntervalInfinity.NEGATIVE:
+                    yield numeric_interval(type(value), low, -self._interval_size)
+                elif high != IntervalInfinity.POSITIVE:
+                    yield numeric_interval(type(value), low, high + 1)
 
     def is_descendant(
         self, value: IntervalAnalysisValue, descendant: IntervalAnalysisValue
@@ -132,8 +304,10 @@ class IntervalAnalysisLattice(Lattice[IntervalAnalysisValue]):
             ):
                 return included_low <= including_low and including_high <= included_high
             case (
-                FloatIntervalValue(including_low, including_high),
-                FloatIntervalValue(included_low, included_high),
+                FloatIntervalValue(including_low, including_high)
+                | IntIntervalValue(including_low, including_high),
+                FloatIntervalValue(included_low, included_high)
+                | IntIntervalValue(included_low, included_high),
             ):
                 return included_low <= including_low and including_high <= included_high
             case _:
@@ -145,7 +319,11 @@ class IntervalAnalysisLattice(Lattice[IntervalAnalysisValue]):
         match value:
             case IntervalExtremum.TOP:
                 yield BoolIntervalValue(False, True)
-                yield FloatIntervalValue(float("-inf"), float("inf"))
+                yield numeric_interval(
+                    self._interval_type,
+                    IntervalInfinity.NEGATIVE,
+                    IntervalInfinity.POSITIVE,
+                )
             case IntervalExtremum.BOTTOM:
                 return
             case BoolIntervalValue(False, False) | BoolIntervalValue(True, True):
@@ -153,20 +331,23 @@ class IntervalAnalysisLattice(Lattice[IntervalAnalysisValue]):
             case BoolIntervalValue(False, True):
                 yield BoolIntervalValue(False, False)
                 yield BoolIntervalValue(True, True)
-            case FloatIntervalValue(low, high):
+            case FloatIntervalValue(low, high) | IntIntervalValue(low, high):
                 if low == high:
-                    yield self.bottom()
+                    if self._neighbour_limit is None or (
+                        -self._singletons() <= low <= self._singletons()
+                    ):
+                        yield self.bottom()
                     return
 
-                if low == float("-inf"):
-                    yield FloatIntervalValue(-self._interval_size, high)
+                if low == IntervalInfinity.NEGATIVE:
+                    yield numeric_interval(type(value), -self._interval_size, high)
                 else:
-                    yield FloatIntervalValue(low + 1, high)
+                    yield numeric_interval(type(value), low + 1, high)
 
-                if high == float("inf"):
-                    yield FloatIntervalValue(low, self._interval_size)
+                if high == IntervalInfinity.POSITIVE:
+                    yield numeric_interval(type(value), low, self._interval_size)
                 else:
-                    yield FloatIntervalValue(low, high - 1)
+                    yield numeric_interval(type(value), low, high - 1)
 
     def is_ancestor(
         self, value: IntervalAnalysisValue, ancestor: IntervalAnalysisValue
@@ -183,8 +364,10 @@ class IntervalAnalysisLattice(Lattice[IntervalAnalysisValue]):
             ):
                 return including_low <= included_low and included_high <= including_high
             case (
-                FloatIntervalValue(including_low, including_high),
-                FloatIntervalValue(included_low, included_high),
+                FloatIntervalValue(including_low, including_high)
+                | IntIntervalValue(including_low, including_high),
+                FloatIntervalValue(included_low, included_high)
+                | IntIntervalValue(included_low, included_high),
             ):
                 return including_low <= included_low and included_high <= including_high
             case _:
@@ -199,8 +382,13 @@ class IntervalAnalysisLattice(Lattice[IntervalAnalysisValue]):
         match (value1, value2):
             case (IntervalExtremum.BOTTOM, value) | (value, IntervalExtremum.BOTTOM):
                 return value
-            case (FloatIntervalValue(low1, high1), FloatIntervalValue(low2, high2)):
-                return FloatIntervalValue(min(low1, low2), max(high1, high2))
+            case (
+                FloatIntervalValue(low1, high1) | IntIntervalValue(low1, high1),
+                FloatIntervalValue(low2, high2) | IntIntervalValue(low2, high2),
+            ):
+                return numeric_interval(
+                    type(value1), min(low1, low2), max(high1, high2)
+                )
             case (BoolIntervalValue(low1, high1), BoolIntervalValue(low2, high2)):
                 return BoolIntervalValue(min(low1, low2), max(high1, high2))
             case _:
@@ -215,8 +403,13 @@ class IntervalAnalysisLattice(Lattice[IntervalAnalysisValue]):
         match (value1, value2):
             case (IntervalExtremum.TOP, value) | (value, IntervalExtremum.TOP):
                 return value
-            case (FloatIntervalValue(low1, high1), FloatIntervalValue(low2, high2)):
-                return FloatIntervalValue(max(low1, low2), min(high1, high2))
+            case (
+                FloatIntervalValue(low1, high1) | IntIntervalValue(low1, high1),
+                FloatIntervalValue(low2, high2) | IntIntervalValue(low2, high2),
+            ):
+                return numeric_interval(
+                    type(value1), max(low1, low2), min(high1, high2)
+                )
             case (BoolIntervalValue(low1, high1), BoolIntervalValue(low2, high2)):
                 return BoolIntervalValue(max(low1, low2), min(high1, high2))
             case _:
@@ -248,11 +441,15 @@ class IntervalAnalysisWideningOperator(WideningOperator[IntervalAnalysisValue]):
         match (last_value, new_value):
             case (IntervalExtremum.BOTTOM, l_new):
                 return l_new, 0
-            case (FloatIntervalValue(a, b), FloatIntervalValue(c, d)):
+            case (
+                FloatIntervalValue(a, b) | IntIntervalValue(a, b),
+                FloatIntervalValue(c, d) | IntIntervalValue(c, d),
+            ):
                 return (
-                    FloatIntervalValue(
-                        a if a <= c else float("-inf"),
-                        b if b >= d else float("inf"),
+                    numeric_interval(
+                        type(last_value),
+                        a if a <= c else IntervalInfinity.NEGATIVE,
+                        b if b >= d else IntervalInfinity.POSITIVE,
                     ),
                     1,
                 )
@@ -260,7 +457,152 @@ class IntervalAnalysisWideningOperator(WideningOperator[IntervalAnalysisValue]):
                 return self._lattice.join(last_value, new_value), 2
 
 
+def expression_constants(expression: Expression | FunctionCall) -> set[int]:
+    match expression:
+        case IntConstant(value):
+            return {value}
+        case Variable(_) | BoolConstant(_):
+            return set()
+        case (
+            IntBinaryExpression(left, _, right)
+            | IntComparisonExpression(left, _, right)
+            | IntEqualComparisonExpression(left, _, right)
+            | BoolComparisonExpression(left, _, right)
+            | BoolEqualComparisonExpression(left, _, right)
+        ):
+            return expression_constants(left) | expression_constants(right)
+        case BoolNotExpression(value):
+            return expression_constants(value)
+        case FunctionCall(_, arguments):
+            return set().union(*map(expression_constants, arguments))
+        case _:
+            raise ValueError(f"Unsupported expression: {expression}")
+
+
+def function_constants(function: Function) -> set[int]:
+    constants: set[int] = set()
+
+    statements = list(function.body)
+    while statements:
+        match statements.pop():
+            case Assignment(_, _, value) | Return(_, value):
+                constants |= expression_constants(value)
+            case IfElse(_, condition, if_body, else_body):
+                constants |= expression_constants(condition)
+                statements.extend(if_body)
+                statements.extend(else_body)
+            case While(_, condition, body):
+                constants |= expression_constants(condition)
+                statements.extend(body)
+            case statement:
+                raise ValueError(f"Unsupported statement: {statement}")
+
+    return constants
+
+
+class IntervalAnalysisThresholdWideningOperator(IntervalAnalysisWideningOperator):
+    instances = [
+        (
+            r"W(\bot, l_{new})",
+            r"l_{new}",
+        ),
+        (
+            r"W([a, b], [c, d])",
+            r"[if\ a \leq c\ then\ a\ else\ \max\{t \in T \mid t \leq c\},\ if\ b \geq d\ then\ b\ else\ \min\{t \in T \mid t \geq d\}]",
+        ),
+        (
+            r"W(last, new)",
+            r"last \sqcup new",
+        ),
+    ]
+
+    def __init__(self, lattice: IntervalAnalysisLattice, thresholds: Iterable[int]):
+        super().__init__(lattice)
+        self._thresholds = sorted(set(thresholds))
+
+    @classmethod
+    def from_function(
+        cls, lattice: IntervalAnalysisLattice, function: Function
+    ) -> IntervalAnalysisThresholdWideningOperator:
+        return cls(lattice, function_constants(function))
+
+    @property
+    def thresholds(self) -> tuple[int, ...]:
+        return tuple(self._thresholds)
+
+    def apply(
+        self, last_value: IntervalAnalysisValue, new_value: IntervalAnalysisValue
+    ) -> tuple[IntervalAnalysisValue, int]:
+        match (last_value, new_value):
+            case (
+                FloatIntervalValue(a, b) | IntIntervalValue(a, b),
+                FloatIntervalValue(c, d) | IntIntervalValue(c, d),
+            ):
+                if a > c:
+                    index = bisect.bisect_right(self._thresholds, c) - 1
+                    a = (
+                        self._thresholds[index]
+                        if index >= 0
+                        else IntervalInfinity.NEGATIVE
+                    )
+
+                if b < d:
+                    index = bisect.bisect_left(self._thresholds, d)
+                    b = (
+                        self._thresholds[index]
+                        if index < len(self._thresholds)
+                        else IntervalInfinity.POSITIVE
+                    )
+
+                return numeric_interval(type(last_value), a, b), 1
+            case _:
+                return super().apply(last_value, new_value)
+
+
+class IntervalAnalysisNarrowingOperator(NarrowingOperator[IntervalAnalysisValue]):
+    instances = [
+        (
+            r"N(\bot, l_{new})",
+            r"\bot",
+        ),
+        (
+            r"N([a, b], [c, d])",
+            r"[if\ a = -\infty\ then\ c\ else\ a,\ if\ b = +\infty\ then\ d\ else\ b]",
+        ),
+        (
+            r"N(last, new)",
+            r"last \sqcap new",
+        ),
+    ]
+
+    def __init__(self, lattice: IntervalAnalysisLattice):
+        self._lattice = lattice
+
+    def apply(
+        self, last_value: IntervalAnalysisValue, new_value: IntervalAnalysisValue
+    ) -> tuple[IntervalAnalysisValue, int]:
+        match (last_value, new_value):
+            case (IntervalExtremum.BOTTOM, _):
+                return last_value, 0
+            case (
+                FloatIntervalValue(a, b) | IntIntervalValue(a, b),
+                FloatIntervalValue(c, d) | IntIntervalValue(c, d),
+            ):
+                return (
+                    numeric_interval(
+                        type(last_value),
+                        c if a == IntervalInfinity.NEGATIVE else a,
+                        d if b == IntervalInfinity.POSITIVE else b,
+                    ),
+                    1,
+                )
+            case _:
+                return self._lattice.meet(last_value, new_value), 2
+
+
 class IntervalAnalysisFlowFunction(FlowFunction[IntervalAnalysisValue]):
+    interval_type: type[NumericIntervalValue] = IntIntervalValue
+
     instances = [
         (
             r"f [[ x = c ]] (\phi)",
@@ -346,7 +688,7 @@ class IntervalAnalysisFlowFunction(FlowFunction[IntervalAnalysisValue]):
     ) -> tuple[dict[str, IntervalAnalysisValue], int]:
         match statement:
             case Assignment(_, Variable(x), IntConstant(c)):
-                return {x: FloatIntervalValue(c, c)}, 0
+                return {x: numeric_interval(self.interval_type, c, c)}, 0
             case Assignment(_, Variable(x), Variable(y)):
                 return {x: abstract_environment[y]}, 1
             case Assignment(
@@ -356,13 +698,17 @@ class IntervalAnalysisFlowFunction(FlowFunction[IntervalAnalysisValue]):
                     IntConstant(c), IntBinaryOperator.ADD, IntConstant(d)
                 ),
             ):
-                return {x: FloatIntervalValue(c + d, c + d)}, 2
+                return {x: numeric_interval(self.interval_type, c + d, c + d)}, 2
             case Assignment(
                 _,
                 Variable(x),
                 IntBinaryExpression(Variable(y), IntBinaryOperator.ADD, IntConstant(c)),
-            ) if isinstance(y_value := abstract_environment[y], FloatIntervalValue):
-                return {x: FloatIntervalValue(y_value.low + c, y_value.high + c)}, 3
+            ) if isinstance(y_value := abstract_environment[y], NumericIntervalValue):
+                return {
+                    x: numeric_interval(
+                        self.interval_type, y_value.low + c, y_value.high + c
+                    )
+                }, 3
             case Assignment(
                 _,
                 Variable(x),
@@ -390,9 +736,9 @@ class IntervalAnalysisFlowFunction(FlowFunction[IntervalAnalysisValue]):
                 Variable(x),
                 IntBinaryExpression(Variable(y), IntBinaryOperator.ADD, Variable(z)),
             ) if (
-                isinstance(y_value := abstract_environment[y], FloatIntervalValue)
-                and isinstance(z_value := abstract_environment[z], FloatIntervalValue)
-                and y_value.low + z_value.low == float("nan")
+                isinstance(y_value := abstract_environment[y], NumericIntervalValue)
+                and isinstance(z_value := abstract_environment[z], NumericIntervalValue)
+                and add_bounds(y_value.low, z_value.low) is None
             ):
                 return {x: IntervalExtremum.TOP}, 6
             case Assignment(
@@ -400,9 +746,9 @@ class IntervalAnalysisFlowFunction(FlowFunction[IntervalAnalysisValue]):
                 Variable(x),
                 IntBinaryExpression(Variable(y), IntBinaryOperator.ADD, Variable(z)),
             ) if (
-                isinstance(y_value := abstract_environment[y], FloatIntervalValue)
-                and isinstance(z_value := abstract_environment[z], FloatIntervalValue)
-                and y_value.high + z_value.high == float("nan")
+                isinstance(y_value := abstract_environment[y], NumericIntervalValue)
+                and isinstance(z_value := abstract_environment[z], NumericIntervalValue)
+                and add_bounds(y_value.high, z_value.high) is None
             ):
                 return {x: IntervalExtremum.TOP}, 7
             case Assignment(
@@ -410,10 +756,10 @@ class IntervalAnalysisFlowFunction(FlowFunction[IntervalAnalysisValue]):
                 Variable(x),
                 IntBinaryExpression(Variable(y), IntBinaryOperator.ADD, Variable(z)),
             ) if (
-                isinstance(y_value := abstract_environment[y], FloatIntervalValue)
-                and isinstance(z_value := abstract_environment[z], FloatIntervalValue)
-                and y_value.low + z_value.low == float("inf")
-                and y_value.high + z_value.high == float("-inf")
+                isinstance(y_value := abstract_environment[y], NumericIntervalValue)
+                and isinstance(z_value := abstract_environment[z], NumericIntervalValue)
+                and add_bounds(y_value.low, z_value.low) == IntervalInfinity.POSITIVE
+                and add_bounds(y_value.high, z_value.high) == IntervalInfinity.NEGATIVE
             ):
                 return {x: IntervalExtremum.TOP}, 8
             case Assignment(
@@ -421,10 +767,11 @@ class IntervalAnalysisFlowFunction(FlowFunction[IntervalAnalysisValue]):
                 Variable(x),
                 IntBinaryExpression(Variable(y), IntBinaryOperator.ADD, Variable(z)),
             ) if isinstance(
-                y_value := abstract_environment[y], FloatIntervalValue
-            ) and isinstance(z_value := abstract_environment[z], FloatIntervalValue):
+                y_value := abstract_environment[y], NumericIntervalValue
+            ) and isinstance(z_value := abstract_environment[z], NumericIntervalValue):
                 return {
-                    x: FloatIntervalValue(
+                    x: numeric_interval(
+                        self.interval_type,
                         y_value.low + z_value.low,
                         y_value.high + z_value.high,
                     )
@@ -434,9 +781,9 @@ class IntervalAnalysisFlowFunction(FlowFunction[IntervalAnalysisValue]):
                 Variable(x),
                 IntBinaryExpression(Variable(y), IntBinaryOperator.MUL, Variable(z)),
             ) if (
-                isinstance(y_value := abstract_environment[y], FloatIntervalValue)
-                and isinstance(z_value := abstract_environment[z], FloatIntervalValue)
-                and y_value.low * z_value.low == float("nan")
+                isinstance(y_value := abstract_environment[y], NumericIntervalValue)
+                and isinstance(z_value := abstract_environment[z], NumericIntervalValue)
+                and multiply_bounds(y_value.low, z_value.low) is None
             ):
                 return {x: IntervalExtremum.TOP}, 10
             case Assignment(
@@ -444,9 +791,9 @@ class IntervalAnalysisFlowFunction(FlowFunction[IntervalAnalysisValue]):
                 Variable(x),
                 IntBinaryExpression(Variable(y), IntBinaryOperator.MUL, Variable(z)),
             ) if (
-                isinstance(y_value := abstract_environment[y], FloatIntervalValue)
-                and isinstance(z_value := abstract_environment[z], FloatIntervalValue)
-                and y_value.high * z_value.high == float("nan")
+                isinstance(y_value := abstract_environment[y], NumericIntervalValue)
+                and isinstance(z_value := abstract_environment[z], NumericIntervalValue)
+                and multiply_bounds(y_value.high, z_value.high) is None
             ):
                 return {x: IntervalExtremum.TOP}, 11
             case Assignment(
@@ -454,10 +801,12 @@ class IntervalAnalysisFlowFunction(FlowFunction[IntervalAnalysisValue]):
                 Variable(x),
                 IntBinaryExpression(Variable(y), IntBinaryOperator.MUL, Variable(z)),
             ) if (
-                isinstance(y_value := abstract_environment[y], FloatIntervalValue)
-                and isinstance(z_value := abstract_environment[z], FloatIntervalValue)
-                and y_value.low * z_value.low == float("inf")
-                and y_value.high * z_value.high == float("-inf")
+                isinstance(y_value := abstract_environment[y], NumericIntervalValue)
+                and isinstance(z_value := abstract_environment[z], NumericIntervalValue)
+                and multiply_bounds(y_value.low, z_value.low)
+                == IntervalInfinity.POSITIVE
+                and multiply_bounds(y_value.high, z_value.high)
+                == IntervalInfinity.NEGATIVE
             ):
                 return {x: IntervalExtremum.TOP}, 12
             case Assignment(
@@ -465,15 +814,16 @@ class IntervalAnalysisFlowFunction(FlowFunction[IntervalAnalysisValue]):
                 Variable(x),
                 IntBinaryExpression(Variable(y), IntBinaryOperator.MUL, Variable(z)),
             ) if (
-                isinstance(y_value := abstract_environment[y], FloatIntervalValue)
-                and isinstance(z_value := abstract_environment[z], FloatIntervalValue)
+                isinstance(y_value := abstract_environment[y], NumericIntervalValue)
+                and isinstance(z_value := abstract_environment[z], NumericIntervalValue)
                 and y_value.low >= 0
                 and y_value.high >= 0
                 and z_value.low >= 0
                 and z_value.high >= 0
             ):
                 return {
-                    x: FloatIntervalValue(
+                    x: numeric_interval(
+                        self.interval_type,
                         y_value.low * z_value.low,
                         y_value.high * z_value.high,
                     )
@@ -484,6 +834,177 @@ class IntervalAnalysisFlowFunction(FlowFunction[IntervalAnalysisValue]):
                 raise ValueError(f"Unsupported statement: {statement}")
 
 
+class DispatchIntervalAnalysisFlowFunction(
+    DispatchFlowFunction[IntervalAnalysisValue], IntervalAnalysisFlowFunction
+):
+    def _int_constant(
+        self,
+        statement: Assignment,
+        abstract_environment: AbstractEnvironment[IntervalAnalysisValue],
+    ) -> tuple[dict[str, IntervalAnalysisValue], int]:
+        c = cast(IntConstant, statement.value).value
+        return {statement.variable.name: numeric_interval(self.interval_type, c, c)}, 0
+
+    def _variable(
+        self,
+        statement: Assignment,
+        abstract_environment: AbstractEnvironment[IntervalAnalysisValue],
+    ) -> tuple[dict[str, IntervalAnalysisValue], int]:
+        y = cast(Variable, statement.value).name
+        return {statement.variable.name: abstract_environment[y]}, 1
+
+    def _constant_add_constant(
+        self,
+        statement: Assignment,
+        abstract_environment: AbstractEnvironment[IntervalAnalysisValue],
+    ) -> tuple[dict[str, IntervalAnalysisValue], int]:
+        c, d = binary_operands(statement)
+        value = c.value + d.value
+        return {
+            statement.variable.name: numeric_interval(self.interval_type, value, value)
+        }, 2
+
+    def _add_constant(
+        self,
+        x: str,
+        y: str,
+        c: int,
+        abstract_environment: AbstractEnvironment[IntervalAnalysisValue],
+    ) -> tuple[dict[str, IntervalAnalysisValue], int]:
+        y_value = abstract_environment[y]
+        if isinstance(y_value, NumericIntervalValue):
+            return {
+                x: numeric_interval(
+                    self.interval_type, y_value.low + c, y_value.high + c
+                )
+            }, 3
+        return {x: IntervalExtremum.TOP}, 4
+
+    def _variable_add_constant(
+        self,
+        statement: Assignment,
+        abstract_environment: AbstractEnvironment[IntervalAnalysisValue],
+    ) -> tuple[dict[str, IntervalAnalysisValue], int]:
+        y, c = binary_operands(statement)
+        return self._add_constant(
+            statement.variable.name, y.name, c.value, abstract_environment
+        )
+
+    def _constant_add_variable(
+        self,
+        statement: Assignment,
+        abstract_environment: AbstractEnvironment[IntervalAnalysisValue],
+    ) -> tuple[dict[str, IntervalAnalysisValue], int]:
+        c, y = binary_operands(statement)
+        variables, _ = self._add_constant(
+            statement.variable.name, y.name, c.value, abstract_environment
+        )
+        return variables, 5
+
+    def _variable_add_variable(
+        self,
+        statement: Assignment,
+        abstract_environment: AbstractEnvironment[IntervalAnalysisValue],
+    ) -> tuple[dict[str, IntervalAnalysisValue], int]:
+        x = statement.variable.name
+        y, z = binary_operands(statement)
+        y_value = abstract_environment[y.name]
+        z_value = abstract_environment[z.name]
+
+        if not isinstance(y_value, NumericIntervalValue) or not isinstance(
+            z_value, NumericIntervalValue
+        ):
+            return {x: IntervalExtremum.TOP}, 14
+
+        low = add_bounds(y_value.low, z_value.low)
+        if low is None:
+            return {x: IntervalExtremum.TOP}, 6
+
+        high = add_bounds(y_value.high, z_value.high)
+        if high is None:
+            return {x: IntervalExtremum.TOP}, 7
+
+        if low == IntervalInfinity.POSITIVE and high == IntervalInfinity.NEGATIVE:
+            return {x: IntervalExtremum.TOP}, 8
+
+        return {x: numeric_interval(self.interval_type, low, high)}, 9
+
+    def _variable_multiply_variable(
+        self,
+        statement: Assignment,
+        abstract_environment: AbstractEnvironment[IntervalAnalysisValue],
+    ) -> tuple[dict[str, IntervalAnalysisValue], int]:
+        x = statement.variable.name
+        y, z = binary_operands(statement)
+        y_value = abstract_environment[y.name]
+        z_value = abstract_environment[z.name]
+
+        if not isinstance(y_value, NumericIntervalValue) or not isinstance(
+            z_value, NumericIntervalValue
+        ):
+            return {x: IntervalExtremum.TOP}, 14
+
+        low = multiply_bounds(y_value.low, z_value.low)
+        if low is None:
+            return {x: IntervalExtremum.TOP}, 10
+
+        high = multiply_bounds(y_value.high, z_value.high)
+        if high is None:
+            return {x: IntervalExtremum.TOP}, 11
+
+        if low == IntervalInfinity.POSITIVE and high == IntervalInfinity.NEGATIVE:
+            return {x: IntervalExtremum.TOP}, 12
+
+        if (
+            y_value.low >= 0
+            and y_value.high >= 0
+            and z_value.low >= 0
+            and z_value.high >= 0
+        ):
+            return {x: numeric_interval(self.interval_type, low, high)}, 13
+
+        return {x: IntervalExtremum.TOP}, 14
+
+    def _any_other_case(
+        self,
+        statement: Assignment,
+        abstract_environment: AbstractEnvironment[IntervalAnalysisValue],
+    ) -> tuple[dict[str, IntervalAnalysisValue], int]:
+        return {statement.variable.name: IntervalExtremum.TOP}, 14
+
+    rules = {
+        (Assignment, IntConstant): _int_constant,
+        (Assignment, Variable): _variable,
+        (
+            Assignment,
+            IntConstant,
+            IntBinaryOperator.ADD,
+            IntConstant,
+        ): _constant_add_constant,
+        (
+            Assignment,
+            Variable,
+            IntBinaryOperator.ADD,
+            IntConstant,
+        ): _variable_add_constant,
+        (
+            Assignment,
+            IntConstant,
+            IntBinaryOperator.ADD,
+            Variable,
+        ): _constant_add_variable,
+        (Assignment, Variable, IntBinaryOperator.ADD, Variable): _variable_add_variable,
+        (
+            Assignment,
+            Variable,
+            IntBinaryOperator.MUL,
+            Variable,
+        ): _variable_multiply_variable,
+    }
+
+    default_rule = _any_other_case
+
+
 class IntervalAnalysisControlFlowFunction(ControlFlowFunction[IntervalAnalysisValue]):
     instances = [
         (
@@ -498,7 +1019,7 @@ class IntervalAnalysisControlFlowFunction(ControlFlowFunction[IntervalAnalysisVa
         ),
     ]
 
-    flow_function = IntervalAnalysisFlowFunction()
+    flow_function = DispatchIntervalAnalysisFlowFunction()
 
     def get_variables(
         self,
@@ -524,12 +1045,19 @@ class IntervalAnalysisControlFlowFunction(ControlFlowFunction[IntervalAnalysisVa
 class IntervalAnalysisConditionUpdateFunction(
     ConditionUpdateFunction[IntervalAnalysisValue, BoolExpression]
 ):
+    interval_type: type[NumericIntervalValue] = IntIntervalValue
+
     instances = [
         (
             r"cg[[ y < c ]] (\phi)",
             r"\bot",
             r"c \in \mathbb{Z} \wedge \phi(y).low \geq c",
         ),
+        (
+            r"cg[[ y < c ]] (\phi)",
+            r"\phi[y \mapsto [\phi(y).low, c - 1]]",
+            r"c \in \mathbb{Z} \wedge \phi(y).high \geq c",
+        ),
         (
             r"cg[[ c < y ]] (\phi)",
             r"cg[[ y > c ]] (\phi)",
@@ -555,6 +1083,11 @@ class IntervalAnalysisConditionUpdateFunction(
             r"\bot",
             r"c \in \mathbb{Z} \wedge \phi(y).high \leq c",
         ),
+        (
+            r"cg[[ y > c ]] (\phi)",
+            r"\phi[y \mapsto [c + 1, \phi(y).high]]",
+            r"c \in \mathbb{Z} \wedge \phi(y).low \leq c",
+        ),
         (
             r"cg[[ c > y ]] (\phi)",
             r"cg[[ y < c ]] (\phi)",
@@ -580,6 +1113,11 @@ class IntervalAnalysisConditionUpdateFunction(
             r"\bot",
             r"c \in \mathbb{Z} \wedge \phi(y).low > c",
         ),
+        (
+            r"cg[[ y <= c ]] (\phi)",
+            r"\phi[y \mapsto [\phi(y).low, c]]",
+            r"c \in \mathbb{Z} \wedge \phi(y).high > c",
+        ),
         (
             r"cg[[ c <= y ]] (\phi)",
             r"cg[[ y >= c ]] (\phi)",
@@ -605,6 +1143,11 @@ class IntervalAnalysisConditionUpdateFunction(
             r"\bot",
             r"c \in \mathbb{Z} \wedge \phi(y).high < c",
         ),
+        (
+            r"cg[[ y >= c ]] (\phi)",
+            r"\phi[y \mapsto [c, \phi(y).high]]",
+            r"c \in \mathbb{Z} \wedge \phi(y).low < c",
+        ),
         (
             r"cg[[ c >= y ]] (\phi)",
             r"cg[[ y <= c ]] (\phi)",
@@ -671,10 +1214,17 @@ class IntervalAnalysisConditionUpdateFunction(
             case IntComparisonExpression(
                 Variable(y), IntComparisonOperator.LT, IntConstant(c)
             ) if (
-                isinstance(y_value := abstract_environment[y], FloatIntervalValue)
+                isinstance(y_value := abstract_environment[y], NumericIntervalValue)
                 and y_value.low >= c
             ):
                 return None, 0
+            case IntComparisonExpression(
+                Variable(y), IntComparisonOperator.LT, IntConstant(c)
+            ) if (
+                isinstance(y_value := abstract_environment[y], NumericIntervalValue)
+                and y_value.high >= c
+            ):
+                return {y: numeric_interval(self.interval_type, y_value.low, c - 1)}, 1
             case IntComparisonExpression(
                 IntConstant(c), IntComparisonOperator.LT, Variable(y)
             ):
@@ -684,38 +1234,53 @@ class IntervalAnalysisConditionUpdateFunction(
                     ),
                     abstract_environment,
                 )
-                return variables, 1
+                return variables, 2
             case IntComparisonExpression(
                 Variable(y), IntComparisonOperator.LT, Variable(x)
             ) if (
-                isinstance(y_value := abstract_environment[y], FloatIntervalValue)
-                and isinstance(x_value := abstract_environment[x], FloatIntervalValue)
+                isinstance(y_value := abstract_environment[y], NumericIntervalValue)
+                and isinstance(x_value := abstract_environment[x], NumericIntervalValue)
                 and y_value.low >= x_value.high
             ):
-                return None, 2
+                return None, 3
             case IntComparisonExpression(
                 Variable(y), IntComparisonOperator.LT, Variable(x)
             ) if abstract_environment[y] in (
                 IntervalExtremum.BOTTOM,
                 IntervalExtremum.TOP,
-            ) and isinstance(x_value := abstract_environment[x], FloatIntervalValue):
-                return {y: FloatIntervalValue(float("-inf"), x_value.high - 1)}, 3
+            ) and isinstance(x_value := abstract_environment[x], NumericIntervalValue):
+                return {
+                    y: numeric_interval(
+                        self.interval_type, IntervalInfinity.NEGATIVE, x_value.high - 1
+                    )
+                }, 4
             case IntComparisonExpression(
                 Variable(y), IntComparisonOperator.LT, Variable(x)
             ) if isinstance(
-                y_value := abstract_environment[y], FloatIntervalValue
+                y_value := abstract_environment[y], NumericIntervalValue
             ) and abstract_environment[x] in (
                 IntervalExtremum.BOTTOM,
                 IntervalExtremum.TOP,
             ):
-                return {x: FloatIntervalValue(y_value.low + 1, float("inf"))}, 4
+                return {
+                    x: numeric_interval(
+                        self.interval_type, y_value.low + 1, IntervalInfinity.POSITIVE
+                    )
+                }, 5
             case IntComparisonExpression(
                 Variable(y), IntComparisonOperator.GT, IntConstant(c)
             ) if (
-                isinstance(y_value := abstract_environment[y], FloatIntervalValue)
+                isinstance(y_value := abstract_environment[y], NumericIntervalValue)
                 and y_value.high <= c
             ):
-                return None, 5
+                return None, 6
+            case IntComparisonExpression(
+                Variable(y), IntComparisonOperator.GT, IntConstant(c)
+            ) if (
+                isinstance(y_value := abstract_environment[y], NumericIntervalValue)
+                and y_value.low <= c
+            ):
+                return {y: numeric_interval(self.interval_type, c + 1, y_value.high)}, 7
             case IntComparisonExpression(
                 IntConstant(c), IntComparisonOperator.GT, Variable(y)
             ):
@@ -725,38 +1290,53 @@ class IntervalAnalysisConditionUpdateFunction(
                     ),
                     abstract_environment,
                 )
-                return variables, 6
+                return variables, 8
             case IntComparisonExpression(
                 Variable(y), IntComparisonOperator.GT, Variable(x)
             ) if (
-                isinstance(y_value := abstract_environment[y], FloatIntervalValue)
-                and isinstance(x_value := abstract_environment[x], FloatIntervalValue)
+                isinstance(y_value := abstract_environment[y], NumericIntervalValue)
+                and isinstance(x_value := abstract_environment[x], NumericIntervalValue)
                 and y_value.high <= x_value.low
             ):
-                return None, 7
+                return None, 9
             case IntComparisonExpression(
                 Variable(y), IntComparisonOperator.GT, Variable(x)
             ) if abstract_environment[y] in (
                 IntervalExtremum.BOTTOM,
                 IntervalExtremum.TOP,
-            ) and isinstance(x_value := abstract_environment[x], FloatIntervalValue):
-                return {y: FloatIntervalValue(x_value.low + 1, float("inf"))}, 8
+            ) and isinstance(x_value := abstract_environment[x], NumericIntervalValue):
+                return {
+                    y: numeric_interval(
+                        self.interval_type, x_value.low + 1, IntervalInfinity.POSITIVE
+                    )
+                }, 10
             case IntComparisonExpression(
                 Variable(y), IntComparisonOperator.GT, Variable(x)
             ) if isinstance(
-                y_value := abstract_environment[y], FloatIntervalValue
+                y_value := abstract_environment[y], NumericIntervalValue
             ) and abstract_environment[x] in (
                 IntervalExtremum.BOTTOM,
                 IntervalExtremum.TOP,
             ):
-                return {x: FloatIntervalValue(float("-inf"), y_value.high - 1)}, 9
+                return {
+                    x: numeric_interval(
+                        self.interval_type, IntervalInfinity.NEGATIVE, y_value.high - 1
+                    )
+                }, 11
             case IntComparisonExpression(
                 Variable(y), IntComparisonOperator.LTE, IntConstant(c)
             ) if (
-                isinstance(y_value := abstract_environment[y], FloatIntervalValue)
+                isinstance(y_value := abstract_environment[y], NumericIntervalValue)
                 and y_value.low > c
             ):
-                return None, 10
+                return None, 12
+            case IntComparisonExpression(
+                Variable(y), IntComparisonOperator.LTE, IntConstant(c)
+            ) if (
+                isinstance(y_value := abstract_environment[y], NumericIntervalValue)
+                and y_value.high > c
+            ):
+                return {y: numeric_interval(self.interval_type, y_value.low, c)}, 13
             case IntComparisonExpression(
                 IntConstant(c), IntComparisonOperator.LTE, Variable(y)
             ):
@@ -766,38 +1346,53 @@ class IntervalAnalysisConditionUpdateFunction(
                     ),
                     abstract_environment,
                 )
-                return variables, 11
+                return variables, 14
             case IntComparisonExpression(
                 Variable(y), IntComparisonOperator.LTE, Variable(x)
             ) if (
-                isinstance(y_value := abstract_environment[y], FloatIntervalValue)
-                and isinstance(x_value := abstract_environment[x], FloatIntervalValue)
+                isinstance(y_value := abstract_environment[y], NumericIntervalValue)
+                and isinstance(x_value := abstract_environment[x], NumericIntervalValue)
                 and y_value.low > x_value.high
             ):
-                return None, 12
+                return None, 15
             case IntComparisonExpression(
                 Variable(y), IntComparisonOperator.LTE, Variable(x)
             ) if abstract_environment[y] in (
                 IntervalExtremum.BOTTOM,
                 IntervalExtremum.TOP,
-            ) and isinstance(x_value := abstract_environment[x], FloatIntervalValue):
-                return {y: FloatIntervalValue(float("-inf"), x_value.high)}, 13
+            ) and isinstance(x_value := abstract_environment[x], NumericIntervalValue):
+                return {
+                    y: numeric_interval(
+                        self.interval_type, IntervalInfinity.NEGATIVE, x_value.high
+                    )
+                }, 16
             case IntComparisonExpression(
                 Variable(y), IntComparisonOperator.LTE, Variable(x)
             ) if isinstance(
-                y_value := abstract_environment[y], FloatIntervalValue
+                y_value := abstract_environment[y], NumericIntervalValue
             ) and abstract_environment[x] in (
                 IntervalExtremum.BOTTOM,
                 IntervalExtremum.TOP,
             ):
-                return {x: FloatIntervalValue(y_value.low, float("inf"))}, 14
+                return {
+                    x: numeric_interval(
+                        self.interval_type, y_value.low, IntervalInfinity.POSITIVE
+                    )
+                }, 17
             case IntComparisonExpression(
                 Variable(y), IntComparisonOperator.GTE, IntConstant(c)
             ) if (
-                isinstance(y_value := abstract_environment[y], FloatIntervalValue)
+                isinstance(y_value := abstract_environment[y], NumericIntervalValue)
                 and y_value.high < c
             ):
-                return None, 15
+                return None, 18
+            case IntComparisonExpression(
+                Variable(y), IntComparisonOperator.GTE, IntConstant(c)
+            ) if (
+                isinstance(y_value := abstract_environment[y], NumericIntervalValue)
+                and y_value.low < c
+            ):
+                return {y: numeric_interval(self.interval_type, c, y_value.high)}, 19
             case IntComparisonExpression(
                 IntConstant(c), IntComparisonOperator.GTE, Variable(y)
             ):
@@ -807,35 +1402,43 @@ class IntervalAnalysisConditionUpdateFunction(
                     ),
                     abstract_environment,
                 )
-                return variables, 16
+                return variables, 20
             case IntComparisonExpression(
                 Variable(y), IntComparisonOperator.GTE, Variable(x)
             ) if (
-                isinstance(y_value := abstract_environment[y], FloatIntervalValue)
-                and isinstance(x_value := abstract_environment[x], FloatIntervalValue)
+                isinstance(y_value := abstract_environment[y], NumericIntervalValue)
+                and isinstance(x_value := abstract_environment[x], NumericIntervalValue)
                 and y_value.high < x_value.low
             ):
-                return None, 17
+                return None, 21
             case IntComparisonExpression(
                 Variable(y), IntComparisonOperator.GTE, Variable(x)
             ) if abstract_environment[y] in (
                 IntervalExtremum.BOTTOM,
                 IntervalExtremum.TOP,
-            ) and isinstance(x_value := abstract_environment[x], FloatIntervalValue):
-                return {y: FloatIntervalValue(x_value.low, float("inf"))}, 18
+            ) and isinstance(x_value := abstract_environment[x], NumericIntervalValue):
+                return {
+                    y: numeric_interval(
+                        self.interval_type, x_value.low, IntervalInfinity.POSITIVE
+                    )
+                }, 22
             case IntComparisonExpression(
                 Variable(y), IntComparisonOperator.GTE, Variable(x)
             ) if isinstance(
-                y_value := abstract_environment[y], FloatIntervalValue
+                y_value := abstract_environment[y], NumericIntervalValue
             ) and abstract_environment[x] in (
                 IntervalExtremum.BOTTOM,
                 IntervalExtremum.TOP,
             ):
-                return {x: FloatIntervalValue(float("-inf"), y_value.high)}, 19
+                return {
+                    x: numeric_interval(
+                        self.interval_type, IntervalInfinity.NEGATIVE, y_value.high
+                    )
+                }, 23
             case IntEqualComparisonExpression(
                 Variable(y), EqualityOperator.EQ, IntConstant(c)
             ):
-                return {y: FloatIntervalValue(c, c)}, 20
+                return {y: numeric_interval(self.interval_type, c, c)}, 24
             case IntEqualComparisonExpression(
                 IntConstant(c), EqualityOperator.EQ, Variable(y)
             ):
@@ -845,7 +1448,7 @@ class IntervalAnalysisConditionUpdateFunction(
                     ),
                     abstract_environment,
                 )
-                return variables, 21
+                return variables, 25
             case IntEqualComparisonExpression(
                 Variable(y), EqualityOperator.EQ, Variable(x)
             ) if abstract_environment[y] not in (
@@ -855,7 +1458,7 @@ class IntervalAnalysisConditionUpdateFunction(
                 IntervalExtremum.BOTTOM,
                 IntervalExtremum.TOP,
             ):
-                return {x: abstract_environment[y]}, 22
+                return {x: abstract_environment[y]}, 26
             case IntEqualComparisonExpression(
                 Variable(y), EqualityOperator.EQ, Variable(x)
             ) if abstract_environment[y] in (
@@ -865,19 +1468,19 @@ class IntervalAnalysisConditionUpdateFunction(
                 IntervalExtremum.BOTTOM,
                 IntervalExtremum.TOP,
             ):
-                return {y: abstract_environment[x]}, 23
+                return {y: abstract_environment[x]}, 27
             case IntEqualComparisonExpression(
                 Variable(y), EqualityOperator.EQ, Variable(x)
             ) if (
-                isinstance(y_value := abstract_environment[y], FloatIntervalValue)
-                and isinstance(x_value := abstract_environment[x], FloatIntervalValue)
+                isinstance(y_value := abstract_environment[y], NumericIntervalValue)
+                and isinstance(x_value := abstract_environment[x], NumericIntervalValue)
                 and (y_value.high < x_value.low or y_value.low > x_value.high)
             ):
-                return None, 24
+                return None, 28
             case BoolConstant(False):
-                return None, 25
+                return None, 29
             case _:
-                return {}, 26
+                return {}, 30
 
 
 class AbstractIntervalAnalysisScene(
@@ -897,6 +1500,8 @@ class AbstractIntervalAnalysisScene(
 
     widening_operator = IntervalAnalysisWideningOperator(lattice)
 
+    narrowing_operator = IntervalAnalysisNarrowingOperator(lattice)
+
     control_flow_function = IntervalAnalysisControlFlowFunction()
 
     condition_update_function = IntervalAnalysisConditionUpdateFunction()
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Generic, Mapping, TypeVar
+
+from manim_dataflow_analysis import ControlFlowFunction, ProgramPoint
+
+from small.ast import (
+    Assignment,
+    BoolComparisonExpression,
+    BoolConstant,
+    BoolEqualComparisonExpression,
+    BoolNotExpression,
+    Expression,
+    FunctionCall,
+    IntBinaryExpression,
+    IntComparisonExpression,
+    IntConstant,
+    IntEqualComparisonExpression,
+    Variable,
+)
+
+L = TypeVar("L")
+
+
+def expression_variables(expression: Expression | FunctionCall) -> frozenset[str]:
+    match expression:
+        case Variable(name):
+            return frozenset((name,))
+        case IntConstant(_) | BoolConstant(_):
+            return frozenset()
+        case (
+            IntBinaryExpression(left, _, right)
+            | IntComparisonExpression(left, _, right)
+            | IntEqualComparisonExpression(left, _, right)
+            | BoolComparisonExpression(left, _, right)
+            | BoolEqualComparisonExpression(left, _, right)
+        ):
+            return expression_variables(left) | expression_variables(right)
+        case BoolNotExpression(value):
+            return expression_variables(value)
+        case FunctionCall(_, arguments):
+            return frozenset().union(*map(expression_variables, arguments))
+        case _:
+            raise ValueError(f"Unsupported expression: {expression}")
+
+
+def read_variables(program_point: ProgramPoint) -> tuple[str, ...]:
+    match program_point:
+        case ProgramPoint(_, Assignment(_, _, value)):
+            return tuple(sorted(expression_variables(value)))
+        case _:
+            return ()
+
+
+class MemoizedControlFlowFunction(ControlFlowFunction[L], Generic[L]):
+    def __init__(
+        self, control_flow_function: ControlFlowFunction[L], maxsize: int = 4096
+    ) -> None:
+        self.control_flow_function = control_flow_function
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._reads: dict[ProgramPoint, tuple[str, ...]] = {}
+        self._cache: OrderedDict[
+            tuple[ProgramPoint, tuple[L, ...]],
+            tuple[dict[str, L], Any],
+        ] = OrderedDict()
+
+    @property
+    def instances(self) -> Any:
+        return self.control_flow_function.instances
+
+    def get_variables(
+        self,
+        program_point: ProgramPoint,
+        abstract_environment: Mapping[str, L],
+    ) -> tuple[dict[str, L], int | tuple[int, int]]:
+        reads = self._reads.get(program_point)
+        if reads is None:
+            reads = self._reads[program_point] = read_variables(program_point)
+
+        key = (
+            program_point,
+            tuple(abstract_environment[variable] for variable in reads),
+        )
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            variables, instance_id = cached
+            return dict(variables), instance_id
+
+        self.misses += 1
+        variables, instance_id = self.control_flow_function.get_variables(
+            program_point, abstract_environment
+        )
+
+        self._cache[key] = (dict(variables), instance_id)
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+        return variables, instance_id
+
+    def cache_clear(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._cache.clear()
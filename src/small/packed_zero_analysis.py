@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterator, Mapping
+
+import numpy as np
+
+from small.environment import DerivableEnvironment
+from small.fixpoint import WorklistOrder, initial_environment, solve
+from small.zero_analysis import AbstractZeroAnalysisScene, ZeroAnalysisValue
+
+if TYPE_CHECKING:
+    from manim_dataflow_analysis import Lattice
+
+    from small.ast import Function
+    from small.cfg import CompactControlFlowGraph
+    from small.fixpoint import FixpointResult
+
+ZERO_ANALYSIS_BITS = {
+    ZeroAnalysisValue.BOTTOM: 0b00,
+    ZeroAnalysisValue.Z: 0b01,
+    ZeroAnalysisValue.NZ: 0b10,
+    ZeroAnalysisValue.U: 0b11,
+}
+
+ZERO_ANALYSIS_VALUES = tuple(
+    sorted(ZERO_ANALYSIS_BITS, key=ZERO_ANALYSIS_BITS.__getitem__)
+)
+
+
+class PackedZeroEnvironment(DerivableEnvironment[ZeroAnalysisValue]):
+    __slots__ = ("bits", "indices")
+
+    def __init__(self, indices: Mapping[str, int], bits: np.ndarray):
+        self.indices = indices
+        self.bits = bits
+
+    @classmethod
+    def of(
+        cls,
+        environment: Mapping[str, ZeroAnalysisValue],
+        indices: Mapping[str, int] | None = None,
+    ) -> PackedZeroEnvironment:
+        if indices is None:
+            indices = {variable: index for index, variable in enumerate(environment)}
+
+        bits = np.zeros(len(indices), dtype=np.uint8)
+        for variable, value in environment.items():
+            bits[indices[variable]] = ZERO_ANALYSIS_BITS[value]
+
+        return cls(indices, bits)
+
+    def updated(
+        self, changes: Mapping[str, ZeroAnalysisValue]
+    ) -> PackedZeroEnvironment:
+        if not changes:
+            return self
+
+        bits = self.bits.copy()
+        for variable, value in changes.items():
+            bits[self.indices[variable]] = ZERO_ANALYSIS_BITS[value]
+
+        return PackedZeroEnvironment(self.indices, bits)
+
+    def joined(
+        self,
+        lattice: Lattice[ZeroAnalysisValue],
+        other: Mapping[str, ZeroAnalysisValue],
+    ) -> Mapping[str, ZeroAnalysisValue]:
+        if isinstance(other, PackedZeroEnvironment) and other.indices is self.indices:
+            return PackedZeroEnvironment(
+                self.indices, np.bitwise_or(self.bits, other.bits)
+            )
+        return super().joined(lattice, other)
+
+    def __getitem__(self, variable: str) -> ZeroAnalysisValue:
+        return ZERO_ANALYSIS_VALUES[self.bits[self.indices[variable]]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.indices)
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PackedZeroEnvironment) and other.indices is self.indices:
+            return np.array_equal(self.bits, other.bits)
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+def solve_packed(
+    function: Function,
+    cfg: CompactControlFlowGraph | None = None,
+    order: WorklistOrder = WorklistOrder.FIFO,
+) -> FixpointResult[ZeroAnalysisValue]:
+    scene = AbstractZeroAnalysisScene
+
+    return solve(
+        function,
+        scene.lattice,
+        scene.control_flow_function,
+        scene.condition_update_function,
+        entry_environment=PackedZeroEnvironment.of(
+            initial_environment(function, scene.lattice)
+        ),
+        cfg=cfg,
+        order=order,
+    )
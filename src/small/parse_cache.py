@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Callable
+
+from small import ast
+from small.ast import source
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from types import ModuleType
+
+    from small.ast import Function
+
+CACHE_FORMAT = 2
+
+
+def schema_version(*modules: ModuleType) -> str:
+    schema: list[tuple[str, list[tuple[str, Any]]]] = []
+    for module in modules:
+        for name, value in sorted(vars(module).items()):
+            if not isinstance(value, type) or value.__module__ != module.__name__:
+                continue
+
+            if dataclasses.is_dataclass(value):
+                schema.append(
+                    (
+                        f"{module.__name__}.{name}",
+                        [
+                            (field.name, str(field.type))
+                            for field in dataclasses.fields(value)
+                        ],
+                    )
+                )
+            elif issubclass(value, Enum):
+                schema.append(
+                    (
+                        f"{module.__name__}.{name}",
+                        [(member.name, member.value) for member in value],
+                    )
+                )
+
+    return hashlib.sha256(repr(schema).encode()).hexdigest()[:16]
+
+
+CACHE_VERSION = f"{CACHE_FORMAT}-{schema_version(ast, source)}"
+
+
+def source_key(source: str, namespace: str = "") -> str:
+    return hashlib.sha256(
+        f"{CACHE_VERSION}\0{namespace}\0{source}".encode()
+    ).hexdigest()
+
+
+class ParseCache:
+    def __init__(
+        self,
+        maxsize: int = 128,
+        directory: Path | None = None,
+        enabled: bool = True,
+    ):
+        self.maxsize = maxsize
+        self.directory = directory
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._functions: OrderedDict[str, tuple[Function, ...]] = OrderedDict()
+
+    def get_or_parse(
+        self,
+        source: str,
+        parse: Callable[[], tuple[Function, ...]],
+        namespace: str = "",
+    ) -> tuple[Function, ...]:
+        if not self.enabled:
+            return parse()
+
+        key = source_key(source, namespace)
+
+        functions = self._functions.get(key)
+        if functions is not None:
+            self.hits += 1
+            self._functions.move_to_end(key)
+            return functions
+
+        functions = self._load(key)
+        if functions is None:
+            self.misses += 1
+            functions = parse()
+            self._dump(key, functions)
+        else:
+            self.hits += 1
+
+        self._functions[key] = functions
+        if len(self._functions) > self.maxsize:
+            self._functions.popitem(last=False)
+
+        return functions
+
+    def clear(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._functions.clear()
+
+    def _load(self, key: str) -> tuple[Function, ...] | None:
+        if self.directory is None:
+            return None
+
+        try:
+            with open(self.directory / f"{key}.pickle", "rb") as file:
+                return pickle.load(file)
+        except (
+            OSError,
+            pickle.UnpicklingError,
+            EOFError,
+            AttributeError,
+            ImportError,
+            TypeError,
+            ValueError,
+        ):
+            return None
+
+    def _dump(self, key: str, functions: tuple[Function, ...]) -> None:
+        if self.directory is None:
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        path = self.directory / f"{key}.pickle"
+        temporary_path = path.with_name(f".{key}.{os.getpid()}.tmp")
+        with open(temporary_path, "wb") as file:
+            pickle.dump(functions, file, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, path)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import copy
+import cProfile
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from typing import TYPE_CHECKING, Any, ContextManager, Iterator
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def rule_hit_key(item: tuple[tuple[str, Any], int]) -> tuple[str, tuple[Any, ...]]:
+    (function, instance), _ = item
+    return function, instance if isinstance(instance, tuple) else (instance,)
+
+
+class Profile:
+    def __init__(self) -> None:
+        self.phases: defaultdict[str, float] = defaultdict(float)
+        self.counters: Counter[str] = Counter()
+        self.rule_hits: Counter[tuple[str, Any]] = Counter()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] += time.perf_counter() - start
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] += amount
+
+    def hit(self, function: object, instance: Any) -> None:
+        self.rule_hits[type(function).__name__, instance] += 1
+
+    def instruments(self, function: Any) -> bool:
+        return getattr(function, "_profile", None) is self
+
+    def hit_counted(self, function: Any, counter: str) -> Any:
+        if self.instruments(function):
+            return function
+
+        method = function.get_variables
+
+        @wraps(method)
+        def get_variables(*args: Any, **kwargs: Any) -> Any:
+            variables, instance = method(*args, **kwargs)
+            self.counters[counter] += 1
+            self.hit(function, instance)
+            return variables, instance
+
+        instrumented = copy.copy(function)
+        instrumented.get_variables = get_variables
+        instrumented._profile = self
+        return instrumented
+
+    def instrument_scene(self, scene: Any) -> None:
+        scene.control_flow_function = self.hit_counted(
+            scene.control_flow_function, "statements"
+        )
+        scene.condition_update_function = self.hit_counted(
+            scene.condition_update_function, "conditions"
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "phases": dict(self.phases),
+            "counters": dict(self.counters),
+            "rule_hits": [
+                {"function": function, "instance": instance, "hits": hits}
+                for (function, instance), hits in sorted(
+                    self.rule_hits.items(), key=rule_hit_key
+                )
+            ],
+        }
+
+    def report(self) -> str:
+        lines = [
+            f"{name:<12} {seconds * 1000:10.2f}ms"
+            for name, seconds in self.phases.items()
+        ]
+        lines += [f"{name:<12} {count:10d}" for name, count in self.counters.items()]
+        lines += [
+            f"{hit['function']}[{hit['instance']}] {hit['hits']}"
+            for hit in self.to_dict()["rule_hits"]
+        ]
+        return "\n".join(lines)
+
+
+_active_profile: Profile | None = None
+
+
+def active_profile() -> Profile | None:
+    return _active_profile
+
+
+def phase(name: str) -> ContextManager[None]:
+    if _active_profile is None:
+        return nullcontext()
+    return _active_profile.phase(name)
+
+
+def count(name: str, amount: int = 1) -> None:
+    if _active_profile is not None:
+        _active_profile.count(name, amount)
+
+
+@contextmanager
+def profiling(cprofile_path: Path | None = None) -> Iterator[Profile]:
+    global _active_profile  # noqa: PLW0603
+
+    previous_profile = _active_profile
+    profile = _active_profile = Profile()
+
+    profiler = None
+    if cprofile_path is not None:
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    try:
+        yield profile
+    finally:
+        if profiler is not None and cprofile_path is not None:
+            profiler.disable()
+            profiler.dump_stats(cprofile_path)
+        _active_profile = previous_profile
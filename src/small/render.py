@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, ContextManager
+
+from manim import config, tempconfig
+
+from small.profiling import profiling
+from small.render_cache import ANALYSIS_SCENES, RenderCache, scene_key
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    from small.profiling import Profile
+
+QUALITIES = (
+    "low_quality",
+    "medium_quality",
+    "high_quality",
+    "production_quality",
+    "fourk_quality",
+)
+
+
+@dataclass(frozen=True)
+class RenderResult:
+    scene: str
+    video: Path
+    seconds: float
+    cached: bool = False
+    profile: Path | None = None
+
+
+def load_scenes(path: Path) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    if spec is None or spec.loader is None:
+        raise ValueError(f"Cannot load scenes from: {path}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def discover_scenes(module: ModuleType) -> list[str]:
+    return [
+        name
+        for name, value in vars(module).items()
+        if isinstance(value, type)
+        and issubclass(value, ANALYSIS_SCENES)
+        and value not in ANALYSIS_SCENES
+    ]
+
+
+_worker_media_dir: Path | None = None
+
+
+def _initialize_worker(media_dir: Path) -> None:
+    global _worker_media_dir  # noqa: PLW0603
+    _worker_media_dir = media_dir / f"worker-{os.getpid()}"
+
+
+def render_scene(
+    path: Path,
+    scene_name: str,
+    output_dir: Path,
+    quality: str | None,
+    cache_dir: Path | None = None,
+    profile_dir: Path | None = None,
+) -> RenderResult:
+    if _worker_media_dir is None:
+        raise RuntimeError("The render worker has not been initialized")
+
+    scene_class = getattr(load_scenes(path), scene_name)
+
+    options = {"media_dir": str(_worker_media_dir)}
+    if quality is not None:
+        options["quality"] = quality
+
+    cache = None if cache_dir is None else RenderCache(cache_dir)
+
+    profile_context: ContextManager[Profile | None]
+    if profile_dir is not None:
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        profile_context = profiling(profile_dir / f"{scene_name}.prof")
+    else:
+        profile_context = nullcontext()
+
+    start = time.perf_counter()
+    with tempconfig(options), profile_context as profile:
+        key = scene_key(
+            scene_class,
+            f"{config.pixel_width}x{config.pixel_height}@{config.frame_rate}",
+        )
+
+        movie_file_path = None if cache is None else cache.get(key)
+        cached = movie_file_path is not None
+
+        if movie_file_path is None:
+            scene = scene_class()
+            if profile is not None:
+                profile.instrument_scene(scene)
+                with profile.phase("render"):
+                    scene.render()
+            else:
+                scene.render()
+            movie_file_path = Path(scene.renderer.file_writer.movie_file_path)
+
+            if cache is not None:
+                cache.put(key, movie_file_path)
+    seconds = time.perf_counter() - start
+
+    video = output_dir / f"{scene_name}{movie_file_path.suffix}"
+    shutil.copyfile(movie_file_path, video)
+
+    profile_path = None
+    if profile is not None and profile_dir is not None:
+        profile_path = profile_dir / f"{scene_name}.json"
+        profile_path.write_text(json.dumps(profile.to_dict(), indent=2, default=str))
+
+    return RenderResult(scene_name, video, seconds, cached, profile_path)
+
+
+def render_scenes(
+    path: Path,
+    scene_names: list[str],
+    media_dir: Path,
+    quality: str | None = None,
+    jobs: int | None = None,
+    cache_dir: Path | None = None,
+    profile_dir: Path | None = None,
+) -> list[RenderResult]:
+    output_dir = media_dir / "videos"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    results = []
+    with ProcessPoolExecutor(
+        jobs, initializer=_initialize_worker, initargs=(media_dir,)
+    ) as executor:
+        futures = [
+            executor.submit(
+                render_scene,
+                path,
+                scene_name,
+                output_dir,
+                quality,
+                cache_dir,
+                profile_dir,
+            )
+            for scene_name in scene_names
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            status = "cached" if result.cached else f"{result.seconds:.1f}s"
+            print(f"{result.scene}: {status} -> {result.video}")
+            if result.profile is not None:
+                print(f"{result.scene}: profile -> {result.profile}")
+            results.append(result)
+
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Render the analysis scenes of a scene file in parallel."
+    )
+    parser.add_argument("path", nargs="?", type=Path, default=Path("scenes.py"))
+    parser.add_argument("-s", "--scene", action="append", dest="scenes")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    parser.add_argument("-q", "--quality", choices=QUALITIES)
+    parser.add_argument("--media-dir", type=Path, default=Path("media", "batch"))
+    parser.add_argument("--cache-dir", type=Path, default=Path("media", "cache"))
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--profile", action="store_true")
+    args = parser.parse_args(argv)
+
+    scene_names = args.scenes or discover_scenes(load_scenes(args.path))
+
+    start = time.perf_counter()
+    results = render_scenes(
+        args.path,
+        scene_names,
+        args.media_dir,
+        args.quality,
+        args.jobs,
+        None if args.no_cache or args.profile else args.cache_dir,
+        args.media_dir / "profile" if args.profile else None,
+    )
+    elapsed = time.perf_counter() - start
+
+    total = sum(result.seconds for result in results)
+    cached = sum(result.cached for result in results)
+    print(
+        f"Rendered {len(results)} scenes ({cached} cached) in {elapsed:.1f}s"
+        f" ({total:.1f}s of render time)"
+    )
+
+
+if __name__ == "__main__":
+    main()
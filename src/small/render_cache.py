@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import shutil
+from functools import cache
+from importlib import metadata
+from typing import TYPE_CHECKING, Any
+
+from small.interval_analysis import AbstractIntervalAnalysisScene
+from small.zero_analysis import AbstractZeroAnalysisScene
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+ANALYSIS_SCENES = (AbstractZeroAnalysisScene, AbstractIntervalAnalysisScene)
+
+ANALYSIS_DEPENDENCIES = ("small.ast", "small.dispatch")
+
+PACKAGES = ("infom227-animations", "manim-dataflow-analysis")
+
+AnalysisSceneClass = (
+    type[AbstractZeroAnalysisScene] | type[AbstractIntervalAnalysisScene]
+)
+
+
+def normalize_program(program_string: str) -> str:
+    return "\n".join(
+        line.rstrip() for line in program_string.strip("\r\n").splitlines()
+    ).rstrip()
+
+
+def package_version(name: str) -> str | None:
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+@cache
+def module_source_hash(module_name: str) -> str:
+    source = inspect.getsource(importlib.import_module(module_name))
+    return hashlib.sha256(source.encode()).hexdigest()
+
+
+def rule_tables(scene_class: AnalysisSceneClass) -> dict[str, Any]:
+    control_flow_function = scene_class.control_flow_function
+    functions = {
+        "control_flow_function": control_flow_function,
+        "flow_function": getattr(control_flow_function, "flow_function", None),
+        "condition_update_function": scene_class.condition_update_function,
+        "widening_operator": getattr(scene_class, "widening_operator", None),
+    }
+    return {
+        name: getattr(function, "instances", None)
+        for name, function in functions.items()
+        if function is not None
+    }
+
+
+def scene_key(scene_class: AnalysisSceneClass, quality: str) -> str:
+    analysis = next(base for base in ANALYSIS_SCENES if issubclass(scene_class, base))
+    payload = {
+        "program": normalize_program(scene_class.program_string),
+        "analysis": f"{analysis.__module__}.{analysis.__qualname__}",
+        "title": scene_class.title,
+        "instances": rule_tables(scene_class),
+        "sources": {
+            module_name: module_source_hash(module_name)
+            for module_name in (*ANALYSIS_DEPENDENCIES, analysis.__module__)
+        },
+        "versions": {package: package_version(package) for package in PACKAGES},
+        "interval_size": getattr(scene_class.lattice, "interval_size", None),
+        "quality": quality,
+    }
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+class RenderCache:
+    def __init__(self, directory: Path):
+        self.directory = directory
+
+    def get(self, key: str) -> Path | None:
+        return next(self.directory.glob(f"{key}.*"), None)
+
+    def put(self, key: str, video: Path) -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        cached_video = self.directory / f"{key}{video.suffix}"
+        temporary_video = cached_video.with_name(f".{key}.{os.getpid()}.tmp")
+        shutil.copyfile(video, temporary_video)
+        os.replace(temporary_video, cached_video)
+
+        return cached_video
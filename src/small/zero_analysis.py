@@ -2,11 +2,13 @@ from __future__ import annotations
 
 from enum import StrEnum
 from functools import cached_property
+from typing import cast
 
 from manim_dataflow_analysis import *
 
 from small import read_string
 from small.ast import *
+from small.dispatch import DispatchFlowFunction, binary_operands
 
 
 class ZeroAnalysisValue(StrEnum):
@@ -179,6 +181,128 @@ class ZeroAnalysisFlowFunction(FlowFunction[ZeroAnalysisValue]):
                 raise ValueError(f"Unsupported statement: {statement}")
 
 
+class DispatchZeroAnalysisFlowFunction(
+    DispatchFlowFunction[ZeroAnalysisValue], ZeroAnalysisFlowFunction
+):
+    def _int_constant(
+        self,
+        statement: Assignment,
+        abstract_environment: AbstractEnvironment[ZeroAnalysisValue],
+    ) -> tuple[dict[str, ZeroAnalysisValue], int]:
+        if cast(IntConstant, statement.value).value == 0:
+            return {statement.variable.name: ZeroAnalysisValue.Z}, 0
+        return {statement.variable.name: ZeroAnalysisValue.NZ}, 1
+
+    def _bool_constant(
+        self,
+        statement: Assignment,
+        abstract_environment: AbstractEnvironment[ZeroAnalysisValue],
+    ) -> tuple[dict[str, ZeroAnalysisValue], int]:
+        return {statement.variable.name: ZeroAnalysisValue.NZ}, 1
+
+    def _variable(
+        self,
+        statement: Assignment,
+        abstract_environment: AbstractEnvironment[ZeroAnalysisValue],
+    ) -> tuple[dict[str, ZeroAnalysisValue], int]:
+        y = cast(Variable, statement.value).name
+        return {statement.variable.name: abstract_environment[y]}, 2
+
+    def _constant_add_constant(
+        self,
+        statement: Assignment,
+        abstract_environment: AbstractEnvironment[ZeroAnalysisValue],
+    ) -> tuple[dict[str, ZeroAnalysisValue], int]:
+        c, d = binary_operands(statement)
+        if c.value == -d.value:
+            return {statement.variable.name: ZeroAnalysisValue.Z}, 3
+        return {statement.variable.name: ZeroAnalysisValue.U}, 4
+
+    def _variable_add_variable(
+        self,
+        statement: Assignment,
+        abstract_environment: AbstractEnvironment[ZeroAnalysisValue],
+    ) -> tuple[dict[str, ZeroAnalysisValue], int]:
+        y, z = binary_operands(statement)
+        if (
+            abstract_environment[y.name] == ZeroAnalysisValue.Z
+            and abstract_environment[z.name] == ZeroAnalysisValue.Z
+        ):
+            return {statement.variable.name: ZeroAnalysisValue.Z}, 5
+        return {statement.variable.name: ZeroAnalysisValue.U}, 6
+
+    def _add_constant(
+        self,
+        x: str,
+        y: str,
+        c: int,
+        abstract_environment: AbstractEnvironment[ZeroAnalysisValue],
+    ) -> tuple[dict[str, ZeroAnalysisValue], int]:
+        y_value = abstract_environment[y]
+        if y_value == ZeroAnalysisValue.Z and c == 0:
+            return {x: ZeroAnalysisValue.Z}, 7
+        elif y_value == ZeroAnalysisValue.Z and c != 0:
+            return {x: ZeroAnalysisValue.NZ}, 8
+        elif y_value == ZeroAnalysisValue.NZ and c == 0:
+            return {x: ZeroAnalysisValue.NZ}, 9
+        return {x: ZeroAnalysisValue.U}, 10
+
+    def _variable_add_constant(
+        self,
+        statement: Assignment,
+        abstract_environment: AbstractEnvironment[ZeroAnalysisValue],
+    ) -> tuple[dict[str, ZeroAnalysisValue], int]:
+        y, c = binary_operands(statement)
+        return self._add_constant(
+            statement.variable.name, y.name, c.value, abstract_environment
+        )
+
+    def _constant_add_variable(
+        self,
+        statement: Assignment,
+        abstract_environment: AbstractEnvironment[ZeroAnalysisValue],
+    ) -> tuple[dict[str, ZeroAnalysisValue], int]:
+        c, y = binary_operands(statement)
+        variables, _ = self._add_constant(
+            statement.variable.name, y.name, c.value, abstract_environment
+        )
+        return variables, 11
+
+    def _any_other_case(
+        self,
+        statement: Assignment,
+        abstract_environment: AbstractEnvironment[ZeroAnalysisValue],
+    ) -> tuple[dict[str, ZeroAnalysisValue], int]:
+        return {statement.variable.name: ZeroAnalysisValue.U}, 12
+
+    rules = {
+        (Assignment, IntConstant): _int_constant,
+        (Assignment, BoolConstant): _bool_constant,
+        (Assignment, Variable): _variable,
+        (
+            Assignment,
+            IntConstant,
+            IntBinaryOperator.ADD,
+            IntConstant,
+        ): _constant_add_constant,
+        (Assignment, Variable, IntBinaryOperator.ADD, Variable): _variable_add_variable,
+        (
+            Assignment,
+            Variable,
+            IntBinaryOperator.ADD,
+            IntConstant,
+        ): _variable_add_constant,
+        (
+            Assignment,
+            IntConstant,
+            IntBinaryOperator.ADD,
+            Variable,
+        ): _constant_add_variable,
+    }
+
+    default_rule = _any_other_case
+
+
 class ZeroAnalysisControlFlowFunction(ControlFlowFunction[ZeroAnalysisValue]):
     instances = [
         (
@@ -193,7 +317,7 @@ class ZeroAnalysisControlFlowFunction(ControlFlowFunction[ZeroAnalysisValue]):
         ),
     ]
 
-    flow_function = ZeroAnalysisFlowFunction()
+    flow_function = DispatchZeroAnalysisFlowFunction()
 
     def get_variables(
         self,
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+from small import ParserBackend, read_string
+
+if TYPE_CHECKING:
+    from small.ast import Function
+
+COMPARISON_OPERATORS = ("<", "<=", ">", ">=", "==", "!=")
+
+EQUALITY_OPERATORS = ("==", "!=")
+
+RESET_COUNTER = """
+function main(n) {
+    x = 0;
+    y = 0;
+    while (y < n) {
+        x = 1;
+        y = y + x;
+    }
+    return x;
+}
+"""
+
+
+class ProgramLayout(StrEnum):
+    RANDOM = "random"
+    NESTED_LOOPS = "nested-loops"
+    WIDE_LOOPS = "wide-loops"
+    STRAIGHT_LINE = "straight-line"
+
+
+@dataclass(frozen=True)
+class ProgramShape:
+    statements: int
+    depth: int
+    variables: int
+    functions: int
+    seed: int = 0
+    layout: ProgramLayout = ProgramLayout.RANDOM
+
+
+class ProgramGenerator:
+    def __init__(self, shape: ProgramShape):
+        self.shape = shape
+        self.random = random.Random(shape.seed)
+
+    def variable(self) -> str:
+        return f"v{self.random.randrange(self.shape.variables)}"
+
+    def operand(self) -> str:
+        if self.random.random() < 0.7:  # noqa: PLR2004
+            return self.variable()
+        return str(self.random.randrange(10))
+
+    def expression(self, function: int) -> str:
+        choice = self.random.random()
+        if choice < 0.3:  # noqa: PLR2004
+            return self.operand()
+        elif choice < 0.8 or function == 0:  # noqa: PLR2004
+            operator = self.random.choice("+-*")
+            return f"{self.variable()} {operator} {self.operand()}"
+        else:
+            return f"f{self.random.randrange(function)}({self.variable()})"
+
+    def condition(self) -> str:
+        operator = self.random.choice(COMPARISON_OPERATORS)
+        if operator in EQUALITY_OPERATORS:
+            right = str(self.random.randrange(10))
+        elif self.random.random() < 0.3:  # noqa: PLR2004
+            right = "n"
+        else:
+            right = self.operand()
+        return f"{self.variable()} {operator} {right}"
+
+    def block(self, function: int, budget: int, depth: int, indent: str) -> list[str]:
+        lines = []
+
+        while budget > 0:
+            choice = self.random.random()
+            if depth < self.shape.depth and budget > 2 and choice < 0.2:  # noqa: PLR2004
+                size = self.random.randint(1, budget - 1)
+                lines.append(f"{indent}while ({self.condition()}) {{")
+                lines += self.block(function, size, depth + 1, indent + "    ")
+                lines.append(f"{indent}}}")
+                budget -= size + 1
+            elif depth < self.shape.depth and budget > 3 and choice < 0.4:  # noqa: PLR2004
+                size = self.random.randint(1, budget - 2)
+                if_size = self.random.randint(1, size)
+                lines.append(f"{indent}if ({self.condition()}) {{")
+                lines += self.block(function, if_size, depth + 1, indent + "    ")
+                lines.append(f"{indent}}} else {{")
+                lines += self.block(
+                    function, max(size - if_size, 1), depth + 1, indent + "    "
+                )
+                lines.append(f"{indent}}}")
+                budget -= size + 1
+            else:
+                lines.append(
+                    f"{indent}{self.variable()} = {self.expression(function)};"
+                )
+                budget -= 1
+
+        return lines
+
+    def nested_loops(self) -> list[str]:
+        lines = ["    y = 1;"]
+        for level in range(self.shape.depth):
+            indent = "    " * (level + 1)
+            lines += [
+                f"{indent}x{level} = 0;",
+                f"{indent}while (x{level} < n) {{",
+                f"{indent}    y = y + x{level};",
+            ]
+        for level in reversed(range(self.shape.depth)):
+            indent = "    " * (level + 1)
+            lines += [f"{indent}    x{level} = x{level} + 1;", f"{indent}}}"]
+        lines.append("    return y;")
+        return lines
+
+    def wide_loops(self) -> list[str]:
+        lines = [
+            f"    v{index} = {index % 3};" for index in range(self.shape.variables)
+        ]
+        for _ in range(self.shape.statements):
+            lines += [
+                f"    while ({self.variable()} < n) {{",
+                f"        if ({self.variable()} == 0) {{",
+            ]
+            lines += [
+                f"            {self.variable()} = {self.variable()} + 1;"
+                for _ in range(5)
+            ]
+            lines.append("        } else {")
+            lines += [
+                f"            {self.variable()} = {self.variable()};" for _ in range(5)
+            ]
+            lines += ["        }", "    }"]
+        lines.append("    return v0;")
+        return lines
+
+    def straight_line(self) -> list[str]:
+        lines = [f"    v{index} = {index};" for index in range(self.shape.variables)]
+        for _ in range(self.shape.statements):
+            target = self.variable()
+            lines.append(f"    {target} = {self.variable()} + 1;")
+        lines.append("    return v0;")
+        return lines
+
+    def random_block(self, function: int) -> list[str]:
+        lines = [f"    v{index} = {index};" for index in range(self.shape.variables)]
+        lines += self.block(function, self.shape.statements, 0, "    ")
+        lines.append(f"    return {self.variable()};")
+        return lines
+
+    def function(self, function: int) -> str:
+        match self.shape.layout:
+            case ProgramLayout.NESTED_LOOPS:
+                body = self.nested_loops()
+            case ProgramLayout.WIDE_LOOPS:
+                body = self.wide_loops()
+            case ProgramLayout.STRAIGHT_LINE:
+                body = self.straight_line()
+            case ProgramLayout.RANDOM:
+                body = self.random_block(function)
+        return "\n".join([f"function f{function}(n) {{", *body, "}"])
+
+    def program(self) -> str:
+        return "\n\n".join(
+            self.function(function) for function in range(self.shape.functions)
+        )
+
+
+def generate_program(shape: ProgramShape) -> str:
+    return ProgramGenerator(shape).program()
+
+
+def generate_function(shape: ProgramShape) -> Function:
+    return read_string(generate_program(shape), backend=ParserBackend.DESCENT)[0]
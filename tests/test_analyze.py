@@ -0,0 +1,98 @@
+import tempfile
+import unittest
+from concurrent.futures import Future
+from pathlib import Path
+from unittest import mock
+
+from small.analyze import (
+    AnalysisKind,
+    analyze_parallel,
+    analyze_task,
+    chunk_records,
+    expand_paths,
+    iter_tasks,
+)
+
+PROGRAMS = {
+    "empty.small": "function g() {\n}\n\nfunction main(n) {\n    x = n + 1;\n    return x;\n}\n",
+    "invalid.small": "function main( {\n",
+    "valid.small": "function main(n) {\n    x = 0;\n    while (x < n) {\n        x = x + 1;\n    }\n    return x;\n}\n",
+}
+
+
+class AnalyzeTestCase(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+        for name, program in PROGRAMS.items():
+            (self.directory / name).write_text(program)
+
+    def analyze(self, analysis: AnalysisKind) -> list[dict]:
+        return [
+            analyze_task(record, function, analysis)
+            for record, function in iter_tasks(
+                expand_paths([str(self.directory)]), analysis
+            )
+        ]
+
+    def test_one_record_per_function(self):
+        for analysis in AnalysisKind:
+            with self.subTest(analysis=analysis):
+                records = self.analyze(analysis)
+
+                self.assertEqual(
+                    [
+                        (Path(record["file"]).name, record.get("function"))
+                        for record in records
+                    ],
+                    [
+                        ("empty.small", "g"),
+                        ("empty.small", "main"),
+                        ("invalid.small", None),
+                        ("valid.small", "main"),
+                    ],
+                )
+                self.assertEqual(
+                    [("error" in record) for record in records],
+                    [True, False, True, False],
+                )
+
+    def test_unexpected_errors_become_records(self):
+        with mock.patch(
+            "small.analyze.analyze_function", side_effect=RuntimeError("boom")
+        ):
+            records = self.analyze(AnalysisKind.ZERO)
+
+        self.assertIn("RuntimeError: boom", [record["error"] for record in records])
+
+    def test_parallel_matches_sequential(self):
+        tasks = list(iter_tasks(expand_paths([str(self.directory)]), AnalysisKind.ZERO))
+
+        def strip_times(records: list[dict]) -> list[dict]:
+            return [
+                {
+                    key: value
+                    for key, value in record.items()
+                    if key not in ("parse_time", "solve_time")
+                }
+                for record in records
+            ]
+
+        self.assertEqual(
+            strip_times(
+                list(analyze_parallel(tasks, AnalysisKind.ZERO, jobs=2, chunk_size=1))
+            ),
+            strip_times(self.analyze(AnalysisKind.ZERO)),
+        )
+
+    def test_failed_chunks_become_records(self) -> None:
+        tasks = list(iter_tasks(expand_paths([str(self.directory)]), AnalysisKind.ZERO))
+        future: Future[list[dict]] = Future()
+        future.set_exception(RuntimeError("worker died"))
+
+        records = chunk_records(tasks, future)
+
+        self.assertEqual(len(records), len(tasks))
+        self.assertTrue(all("error" in record for record in records))
@@ -0,0 +1,126 @@
+import unittest
+
+from small import read_string
+from small.array_interval_analysis import ArrayIntervalEnvironment, solve_array
+from small.fixpoint import WideningPoints, WorklistOrder
+from small.interval_analysis import (
+    AbstractIntervalAnalysisScene,
+    IntervalExtremum,
+    IntervalInfinity,
+    IntIntervalValue,
+)
+from tests.test_fixpoint import (
+    generated_functions,
+    scene_functions,
+    solve_interval_analysis,
+)
+
+
+class ArrayIntervalAnalysisTestCase(unittest.TestCase):
+    def test_mapping_methods(self):
+        environment = {
+            "x": IntervalExtremum.BOTTOM,
+            "y": IntIntervalValue(-3, 7),
+            "z": IntIntervalValue(0, IntervalInfinity.POSITIVE),
+            "w": IntervalExtremum.TOP,
+        }
+        array_environment = ArrayIntervalEnvironment.of(environment)
+
+        self.assertEqual(list(array_environment.keys()), list(environment.keys()))
+        self.assertEqual(list(array_environment.values()), list(environment.values()))
+        self.assertEqual(list(array_environment.items()), list(environment.items()))
+        self.assertEqual(dict(array_environment), environment)
+
+    def test_keeps_bounds_outside_int64(self):
+        environment = {
+            "x": IntIntervalValue(10**20, 10**20),
+            "y": IntIntervalValue(-(2**63), 2**63 - 1),
+            "z": IntIntervalValue(0, 1),
+        }
+        array_environment = ArrayIntervalEnvironment.of(environment)
+        lattice = AbstractIntervalAnalysisScene.lattice
+
+        self.assertEqual(dict(array_environment), environment)
+        self.assertEqual(
+            dict(
+                array_environment.joined(
+                    lattice,
+                    array_environment.updated(
+                        {"x": IntIntervalValue(0, 0), "z": IntIntervalValue(5, 5)}
+                    ),
+                )
+            ),
+            {
+                "x": IntIntervalValue(0, 10**20),
+                "y": IntIntervalValue(-(2**63), 2**63 - 1),
+                "z": IntIntervalValue(0, 5),
+            },
+        )
+
+        function = read_string(
+            "function main(n) {\n    x = 10000000000;\n    y = x * x;\n    return y;\n}"
+        )[0]
+        for narrowing in (False, True):
+            with self.subTest(narrowing=narrowing):
+                expected = solve_interval_analysis(
+                    function,
+                    narrowing_operator=(
+                        AbstractIntervalAnalysisScene.narrowing_operator
+                        if narrowing
+                        else None
+                    ),
+                )
+                result = solve_array(function, narrowing=narrowing)
+                environments = {
+                    program_point: None if environment is None else dict(environment)
+                    for program_point, environment in result.environments.items()
+                }
+
+                self.assertEqual(environments, expected.environments)
+                self.assertIn(
+                    IntIntervalValue(10**20, 10**20),
+                    [
+                        environment["y"]
+                        for environment in environments.values()
+                        if environment is not None
+                    ],
+                )
+
+    def test_matches_dict_environments(self):
+        functions = {
+            **scene_functions(AbstractIntervalAnalysisScene),
+            **generated_functions(),
+        }
+
+        for name, function in functions.items():
+            for order in WorklistOrder:
+                for narrowing in (False, True):
+                    with self.subTest(function=name, order=order, narrowing=narrowing):
+                        expected = solve_interval_analysis(
+                            function,
+                            order=order,
+                            widening_points=WideningPoints.LOOP_HEADS,
+                            narrowing_operator=(
+                                AbstractIntervalAnalysisScene.narrowing_operator
+                                if narrowing
+                                else None
+                            ),
+                        )
+                        result = solve_array(
+                            function,
+                            order=order,
+                            widening_points=WideningPoints.LOOP_HEADS,
+                            narrowing=narrowing,
+                        )
+
+                        self.assertEqual(
+                            {
+                                program_point: None
+                                if environment is None
+                                else dict(environment.items())
+                                for program_point, environment in (
+                                    result.environments.items()
+                                )
+                            },
+                            expected.environments,
+                        )
@@ -0,0 +1,274 @@
+import inspect
+import unittest
+from functools import reduce
+from typing import Any
+
+import scenes
+from small import read_string
+from small.fixpoint import WideningPoints, WorklistOrder, initial_environment, solve
+from small.interval_analysis import AbstractIntervalAnalysisScene, IntIntervalValue
+from small.zero_analysis import AbstractZeroAnalysisScene
+from tests.programs import (
+    RESET_COUNTER,
+    ProgramLayout,
+    ProgramShape,
+    generate_function,
+    generate_program,
+)
+
+
+def scene_functions(base: type) -> dict:
+    classes: list[tuple[str, Any]] = inspect.getmembers(scenes, inspect.isclass)
+    return {
+        name: read_string(scene.program_string.lstrip("\n"))[0]
+        for name, scene in classes
+        if issubclass(scene, base) and scene is not base
+    }
+
+
+def generated_functions(count: int = 10) -> dict:
+    return {
+        f"{function.name}@{seed}": function
+        for seed in range(count)
+        for function in read_string(
+            generate_program(ProgramShape(25, 2, 4, 2, seed)), cache=False
+        )
+    }
+
+
+def nested_loop_functions(depths: tuple[int, ...] = (2, 4, 8)) -> dict:
+    return {
+        f"NestedLoops{depth}": generate_function(
+            ProgramShape(0, depth, 0, 1, layout=ProgramLayout.NESTED_LOOPS)
+        )
+        for depth in depths
+    }
+
+
+def round_robin_solve(function, scene) -> dict:
+    lattice = scene.lattice
+    entry, graph = function.to_cfg()
+    graph.add_node(entry)
+
+    def join(environment1: dict, environment2: dict) -> dict:
+        return {
+            variable: lattice.join(value, environment2[variable])
+            for variable, value in environment1.items()
+        }
+
+    environments = dict.fromkeys(graph.nodes)
+    changed = True
+    while changed:
+        changed = False
+
+        for program_point in graph.nodes:
+            inputs: list[dict] = []
+            if program_point == entry:
+                inputs.append(initial_environment(function, lattice))
+
+            for predecessor, _, condition in graph.in_edges(
+                program_point, data="condition"
+            ):
+                if (environment := environments[predecessor]) is None:
+                    continue
+
+                variables, _ = scene.condition_update_function.get_variables(
+                    condition, environment
+                )
+                if variables is not None:
+                    inputs.append({**environment, **variables})
+
+            if not inputs:
+                continue
+
+            environment = reduce(join, inputs)
+            variables, _ = scene.control_flow_function.get_variables(
+                program_point, environment
+            )
+            environment = {**environment, **variables}
+
+            if environment != environments[program_point]:
+                environments[program_point] = environment
+                changed = True
+
+    return environments
+
+
+def solve_interval_analysis(function, **kwargs):
+    scene = AbstractIntervalAnalysisScene
+    return solve(
+        function,
+        scene.lattice,
+        scene.control_flow_function,
+        scene.condition_update_function,
+        scene.widening_operator,
+        **kwargs,
+    )
+
+
+def solve_zero_analysis(function, **kwargs):
+    scene = AbstractZeroAnalysisScene
+    return solve(
+        function,
+        scene.lattice,
+        scene.control_flow_function,
+        scene.condition_update_function,
+        **kwargs,
+    )
+
+
+class WorklistOrderTestCase(unittest.TestCase):
+    def test_orders_reach_the_same_fixpoint(self):
+        functions = {
+            **scene_functions(AbstractZeroAnalysisScene),
+            **nested_loop_functions(),
+        }
+        for name, function in functions.items():
+            expected = solve_zero_analysis(function).environments
+            for order in WorklistOrder:
+                with self.subTest(scene=name, order=order):
+                    self.assertEqual(
+                        solve_zero_analysis(function, order=order).environments,
+                        expected,
+                    )
+
+    def test_weak_topological_order_needs_fewer_iterations_on_scenes(self):
+        for name, function in scene_functions(AbstractZeroAnalysisScene).items():
+            with self.subTest(scene=name):
+                self.assertLessEqual(
+                    solve_zero_analysis(
+                        function, order=WorklistOrder.WEAK_TOPOLOGICAL
+                    ).iterations,
+                    solve_zero_analysis(function).iterations,
+                )
+
+    def test_reverse_postorder_needs_fewer_iterations_on_loop_nests(self):
+        for name, function in nested_loop_functions((8, 16)).items():
+            with self.subTest(program=name):
+                self.assertLess(
+                    solve_interval_analysis(
+                        function, order=WorklistOrder.REVERSE_POSTORDER
+                    ).iterations,
+                    solve_interval_analysis(
+                        function, order=WorklistOrder.WEAK_TOPOLOGICAL
+                    ).iterations,
+                )
+
+
+class HeadlessSolverTestCase(unittest.TestCase):
+    def test_matches_round_robin_iteration(self):
+        functions = {
+            **scene_functions(AbstractZeroAnalysisScene),
+            **generated_functions(),
+        }
+
+        for name, function in functions.items():
+            with self.subTest(function=name):
+                result = solve_zero_analysis(function)
+
+                self.assertEqual(
+                    {
+                        program_point: None
+                        if environment is None
+                        else dict(environment)
+                        for program_point, environment in result.environments.items()
+                    },
+                    round_robin_solve(function, AbstractZeroAnalysisScene),
+                )
+
+
+WIDENING_STRATEGIES = {
+    "loop-heads": {"widening_points": WideningPoints.LOOP_HEADS},
+    "delay": {"widening_points": WideningPoints.LOOP_HEADS, "widening_delay": 1},
+    "narrowing": {
+        "widening_points": WideningPoints.LOOP_HEADS,
+        "narrowing_operator": AbstractIntervalAnalysisScene.narrowing_operator,
+    },
+    "delay+narrowing": {
+        "widening_points": WideningPoints.LOOP_HEADS,
+        "widening_delay": 1,
+        "narrowing_operator": AbstractIntervalAnalysisScene.narrowing_operator,
+    },
+}
+
+
+class WideningStrategyTestCase(unittest.TestCase):
+    def assert_at_least_as_precise(self, environments, expected_environments):
+        lattice = AbstractIntervalAnalysisScene.lattice
+
+        self.assertEqual(environments.keys(), expected_environments.keys())
+        for program_point, expected_environment in expected_environments.items():
+            environment = environments[program_point]
+            if expected_environment is None:
+                self.assertIsNone(environment)
+                continue
+
+            for variable, expected_value in expected_environment.items():
+                self.assertEqual(
+                    lattice.join(environment[variable], expected_value),
+                    expected_value,
+                    f"{variable} at {program_point}",
+                )
+
+    def test_strategies_are_at_least_as_precise(self):
+        functions = {
+            **scene_functions(AbstractIntervalAnalysisScene),
+            "ResetCounter": read_string(RESET_COUNTER.strip())[0],
+        }
+
+        for name, function in functions.items():
+            expected = solve_interval_analysis(function).environments
+            for strategy, options in WIDENING_STRATEGIES.items():
+                with self.subTest(function=name, strategy=strategy):
+                    self.assert_at_least_as_precise(
+                        solve_interval_analysis(function, **options).environments,
+                        expected,
+                    )
+
+    def test_delay_and_narrowing_recover_bounds(self):
+        function = read_string(RESET_COUNTER.strip())[0]
+        return_point = next(
+            program_point
+            for program_point in function.to_compact_cfg().program_points
+            if program_point.statement.header == "return x"
+        )
+
+        for strategy in ("delay", "narrowing"):
+            with self.subTest(strategy=strategy):
+                result = solve_interval_analysis(
+                    function, **WIDENING_STRATEGIES[strategy]
+                )
+                self.assertEqual(
+                    result.environments[return_point]["x"], IntIntervalValue(0, 1)
+                )
+
+
+class PersistentEnvironmentTestCase(unittest.TestCase):
+    def test_matches_dict_environments(self):
+        analyses = {
+            "zero": (solve_zero_analysis, AbstractZeroAnalysisScene),
+            "interval": (solve_interval_analysis, AbstractIntervalAnalysisScene),
+        }
+
+        for analysis, (solve_analysis, scene) in analyses.items():
+            functions = {**scene_functions(scene), **generated_functions(5)}
+            for name, function in functions.items():
+                for order in WorklistOrder:
+                    with self.subTest(analysis=analysis, function=name, order=order):
+                        expected = solve_analysis(function, order=order)
+                        result = solve_analysis(
+                            function, order=order, persistent_environments=True
+                        )
+
+                        self.assertEqual(result.iterations, expected.iterations)
+                        self.assertEqual(
+                            {
+                                program_point: None
+                                if environment is None
+                                else dict(environment)
+                                for program_point, environment in (
+                                    result.environments.items()
+                                )
+                            },
+                            expected.environments,
+                        )
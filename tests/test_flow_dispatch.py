@@ -0,0 +1,62 @@
+import unittest
+
+from small.ast import Assignment
+from small.interval_analysis import (
+    AbstractIntervalAnalysisScene,
+    DispatchIntervalAnalysisFlowFunction,
+    IntervalAnalysisFlowFunction,
+)
+from small.zero_analysis import (
+    AbstractZeroAnalysisScene,
+    DispatchZeroAnalysisFlowFunction,
+    ZeroAnalysisFlowFunction,
+)
+from tests.test_fixpoint import (
+    scene_functions,
+    solve_interval_analysis,
+    solve_zero_analysis,
+)
+
+ANALYSES = {
+    "zero": (
+        solve_zero_analysis,
+        ZeroAnalysisFlowFunction(),
+        DispatchZeroAnalysisFlowFunction(),
+    ),
+    "interval": (
+        solve_interval_analysis,
+        IntervalAnalysisFlowFunction(),
+        DispatchIntervalAnalysisFlowFunction(),
+    ),
+}
+
+
+class FlowDispatchTestCase(unittest.TestCase):
+    def test_dispatch_matches_the_match_rules(self):
+        functions = {
+            **scene_functions(AbstractZeroAnalysisScene),
+            **scene_functions(AbstractIntervalAnalysisScene),
+        }
+
+        for analysis, (solve_analysis, reference, dispatch) in ANALYSES.items():
+            for name, function in functions.items():
+                result = solve_analysis(function)
+                environments = [
+                    environment
+                    for environment in result.environments.values()
+                    if environment is not None
+                ]
+
+                for program_point in result.environments:
+                    statement = program_point.statement
+                    if not isinstance(statement, Assignment):
+                        continue
+
+                    for environment in environments:
+                        with self.subTest(
+                            analysis=analysis, scene=name, statement=str(statement)
+                        ):
+                            self.assertEqual(
+                                dispatch.get_variables(statement, environment),
+                                reference.get_variables(statement, environment),
+                            )
@@ -0,0 +1,89 @@
+import unittest
+
+from small import ParserBackend, read_string
+from small.fixpoint import solve
+from small.incremental import IncrementalAnalysis
+from small.interval_analysis import AbstractIntervalAnalysisScene
+from small.zero_analysis import AbstractZeroAnalysisScene
+
+SOURCE = """function helper(a) {
+    b = a * 2;
+    return b;
+}
+
+function main(n) {
+    x = 0;
+    y = 1;
+    while (x < n) {
+        if (y > 10) {
+            y = y - 1;
+        } else {
+            y = y + x;
+        }
+        x = x + 1;
+    }
+    z = helper(y);
+    return z;
+}
+"""
+
+EDITS = {
+    "constant": ("y = 1;", "y = 0;"),
+    "loop start": ("x = 0;", "x = 5;"),
+    "condition": ("if (y > 10)", "if (y > 0)"),
+    "insertion": ("        x = x + 1;\n", "        x = x + 1;\n        y = y * 2;\n"),
+    "deletion": ("    y = 1;\n", ""),
+    "loop": ("while (x < n)", "while (x < 5)"),
+    "new variable": ("    z = helper(y);\n", "    w = x;\n    z = helper(w);\n"),
+    "other function": ("b = a * 2;", "b = a - a;"),
+    "new function": (
+        "function main",
+        "function extra() {\n    return 0;\n}\n\nfunction main",
+    ),
+}
+
+
+class IncrementalAnalysisTestCase(unittest.TestCase):
+    def test_reanalysis_matches_a_full_analysis(self):
+        for scene in (AbstractZeroAnalysisScene, AbstractIntervalAnalysisScene):
+            analysis = IncrementalAnalysis(
+                scene.lattice,
+                scene.control_flow_function,
+                scene.condition_update_function,
+                getattr(scene, "widening_operator", None),
+            )
+            state = analysis.analyze(SOURCE)
+
+            for name, (old, new) in EDITS.items():
+                with self.subTest(analysis=scene.__name__, edit=name):
+                    source = SOURCE.replace(old, new)
+                    self.assertNotEqual(source, SOURCE)
+
+                    edited_state = analysis.analyze(source, state)
+
+                    for function in read_string(
+                        source, cache=False, backend=ParserBackend.DESCENT
+                    ):
+                        expected = solve(
+                            function,
+                            scene.lattice,
+                            scene.control_flow_function,
+                            scene.condition_update_function,
+                            getattr(scene, "widening_operator", None),
+                        )
+                        self.assertEqual(
+                            edited_state.analyses[function.name].result.environments,
+                            expected.environments,
+                        )
+
+    def test_unchanged_functions_are_reused(self):
+        scene = AbstractZeroAnalysisScene
+        analysis = IncrementalAnalysis(
+            scene.lattice, scene.control_flow_function, scene.condition_update_function
+        )
+        state = analysis.analyze(SOURCE)
+
+        edited_state = analysis.analyze(SOURCE.replace("y = 1;", "y = 0;"), state)
+
+        self.assertIs(edited_state.analyses["helper"], state.analyses["helper"])
+        self.assertIsNot(edited_state.analyses["main"], state.analyses["main"])
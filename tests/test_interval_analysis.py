@@ -0,0 +1,152 @@
+import unittest
+
+from small import read_string
+from small.ast import (
+    IntComparisonExpression,
+    IntComparisonOperator,
+    IntConstant,
+    Variable,
+)
+from small.fixpoint import WideningPoints, solve
+from small.interval_analysis import (
+    AbstractIntervalAnalysisScene,
+    BoolIntervalValue,
+    IntervalAnalysisLattice,
+    IntervalAnalysisThresholdWideningOperator,
+    IntervalExtremum,
+    IntervalInfinity,
+    IntIntervalValue,
+)
+
+BOUNDED_LOOP = """
+function main() {
+    i = 0;
+    while (i < 10) {
+        i = i + 1;
+    }
+    return i;
+}
+"""
+
+LATTICE_VALUES = (
+    IntervalExtremum.BOTTOM,
+    IntervalExtremum.TOP,
+    BoolIntervalValue(True, True),
+    BoolIntervalValue(False, True),
+    IntIntervalValue(0, 0),
+    IntIntervalValue(5, 5),
+    IntIntervalValue(-6, -6),
+    IntIntervalValue(100, 100),
+    IntIntervalValue(0, 3),
+    IntIntervalValue(IntervalInfinity.NEGATIVE, 4),
+    IntIntervalValue(2, IntervalInfinity.POSITIVE),
+    IntIntervalValue(IntervalInfinity.NEGATIVE, IntervalInfinity.POSITIVE),
+)
+
+
+class IntervalAnalysisLatticeTestCase(unittest.TestCase):
+    def test_neighbour_limit_bounds_the_successors_of_bottom(self):
+        lattice = IntervalAnalysisLattice(10**6, neighbour_limit=10)
+
+        self.assertEqual(len(list(lattice.successors(lattice.bottom()))), 13)
+        self.assertIn(IntIntervalValue(-5, -5), lattice.successors(lattice.bottom()))
+        self.assertNotIn(IntIntervalValue(6, 6), lattice.successors(lattice.bottom()))
+
+    def test_neighbours_are_symmetric(self):
+        for neighbour_limit in (None, 10):
+            lattice = IntervalAnalysisLattice(10**6, neighbour_limit=neighbour_limit)
+            for value in LATTICE_VALUES:
+                if value == lattice.bottom() and neighbour_limit is None:
+                    continue
+
+                with self.subTest(neighbour_limit=neighbour_limit, value=value):
+                    for successor in lattice.successors(value):
+                        self.assertIn(value, lattice.predecessors(successor))
+                    for predecessor in lattice.predecessors(value):
+                        self.assertIn(value, lattice.successors(predecessor))
+
+    def test_depth_grows_along_successors(self):
+        lattice = IntervalAnalysisLattice(10**6, neighbour_limit=10)
+
+        self.assertEqual(lattice.height(), 2 * 10**6 + 4)
+        self.assertEqual(lattice.depth(lattice.bottom()), 0)
+        self.assertEqual(lattice.depth(lattice.top()), lattice.height())
+        self.assertEqual(lattice.depth(IntIntervalValue(0, 9)), 10)
+
+        for value in LATTICE_VALUES:
+            with self.subTest(value=value):
+                for successor in lattice.successors(value):
+                    self.assertGreater(lattice.depth(successor), lattice.depth(value))
+
+
+class ConditionUpdateFunctionTestCase(unittest.TestCase):
+    condition_update_function = AbstractIntervalAnalysisScene.condition_update_function
+
+    def test_guards_refine_bounds(self):
+        environment = {"i": IntIntervalValue(0, IntervalInfinity.POSITIVE)}
+        refinements = {
+            IntComparisonOperator.LT: IntIntervalValue(0, 9),
+            IntComparisonOperator.LTE: IntIntervalValue(0, 10),
+            IntComparisonOperator.GT: IntIntervalValue(11, IntervalInfinity.POSITIVE),
+            IntComparisonOperator.GTE: IntIntervalValue(10, IntervalInfinity.POSITIVE),
+        }
+
+        for operator, expected in refinements.items():
+            with self.subTest(operator=operator):
+                variables, _ = self.condition_update_function.get_variables(
+                    IntComparisonExpression(Variable("i"), operator, IntConstant(10)),
+                    environment,
+                )
+                self.assertEqual(variables, {"i": expected})
+
+    def test_guards_with_the_constant_on_the_left(self):
+        variables, _ = self.condition_update_function.get_variables(
+            IntComparisonExpression(
+                IntConstant(10), IntComparisonOperator.GT, Variable("i")
+            ),
+            {"i": IntIntervalValue(IntervalInfinity.NEGATIVE, 20)},
+        )
+        self.assertEqual(
+            variables, {"i": IntIntervalValue(IntervalInfinity.NEGATIVE, 9)}
+        )
+
+    def test_guards_that_always_hold_do_not_change_bounds(self):
+        variables, _ = self.condition_update_function.get_variables(
+            IntComparisonExpression(
+                Variable("i"), IntComparisonOperator.LT, IntConstant(10)
+            ),
+            {"i": IntIntervalValue(0, 5)},
+        )
+        self.assertEqual(variables, {})
+
+
+class ThresholdWideningTestCase(unittest.TestCase):
+    def test_bounded_loop_has_finite_bounds(self):
+        scene = AbstractIntervalAnalysisScene
+        function = read_string(BOUNDED_LOOP.strip())[0]
+        widening_operator = IntervalAnalysisThresholdWideningOperator.from_function(
+            scene.lattice, function
+        )
+
+        for widening_points in WideningPoints:
+            with self.subTest(widening_points=widening_points):
+                result = solve(
+                    function,
+                    scene.lattice,
+                    scene.control_flow_function,
+                    scene.condition_update_function,
+                    widening_operator,
+                    widening_points=widening_points,
+                )
+                self.assertEqual(
+                    {
+                        program_point.statement.header: environment["i"]
+                        for program_point, environment in result.environments.items()
+                    },
+                    {
+                        "i = 0": IntIntervalValue(0, 0),
+                        "while (i < 10)": IntIntervalValue(0, 10),
+                        "i = i + 1": IntIntervalValue(1, 10),
+                        "return i": IntIntervalValue(10, 10),
+                    },
+                )
@@ -0,0 +1,42 @@
+import unittest
+
+from small.fixpoint import solve
+from small.interval_analysis import AbstractIntervalAnalysisScene
+from small.memoization import MemoizedControlFlowFunction
+from small.zero_analysis import AbstractZeroAnalysisScene
+from tests.test_fixpoint import scene_functions
+
+
+def solve_with(scene, function, control_flow_function):
+    return solve(
+        function,
+        scene.lattice,
+        control_flow_function,
+        scene.condition_update_function,
+        getattr(scene, "widening_operator", None),
+    )
+
+
+class MemoizedControlFlowFunctionTestCase(unittest.TestCase):
+    def test_matches_the_wrapped_function(self):
+        for scene in (AbstractZeroAnalysisScene, AbstractIntervalAnalysisScene):
+            control_flow_function = MemoizedControlFlowFunction(
+                scene.control_flow_function
+            )
+
+            for name, function in scene_functions(scene).items():
+                with self.subTest(scene=name):
+                    expected = solve_with(scene, function, scene.control_flow_function)
+
+                    misses = control_flow_function.misses
+                    result = solve_with(scene, function, control_flow_function)
+                    self.assertEqual(result.environments, expected.environments)
+                    self.assertEqual(result.iterations, expected.iterations)
+                    self.assertGreater(control_flow_function.misses, misses)
+
+                    hits = control_flow_function.hits
+                    misses = control_flow_function.misses
+                    result = solve_with(scene, function, control_flow_function)
+                    self.assertEqual(result.environments, expected.environments)
+                    self.assertEqual(control_flow_function.misses, misses)
+                    self.assertGreater(control_flow_function.hits, hits)
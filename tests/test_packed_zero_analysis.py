@@ -0,0 +1,38 @@
+import unittest
+
+from small.analyze import SolverOptions
+from small.fixpoint import WorklistOrder
+from small.packed_zero_analysis import PackedZeroEnvironment, solve_packed
+from small.zero_analysis import AbstractZeroAnalysisScene
+from tests.test_fixpoint import (
+    generated_functions,
+    scene_functions,
+    solve_zero_analysis,
+)
+
+
+class PackedZeroAnalysisTestCase(unittest.TestCase):
+    def test_matches_dict_environments(self):
+        functions = {
+            **scene_functions(AbstractZeroAnalysisScene),
+            **generated_functions(),
+        }
+
+        for name, function in functions.items():
+            for order in WorklistOrder:
+                with self.subTest(function=name, order=order):
+                    expected = solve_zero_analysis(function, order=order)
+                    result = solve_packed(function, order=order)
+
+                    self.assertEqual(result.iterations, expected.iterations)
+                    for program_point, environment in result.environments.items():
+                        expected_environment = expected.environments[program_point]
+                        if expected_environment is None:
+                            self.assertIsNone(environment)
+                        else:
+                            self.assertIsInstance(environment, PackedZeroEnvironment)
+                            self.assertEqual(dict(environment), expected_environment)
+
+    def test_packed_environments_cannot_be_persistent(self):
+        with self.assertRaises(ValueError):
+            SolverOptions(persistent_environments=True, packed=True)
@@ -0,0 +1,41 @@
+import tempfile
+import unittest
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+
+from small.parse_cache import ParseCache, schema_version, source_key
+
+
+class ParseCacheTestCase(unittest.TestCase):
+    def test_memory_cache(self):
+        cache = ParseCache()
+
+        self.assertEqual(cache.get_or_parse("x", lambda: ()), ())
+        self.assertEqual(cache.get_or_parse("x", lambda: ()), ())
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_stale_pickle_is_a_miss(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ParseCache(directory=Path(directory))
+            (Path(directory) / f"{source_key('x')}.pickle").write_bytes(
+                b"cmissing_module\nMissingClass\n."
+            )
+
+            self.assertEqual(cache.get_or_parse("x", lambda: ()), ())
+            self.assertEqual(cache.misses, 1)
+
+    def test_schema_version_follows_the_fields(self):
+        def module(*fields: str) -> ModuleType:
+            module = ModuleType("schema")
+            node: type = dataclass(
+                type("Node", (), {"__annotations__": dict.fromkeys(fields, "int")})
+            )
+            node.__module__ = module.__name__
+            module.Node = node  # type: ignore[attr-defined]
+            return module
+
+        self.assertEqual(schema_version(module("a")), schema_version(module("a")))
+        self.assertNotEqual(
+            schema_version(module("a")), schema_version(module("a", "b"))
+        )
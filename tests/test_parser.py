@@ -0,0 +1,124 @@
+import inspect
+import re
+import unittest
+
+import scenes
+from small import ParserBackend, iter_string, read_string
+from small.ast.builder import CannotBuildAstException
+from tests.programs import ProgramShape, generate_program
+
+INVALID_PROGRAMS = (
+    "function main() {\n    x = ;\n    return x;\n}",
+    "function main() {\n    x = 1\n    return x;\n}",
+    "function main() {\n    x = True;\n    y = x + 1;\n    return y;\n}",
+    "function main() {\n    return f(1);\n}",
+    "function main() {\n    x = 1;\n    return x;\n",
+    "function main() {\n    if (x < 1) {\n        x = 1;\n    }\n    return x;\n}",
+    "function f(a) {\n    return a;\n}\nfunction main() {\n    return f(1, 2);\n}",
+    "function main() {\n    return y;\n}\nfunction main() {\n    return y;\n}",
+)
+
+INCREMENT = "function f(a) {\n    b = a + 1;\n    return b;\n}"
+
+FORWARD_CALL = "function main() {\n    x = f(1);\n    return x;\n}"
+
+CHAIN = "function g(a) {\n    b = a + 1;\n    c = f(b);\n    return c;\n}"
+
+
+def error_line(error: Exception) -> int | None:
+    if isinstance(error, CannotBuildAstException):
+        return error.line
+
+    match = re.match(r"line (\d+):", str(error))
+    return None if match is None else int(match.group(1))
+
+
+class ParserBackendTestCase(unittest.TestCase):
+    def assert_same_functions(self, source: str):
+        self.assertEqual(
+            read_string(source, cache=False, backend=ParserBackend.DESCENT),
+            read_string(source, cache=False, backend=ParserBackend.ANTLR),
+        )
+
+    def test_scene_programs(self):
+        for _, scene in inspect.getmembers(scenes, inspect.isclass):
+            if isinstance(program := getattr(scene, "program_string", None), str):
+                with self.subTest(scene=scene.__name__):
+                    self.assert_same_functions(program)
+
+    def test_generated_programs(self):
+        for seed in range(20):
+            shape = ProgramShape(30, seed % 4, 5, 3, seed)
+            with self.subTest(shape=shape):
+                self.assert_same_functions(generate_program(shape))
+
+    def test_invalid_programs(self):
+        for source in INVALID_PROGRAMS:
+            with self.subTest(source=source):
+                with self.assertRaises(
+                    (ValueError, CannotBuildAstException)
+                ) as antlr_error:
+                    read_string(source, cache=False, backend=ParserBackend.ANTLR)
+                with self.assertRaises(
+                    (ValueError, CannotBuildAstException)
+                ) as descent_error:
+                    read_string(source, cache=False, backend=ParserBackend.DESCENT)
+
+                self.assertEqual(
+                    error_line(descent_error.exception),
+                    error_line(antlr_error.exception),
+                )
+                if isinstance(antlr_error.exception, CannotBuildAstException):
+                    self.assertEqual(
+                        str(descent_error.exception), str(antlr_error.exception)
+                    )
+
+    def test_cache_is_per_backend(self):
+        source = INVALID_PROGRAMS[0].replace("x = ;", "x = 1;")
+        functions = read_string(source, backend=ParserBackend.ANTLR)
+
+        self.assertIsNot(read_string(source, backend=ParserBackend.DESCENT), functions)
+        self.assertIs(read_string(source, backend=ParserBackend.ANTLR), functions)
+
+
+class IterStringTestCase(unittest.TestCase):
+    def assert_streams(self, source: str, functions: dict[str, str]):
+        self.assertEqual(
+            [
+                (function.name, function.function_code)
+                for function in iter_string(source)
+            ],
+            list(functions.items()),
+        )
+
+    def test_functions_are_yielded_in_order(self):
+        source = f"{INCREMENT}\n{FORWARD_CALL}"
+
+        self.assertEqual(tuple(iter_string(source)), read_string(source, cache=False))
+
+    def test_forward_call_waits_for_its_callee(self):
+        self.assert_streams(
+            f"{FORWARD_CALL}\n{INCREMENT}", {"f": INCREMENT, "main": FORWARD_CALL}
+        )
+
+    def test_chained_forward_calls(self):
+        self.assert_streams(
+            f"{FORWARD_CALL.replace('f(1)', 'g(1)')}\n{CHAIN}\n{INCREMENT}",
+            {"f": INCREMENT, "g": CHAIN, "main": FORWARD_CALL.replace("f(1)", "g(1)")},
+        )
+
+    def test_undeclared_callee(self):
+        functions = iter_string(f"{INCREMENT}\n{FORWARD_CALL.replace('f(1)', 'h(1)')}")
+
+        self.assertEqual(next(functions).name, "f")
+        with self.assertRaises(CannotBuildAstException) as error:
+            next(functions)
+        self.assertEqual(error.exception.line, 6)
+
+    def test_syntax_error_after_yielded_functions(self):
+        functions = iter_string(f"{INCREMENT}\n{INVALID_PROGRAMS[0]}")
+
+        self.assertEqual(next(functions).name, "f")
+        with self.assertRaises(ValueError) as error:
+            next(functions)
+        self.assertEqual(error_line(error.exception), 6)
@@ -0,0 +1,119 @@
+import unittest
+from types import SimpleNamespace
+
+from small import read_string
+from small.array_interval_analysis import solve_array
+from small.fixpoint import WideningPoints, solve
+from small.interval_analysis import AbstractIntervalAnalysisScene
+from small.packed_zero_analysis import solve_packed
+from small.profiling import profiling
+from tests.programs import RESET_COUNTER
+from tests.test_fixpoint import solve_interval_analysis, solve_zero_analysis
+
+
+def rule_hits(profile, function) -> int:
+    return sum(
+        hits
+        for (name, _), hits in profile.rule_hits.items()
+        if name == type(function).__name__
+    )
+
+
+class ProfilingTestCase(unittest.TestCase):
+    def solve(self, function, **kwargs):
+        return solve_interval_analysis(
+            function,
+            widening_points=WideningPoints.LOOP_HEADS,
+            narrowing_operator=AbstractIntervalAnalysisScene.narrowing_operator,
+            **kwargs,
+        )
+
+    def test_records_the_solve(self):
+        scene = AbstractIntervalAnalysisScene
+
+        with profiling() as profile:
+            function = read_string(RESET_COUNTER.lstrip("\n"), cache=False)[0]
+            result = self.solve(function)
+
+        self.assertLessEqual({"parse", "build", "cfg", "solve"}, profile.phases.keys())
+        for counter in ("statements", "conditions", "joins", "widenings"):
+            with self.subTest(counter=counter):
+                self.assertGreater(profile.counters[counter], 0)
+        self.assertGreater(profile.counters["narrowings"], 0)
+        self.assertLessEqual(profile.counters["statements"], result.iterations)
+        self.assertEqual(
+            rule_hits(profile, scene.control_flow_function),
+            profile.counters["statements"],
+        )
+        self.assertEqual(
+            rule_hits(profile, scene.condition_update_function),
+            profile.counters["conditions"],
+        )
+
+    def test_instrumented_scene_is_counted_once(self):
+        function = read_string(RESET_COUNTER.lstrip("\n"), cache=False)[0]
+        scene = AbstractIntervalAnalysisScene
+
+        with profiling() as expected:
+            self.solve(function)
+
+        with profiling() as profile:
+            instrumented = SimpleNamespace(
+                lattice=scene.lattice,
+                control_flow_function=scene.control_flow_function,
+                condition_update_function=scene.condition_update_function,
+                widening_operator=scene.widening_operator,
+                narrowing_operator=scene.narrowing_operator,
+            )
+            profile.instrument_scene(instrumented)
+            solve(
+                function,
+                instrumented.lattice,
+                instrumented.control_flow_function,
+                instrumented.condition_update_function,
+                instrumented.widening_operator,
+                widening_points=WideningPoints.LOOP_HEADS,
+                narrowing_operator=instrumented.narrowing_operator,
+            )
+
+        self.assertEqual(profile.counters, expected.counters)
+        self.assertEqual(profile.rule_hits, expected.rule_hits)
+
+    def test_counts_packed_environments(self):
+        function = read_string(RESET_COUNTER.lstrip("\n"), cache=False)[0]
+
+        with profiling() as expected:
+            solve_zero_analysis(function)
+        with profiling() as profile:
+            solve_packed(function)
+
+        self.assertGreater(profile.counters["joins"], 0)
+        self.assertEqual(profile.counters, expected.counters)
+        self.assertEqual(profile.rule_hits, expected.rule_hits)
+
+    def test_counts_array_environments(self):
+        function = read_string(RESET_COUNTER.lstrip("\n"), cache=False)[0]
+
+        with profiling() as expected:
+            self.solve(function)
+        with profiling() as profile:
+            solve_array(
+                function, widening_points=WideningPoints.LOOP_HEADS, narrowing=True
+            )
+
+        for counter in ("joins", "widenings", "narrowings"):
+            with self.subTest(counter=counter):
+                self.assertGreater(profile.counters[counter], 0)
+        self.assertEqual(profile.counters, expected.counters)
+        self.assertEqual(profile.rule_hits, expected.rule_hits)
+
+    def test_records_nothing_outside_the_context(self):
+        function = read_string(RESET_COUNTER.lstrip("\n"), cache=False)[0]
+
+        with profiling() as profile:
+            pass
+        self.solve(function)
+
+        self.assertFalse(profile.phases)
+        self.assertFalse(profile.counters)
+        self.assertFalse(profile.rule_hits)
@@ -0,0 +1,30 @@
+import unittest
+from unittest import mock
+
+import scenes
+from small.render_cache import normalize_program, scene_key
+
+
+class NormalizeProgramTestCase(unittest.TestCase):
+    def test_line_endings_and_trailing_whitespace_are_ignored(self):
+        self.assertEqual(
+            normalize_program("\nx = 1;  \r\nreturn x;\n\n"),
+            normalize_program("x = 1;\nreturn x;"),
+        )
+
+    def test_indentation_is_kept(self):
+        self.assertNotEqual(
+            normalize_program("while (x < 1) {\n    x = x + 1;\n}"),
+            normalize_program("while (x < 1) {\nx = x + 1;\n}"),
+        )
+
+
+class SceneKeyTestCase(unittest.TestCase):
+    def test_analysis_source_is_part_of_the_key(self):
+        scene = scenes.SumIntervalAnalysisScene
+        key = scene_key(scene, "854x480@15")
+
+        self.assertEqual(scene_key(scene, "854x480@15"), key)
+        self.assertNotEqual(scene_key(scene, "1920x1080@60"), key)
+        with mock.patch("small.render_cache.module_source_hash", return_value=""):
+            self.assertNotEqual(scene_key(scene, "854x480@15"), key)
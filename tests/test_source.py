@@ -0,0 +1,62 @@
+import pickle
+import unittest
+
+from small.ast.source import LineIndex, SourceSlice
+
+
+class LineIndexTestCase(unittest.TestCase):
+    def test_last_line_without_trailing_newline(self):
+        index = LineIndex("x = 1;\nreturn x;")
+
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.slice(2, 2), "return x;")
+        self.assertEqual(index.slice(1, 2), "x = 1;\nreturn x;")
+
+    def test_last_line_with_trailing_newline(self):
+        index = LineIndex("x = 1;\nreturn x;\n")
+
+        self.assertEqual(index.slice(2, 2), "return x;")
+        self.assertEqual(index.slice(1, 2), "x = 1;\nreturn x;")
+
+    def test_crlf_line_endings(self):
+        index = LineIndex("x = 1;\r\nreturn x;\r\n")
+
+        self.assertEqual(index.slice(1, 1), "x = 1;")
+        self.assertEqual(index.slice(2, 2), "return x;")
+        self.assertEqual(index.slice(1, 2), "x = 1;\nreturn x;")
+
+    def test_empty_program(self):
+        index = LineIndex("")
+
+        self.assertEqual(len(index), 1)
+        self.assertEqual(index.slice(1, 1), "")
+
+
+class SourceSliceTestCase(unittest.TestCase):
+    def test_equals_its_text(self):
+        source_slice = LineIndex("x = 1;\nreturn x;").slice(2, 2)
+
+        self.assertEqual(source_slice, "return x;")
+        self.assertEqual("return x;", source_slice)
+        self.assertNotEqual(source_slice, "x = 1;")
+        self.assertEqual(source_slice, SourceSlice("return x;", 0, 9))
+
+    def test_hashes_like_its_text(self):
+        source_slice = LineIndex("x = 1;\nreturn x;").slice(2, 2)
+
+        self.assertEqual(hash(source_slice), hash("return x;"))
+        self.assertEqual({"return x;": 1}[source_slice], 1)
+        self.assertEqual(len({source_slice, "return x;"}), 1)
+
+    def test_builds_its_text_once(self):
+        source_slice = LineIndex("x = 1;\r\nreturn x;").slice(1, 2)
+
+        self.assertIs(str(source_slice), str(source_slice))
+        self.assertIs(source_slice.text, str(source_slice))
+
+    def test_pickles_without_its_text(self):
+        source_slice = LineIndex("x = 1;\nreturn x;").slice(2, 2)
+        self.assertEqual(source_slice, "return x;")
+
+        self.assertNotIn("text", source_slice.__getstate__())
+        self.assertEqual(pickle.loads(pickle.dumps(source_slice)), "return x;")